@@ -311,7 +311,11 @@ class InvokeContext:
     def lambda_runtime(self) -> LambdaRuntime:
         if not self._lambda_runtimes:
             layer_downloader = LayerDownloader(self._layer_cache_basedir, self.get_cwd(), self._stacks)
-            image_builder = LambdaImage(layer_downloader, self._skip_pull_image, self._force_image_build)
+            # Share the container manager's Docker client, so image builds reuse its pooled daemon connections
+            docker_client = self._container_manager.docker_client if self._container_manager else None
+            image_builder = LambdaImage(
+                layer_downloader, self._skip_pull_image, self._force_image_build, docker_client=docker_client
+            )
             self._lambda_runtimes = {
                 ContainersMode.WARM: WarmLambdaRuntime(self._container_manager, image_builder),
                 ContainersMode.COLD: LambdaRuntime(self._container_manager, image_builder),
@@ -170,6 +170,9 @@ def convert_files_to_unix_line_endings(path: str, target_files: Optional[List[st
 def convert_to_unix_line_ending(file_path: str) -> None:
     with open(file_path, "rb") as file:
         content = file.read()
+    # Files which already use unix line endings are left untouched
+    if b"\r\n" not in content:
+        return
     content = content.replace(b"\r\n", b"\n")
     with open(file_path, "wb") as file:
         file.write(content)
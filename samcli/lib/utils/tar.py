@@ -2,10 +2,26 @@
 Tarball Archive utility
 """
 
+import logging
+import os
+import platform
+import signal
+import subprocess
 import tarfile
+import threading
+from functools import lru_cache, partial
 from tempfile import TemporaryFile
 from contextlib import contextmanager
 
+LOG = logging.getLogger(__name__)
+
+# Streams are read and written in large chunks so that the many small writes of tarfile are coalesced and every chunk
+# sent to the Docker daemon carries a meaningful amount of data
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Contexts larger than this are archived with the native tar executable, which is much faster than tarfile on big trees
+NATIVE_TAR_THRESHOLD = 50 * 1024 * 1024
+
 
 @contextmanager
 def create_tarball(tar_paths, tar_filter=None):
@@ -36,3 +52,172 @@ def create_tarball(tar_paths, tar_filter=None):
         yield tarballfile
     finally:
         tarballfile.close()
+
+
+@contextmanager
+def stream_tarball(tar_paths, tar_filter=None):
+    """
+    Context Manager that streams the tarball of the Docker Context to use for building the image. The tarball is
+    written into a pipe by a background thread while it is being read, so it is never fully materialized.
+
+    Parameters
+    ----------
+    tar_paths dict(str, str)
+        Key representing a full path to the file or directory and the Value representing the path within the tarball
+
+    Yields
+    ------
+    Iterator(bytes)
+        Chunks of the tarball, in order
+    """
+    # The native tar cannot apply a filter, so it is only used when the tarball can be created as is
+    tar_executable = _gnu_tar_executable() if tar_filter is None else None
+    if tar_executable and _exceeds_size(tar_paths.keys(), NATIVE_TAR_THRESHOLD):
+        with _stream_native_tarball(tar_executable, tar_paths) as chunks:
+            yield chunks
+        return
+
+    read_fd, write_fd = os.pipe()
+    errors = []
+
+    def write_tarball():
+        try:
+            with os.fdopen(write_fd, "wb", buffering=STREAM_CHUNK_SIZE) as pipe_writer:
+                with tarfile.open(fileobj=pipe_writer, mode="w|") as archive:
+                    for path_on_system, path_in_tarball in tar_paths.items():
+                        archive.add(path_on_system, arcname=path_in_tarball, filter=tar_filter)
+        except BrokenPipeError:
+            # The consumer stopped reading, there is nobody left to write the rest of the tarball for
+            pass
+        except Exception as ex:  # pylint: disable=broad-except
+            errors.append(ex)
+
+    writer = threading.Thread(target=write_tarball, daemon=True)
+    writer.start()
+
+    pipe_reader = os.fdopen(read_fd, "rb", buffering=STREAM_CHUNK_SIZE)
+
+    def read_chunks():
+        yield from iter(partial(pipe_reader.read, STREAM_CHUNK_SIZE), b"")
+        # The writer closes the pipe whether it succeeded or not. Raise its error here instead of ending the stream,
+        # otherwise the consumer would take the truncated tarball for a complete one
+        writer.join()
+        if errors:
+            raise errors.pop()
+
+    try:
+        yield read_chunks()
+    finally:
+        # Closing the reading end unblocks the writer if the consumer stopped before reaching the end of the tarball
+        pipe_reader.close()
+        writer.join()
+
+    if errors:
+        raise errors.pop()
+
+
+@contextmanager
+def _stream_native_tarball(tar_executable, tar_paths):
+    """
+    Streams the tarball created by the GNU tar executable. Every path is archived relative to the filesystem root,
+    which keeps them unique, and renamed to its path within the tarball with an anchored transform expression.
+
+    Parameters
+    ----------
+    tar_executable str
+        GNU tar executable to run
+    tar_paths dict(str, str)
+        Key representing a full path to the file or directory and the Value representing the path within the tarball
+
+    Yields
+    ------
+    Iterator(bytes)
+        Chunks of the tarball, in order
+    """
+    command = [tar_executable, "-c", "-f", "-", "-C", os.sep]
+    members = []
+    for path_on_system, path_in_tarball in tar_paths.items():
+        member = os.path.relpath(os.path.abspath(str(path_on_system)), os.sep)
+        members.append(member)
+        # The S flag leaves symbolic link targets untouched, like tarfile does
+        command.append(
+            "--transform=s,^{}\\(/\\|$\\),{}\\1,S".format(
+                _escape_transform_regex(member), _escape_transform_replacement(str(path_in_tarball).lstrip("/"))
+            )
+        )
+    command.append("--")
+    command.extend(members)
+
+    LOG.debug("Creating tarball with %s", tar_executable)
+    with TemporaryFile() as stderr:
+        process = subprocess.Popen(command, bufsize=STREAM_CHUNK_SIZE, stdout=subprocess.PIPE, stderr=stderr)
+        reported = []
+
+        def check_returncode():
+            # tar is killed by SIGPIPE when the consumer stopped reading, which is not a failure of creating the tarball
+            if not reported and process.returncode not in (0, -signal.SIGPIPE):
+                reported.append(process.returncode)
+                stderr.seek(0)
+                raise subprocess.CalledProcessError(process.returncode, command, stderr=stderr.read())
+
+        def read_chunks():
+            yield from iter(partial(process.stdout.read, STREAM_CHUNK_SIZE), b"")
+            # Fail instead of ending the stream when tar exited with an error, since its output is then incomplete
+            process.wait()
+            check_returncode()
+
+        try:
+            yield read_chunks()
+        finally:
+            process.stdout.close()
+            process.wait()
+
+        check_returncode()
+
+
+@lru_cache(maxsize=1)
+def _gnu_tar_executable():
+    """
+    Returns the tar executable if it is GNU tar, which is required for the transform expressions. Windows always uses
+    tarfile since the permissions of the files need to be set explicitly there.
+    """
+    if platform.system().lower() == "windows":
+        return None
+
+    try:
+        version = subprocess.run(["tar", "--version"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False)
+    except OSError as ex:
+        LOG.debug("Unable to find tar executable", exc_info=ex)
+        return None
+
+    return "tar" if b"GNU tar" in version.stdout else None
+
+
+def _exceeds_size(paths, threshold):
+    """
+    Checks whether the total size of the files under the given paths exceeds the threshold, stopping as soon as it does
+    """
+    total_size = 0
+    for path in paths:
+        path = str(path)
+        if not os.path.isdir(path):
+            total_size += os.path.getsize(path)
+        else:
+            for dirpath, _, filenames in os.walk(path):
+                for filename in filenames:
+                    file_path = os.path.join(dirpath, filename)
+                    if not os.path.islink(file_path):
+                        total_size += os.path.getsize(file_path)
+                if total_size > threshold:
+                    return True
+        if total_size > threshold:
+            return True
+    return False
+
+
+def _escape_transform_regex(text):
+    return "".join("\\" + char if char in "\\.[]*^$," else char for char in text)
+
+
+def _escape_transform_replacement(text):
+    return "".join("\\" + char if char in "\\&," else char for char in text)
@@ -1,21 +1,30 @@
 """
 Generates a Docker Image to be used for invoking a function locally
 """
+import os
 import uuid
 import logging
 import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 
+import subprocess
 import sys
+import tarfile
+import time
 import platform
 import docker
 
 from samcli.commands.local.cli_common.user_exceptions import ImageBuildException
 from samcli.commands.local.lib.exceptions import InvalidIntermediateImageError
+from samcli.lib.utils.hash import dir_checksum, file_checksum
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 from samcli.lib.utils.stream_writer import StreamWriter
-from samcli.lib.utils.tar import create_tarball
+from samcli.lib.utils.tar import stream_tarball
 from samcli import __version__ as version
 
 
@@ -49,14 +58,23 @@ class Runtime(Enum):
         :param string value: Value to check
         :return bool: True, if enum has the value
         """
-        return any(value == item.value for item in cls)
+        return value in _RUNTIME_VALUES
+
+
+# Built once so has_value is a set lookup instead of a scan over every member
+_RUNTIME_VALUES = frozenset(runtime.value for runtime in Runtime)
 
 
 class LambdaImage:
     _LAYERS_DIR = "/opt"
+    _LAYERS_CONTEXT_DIR = "layers"
     _INVOKE_REPO_PREFIX = "amazon/aws-sam-cli-emulation-image"
     _SAM_CLI_REPO_NAME = "samcli/lambda"
     _RAPID_SOURCE_PATH = Path(__file__).parent.joinpath("..", "rapid").resolve()
+    _FINGERPRINT_LABEL = "samcli.build.fingerprint"
+    _MAX_CHECKSUM_WORKERS = 8
+    _PROGRESS_FLUSH_EVENTS = 32
+    _PROGRESS_FLUSH_INTERVAL = 0.25
 
     def __init__(self, layer_downloader, skip_pull_image, force_image_build, docker_client=None):
         """
@@ -102,7 +120,7 @@ class LambdaImage:
         if packagetype == IMAGE:
             image_name = image
         elif packagetype == ZIP:
-            image_name = f"{self._INVOKE_REPO_PREFIX}-{runtime}:latest"
+            image_name = self._get_emulation_image_name(runtime)
 
         if not image_name:
             raise InvalidIntermediateImageError(f"Invalid PackageType, PackageType needs to be one of [{ZIP}, {IMAGE}]")
@@ -110,10 +128,7 @@ class LambdaImage:
         if image:
             self.skip_pull_image = True
 
-        # Default image tag to be the base image with a tag of 'rapid' instead of latest.
-        # If the image name had a digest, removing the @ so that a valid image name can be constructed
-        # to use for the local invoke image name.
-        image_tag = f"{image_name.split(':')[0].replace('@', '')}:rapid-{version}"
+        image_tag = self._get_rapid_image_tag(image_name)
 
         downloaded_layers = []
 
@@ -123,28 +138,58 @@ class LambdaImage:
             docker_image_version = self._generate_docker_image_version(downloaded_layers, runtime)
             image_tag = f"{self._SAM_CLI_REPO_NAME}:{docker_image_version}"
 
-        image_not_found = False
+        existing_image = None
 
         # If we are not using layers, build anyways to ensure any updates to rapid get added
         try:
-            self.docker_client.images.get(image_tag)
+            existing_image = self.docker_client.images.get(image_tag)
         except docker.errors.ImageNotFound:
             LOG.info("Image was not found.")
-            image_not_found = True
 
         if (
             self.force_image_build
-            or image_not_found
-            or any(layer.is_defined_within_template for layer in downloaded_layers)
+            or not existing_image
+            or any(map(attrgetter("is_defined_within_template"), downloaded_layers))
             or not runtime
         ):
+            base_image = image if image else image_name
+            fingerprint = self._generate_image_fingerprint(base_image, downloaded_layers)
+
+            if (
+                not self.force_image_build
+                and existing_image
+                and fingerprint
+                and existing_image.labels.get(self._FINGERPRINT_LABEL) == fingerprint
+            ):
+                LOG.debug("Image %s is up to date with its inputs, skipping build", image_tag)
+                return image_tag
+
             stream_writer = stream or StreamWriter(sys.stderr)
             stream_writer.write("Building image...")
             stream_writer.flush()
-            self._build_image(image if image else image_name, image_tag, downloaded_layers, stream=stream_writer)
+            self._build_image(base_image, image_tag, downloaded_layers, stream=stream_writer, fingerprint=fingerprint)
 
         return image_tag
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_emulation_image_name(runtime):
+        """
+        Returns the name of the emulation image of the given runtime. The names only depend on their inputs, so they are
+        cached for functions that are invoked repeatedly.
+        """
+        return f"{LambdaImage._INVOKE_REPO_PREFIX}-{runtime}:latest"
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_rapid_image_tag(image_name):
+        """
+        Returns the default image tag for the given base image: the base image with a tag of 'rapid' instead of latest.
+        If the image name had a digest, removing the @ so that a valid image name can be constructed to use for the
+        local invoke image name.
+        """
+        return f"{image_name.split(':')[0].replace('@', '')}:rapid-{version}"
+
     def get_config(self, image_tag):
         config = {}
         try:
@@ -153,6 +198,60 @@ class LambdaImage:
         except docker.errors.ImageNotFound:
             return config
 
+    def _generate_image_fingerprint(self, base_image, layers):
+        """
+        Generate a fingerprint of all the inputs that go into building the image: the base image, the Dockerfile,
+        the rapid source and the contents of each layer. If the fingerprint matches the one recorded on an
+        existing image, the image does not need to be rebuilt.
+
+        Parameters
+        ----------
+        base_image str
+            Base Image to use for the new image
+        layers list(samcli.commands.local.lib.provider.Layer)
+            List of Layers to be use to mount in the image
+
+        Returns
+        -------
+        str
+            Fingerprint of the image inputs, or None if the base image is not available locally
+        """
+        try:
+            base_image_id = self.docker_client.images.get(base_image).id
+        except docker.errors.ImageNotFound:
+            return None
+
+        fingerprint = hashlib.blake2b()
+        fingerprint.update(str(base_image_id).encode("utf-8"))
+        fingerprint.update(self._generate_dockerfile(base_image, layers).encode("utf-8"))
+        fingerprint.update(dir_checksum(str(self._RAPID_SOURCE_PATH)).encode("utf-8"))
+
+        if layers:
+            # Layers are independent of each other, so hash them concurrently to overlap their I/O
+            with ThreadPoolExecutor(max_workers=min(self._MAX_CHECKSUM_WORKERS, len(layers))) as executor:
+                for layer_checksum in executor.map(self._checksum_layer, layers):
+                    fingerprint.update(layer_checksum.encode("utf-8"))
+
+        return fingerprint.hexdigest()
+
+    @staticmethod
+    def _checksum_layer(layer):
+        """
+        Calculate the checksum of the contents of a layer
+
+        Parameters
+        ----------
+        layer samcli.commands.local.lib.provider.Layer
+            Layer to calculate the checksum for
+
+        Returns
+        -------
+        str
+            Checksum of the layer contents
+        """
+        codeuri = str(layer.codeuri)
+        return dir_checksum(codeuri) if os.path.isdir(codeuri) else file_checksum(codeuri)
+
     @staticmethod
     def _generate_docker_image_version(layers, runtime):
         """
@@ -181,7 +280,7 @@ class LambdaImage:
             runtime + "-" + hashlib.sha256("-".join([layer.name for layer in layers]).encode("utf-8")).hexdigest()[0:25]
         )
 
-    def _build_image(self, base_image, docker_tag, layers, stream=None):
+    def _build_image(self, base_image, docker_tag, layers, stream=None, fingerprint=None):
         """
         Builds the image
 
@@ -193,6 +292,8 @@ class LambdaImage:
             Docker tag (REPOSITORY:TAG) to use when building the image
         layers list(samcli.commands.local.lib.provider.Layer)
             List of Layers to be use to mount in the image
+        fingerprint str
+            Optional fingerprint of the image inputs to record as a label on the image
 
         Raises
         ------
@@ -200,21 +301,29 @@ class LambdaImage:
             When docker fails to build the image
         """
         dockerfile_content = self._generate_dockerfile(base_image, layers)
+        if fingerprint:
+            dockerfile_content = dockerfile_content + f"LABEL {self._FINGERPRINT_LABEL}={fingerprint}\n"
 
-        # Create dockerfile in the same directory of the layer cache
+        # Create dockerfile in the same directory of the layer cache. Every build writes its own file, so builds
+        # running at the same time never read or remove a Dockerfile another build is still using
         dockerfile_name = "dockerfile_" + str(uuid.uuid4())
         full_dockerfile_path = Path(self.layer_downloader.layer_cache, dockerfile_name)
         stream_writer = stream or StreamWriter(sys.stderr)
 
         try:
-            with open(str(full_dockerfile_path), "w") as dockerfile:
-                dockerfile.write(dockerfile_content)
+            full_dockerfile_path.write_text(dockerfile_content)
 
             # add dockerfile and rapid source paths
-            tar_paths = {str(full_dockerfile_path): "Dockerfile", self._RAPID_SOURCE_PATH: "/aws-lambda-rie"}
+            tar_paths = OrderedDict(
+                [(full_dockerfile_path, "Dockerfile"), (self._RAPID_SOURCE_PATH, "/aws-lambda-rie")]
+            )
 
+            # Layers are merged into the same directory, so they are archived in layer order and files of a later
+            # layer overwrite those of an earlier one when the context is extracted, the same way they do when they
+            # are extracted into /opt on Lambda. A layer listed again moves to its last position.
             for layer in layers:
-                tar_paths[layer.codeuri] = "/" + layer.name
+                tar_paths[layer.codeuri] = "/" + self._LAYERS_CONTEXT_DIR
+                tar_paths.move_to_end(layer.codeuri)
 
             # Set permission for all the files in the tarball to 500(Read and Execute Only)
             # This is need for systems without unix like permission bits(Windows) while creating a unix image
@@ -226,22 +335,45 @@ class LambdaImage:
             # Set only on Windows, unix systems will preserve the host permission into the tarball
             tar_filter = set_item_permission if platform.system().lower() == "windows" else None
 
-            with create_tarball(tar_paths, tar_filter=tar_filter) as tarballfile:
-                try:
+            # Stream the context to the daemon while it is being archived instead of writing it out first
+            try:
+                with stream_tarball(tar_paths, tar_filter=tar_filter) as tarball_stream:
+                    # Seed the build cache from the base image and any previous build of this tag, so unchanged
+                    # steps are reused even when the daemon's dangling intermediate images have been pruned
                     resp_stream = self.docker_client.api.build(
-                        fileobj=tarballfile, custom_context=True, rm=True, tag=docker_tag, pull=not self.skip_pull_image
+                        fileobj=tarball_stream,
+                        custom_context=True,
+                        rm=True,
+                        tag=docker_tag,
+                        pull=not self.skip_pull_image,
+                        cache_from=[base_image, docker_tag],
                     )
-                    for _ in resp_stream:
+                    # Flushing after every event costs a syscall each, so only flush periodically
+                    last_flush = time.monotonic()
+                    for count, _ in enumerate(resp_stream, start=1):
                         stream_writer.write(".")
-                        stream_writer.flush()
-                    stream_writer.write("\n")
-                except (docker.errors.BuildError, docker.errors.APIError) as ex:
+                        if (
+                            not count % self._PROGRESS_FLUSH_EVENTS
+                            or time.monotonic() - last_flush > self._PROGRESS_FLUSH_INTERVAL
+                        ):
+                            stream_writer.flush()
+                            last_flush = time.monotonic()
                     stream_writer.write("\n")
-                    LOG.exception("Failed to build Docker Image")
-                    raise ImageBuildException("Building Image failed.") from ex
+                    stream_writer.flush()
+            except (docker.errors.BuildError, docker.errors.APIError) as ex:
+                stream_writer.write("\n")
+                LOG.exception("Failed to build Docker Image")
+                raise ImageBuildException("Building Image failed.") from ex
+            except (OSError, tarfile.TarError, subprocess.SubprocessError) as ex:
+                # Creating the build context failed part way, the daemon must not build from the truncated context
+                stream_writer.write("\n")
+                LOG.exception("Failed to create the Docker build context")
+                raise ImageBuildException("Building Image failed, unable to create the build context.") from ex
         finally:
-            if full_dockerfile_path.exists():
+            try:
                 full_dockerfile_path.unlink()
+            except FileNotFoundError:
+                pass
 
     @staticmethod
     def _generate_dockerfile(base_image, layers):
@@ -251,13 +383,14 @@ class LambdaImage:
         A generated Dockerfile will look like the following:
         ```
         FROM amazon/aws-sam-cli-emulation-image-python3.6:latest
-
-        ADD init /var/rapid
-
-        ADD layer1 /opt
-        ADD layer2 /opt
+        ADD aws-lambda-rie /var/rapid
+        RUN chmod +x /var/rapid/aws-lambda-rie
+        COPY layers /opt
         ```
 
+        All layers are merged into a single layers directory of the build context, in order, so they are added to the
+        image with one instruction (and one image layer) instead of one per Lambda Layer.
+
         Parameters
         ----------
         base_image str
@@ -275,6 +408,8 @@ class LambdaImage:
             f"FROM {base_image}\nADD aws-lambda-rie /var/rapid\nRUN chmod +x /var/rapid/aws-lambda-rie\n"
         )
 
-        for layer in layers:
-            dockerfile_content = dockerfile_content + f"ADD {layer.name} {LambdaImage._LAYERS_DIR}\n"
+        if layers:
+            dockerfile_content = (
+                dockerfile_content + f"COPY {LambdaImage._LAYERS_CONTEXT_DIR} {LambdaImage._LAYERS_DIR}\n"
+            )
         return dockerfile_content
@@ -5,6 +5,19 @@ import uuid
 
 
 class ContextIdentity:
+    __slots__ = (
+        "api_key",
+        "user_arn",
+        "cognito_authentication_type",
+        "caller",
+        "user_agent",
+        "user",
+        "cognito_identity_pool_id",
+        "cognito_authentication_provider",
+        "source_ip",
+        "account_id",
+    )
+
     def __init__(
         self,
         api_key=None,
@@ -66,6 +79,23 @@ class ContextIdentity:
 
 
 class RequestContext:
+    __slots__ = (
+        "resource_id",
+        "api_id",
+        "resource_path",
+        "http_method",
+        "request_id",
+        "account_id",
+        "stage",
+        "identity",
+        "extended_request_id",
+        "path",
+        "protocol",
+        "domain_name",
+        "request_time_epoch",
+        "request_time",
+    )
+
     def __init__(
         self,
         resource_id="123456",
@@ -148,6 +178,22 @@ class RequestContext:
 
 
 class ApiGatewayLambdaEvent:
+    __slots__ = (
+        "version",
+        "http_method",
+        "body",
+        "resource",
+        "request_context",
+        "query_string_params",
+        "multi_value_query_string_params",
+        "headers",
+        "multi_value_headers",
+        "path_parameters",
+        "stage_variables",
+        "path",
+        "is_base_64_encoded",
+    )
+
     def __init__(
         self,
         http_method=None,
@@ -161,20 +161,24 @@ def unzip_from_uri(uri, layer_zip_path, unzip_output_dir, progressbar_label):
     unzip_output_dir str
         Path to unzip the zip to
     progressbar_label str
-        Label to use in the Progressbar
+        Label to use in the Progressbar, no progressbar is shown when it is None
     """
     try:
         get_request = requests.get(uri, stream=True, verify=os.environ.get("AWS_CA_BUNDLE", True))
 
         with open(layer_zip_path, "wb") as local_layer_file:
-            file_length = int(get_request.headers["Content-length"])
-
-            with progressbar(file_length, progressbar_label) as p_bar:
-                # Set the chunk size to None. Since we are streaming the request, None will allow the data to be
-                # read as it arrives in whatever size the chunks are received.
+            # Set the chunk size to None. Since we are streaming the request, None will allow the data to be
+            # read as it arrives in whatever size the chunks are received.
+            if progressbar_label is None:
                 for data in get_request.iter_content(chunk_size=None):
                     local_layer_file.write(data)
-                    p_bar.update(len(data))
+            else:
+                file_length = int(get_request.headers["Content-length"])
+
+                with progressbar(file_length, progressbar_label) as p_bar:
+                    for data in get_request.iter_content(chunk_size=None):
+                        local_layer_file.write(data)
+                        p_bar.update(len(data))
 
         # Forcefully set the permissions to 700 on files and directories. This is to ensure the owner
         # of the files is the only one that can read, write, or execute the files.
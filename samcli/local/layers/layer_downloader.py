@@ -3,6 +3,8 @@ Downloads Layers locally
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -19,6 +21,8 @@ LOG = logging.getLogger(__name__)
 
 
 class LayerDownloader:
+    _MAX_DOWNLOAD_WORKERS = 8
+
     def __init__(self, layer_cache, cwd, stacks: List[Stack], lambda_client=None):
         """
 
@@ -37,10 +41,13 @@ class LayerDownloader:
         self.cwd = cwd
         self._stacks = stacks
         self._lambda_client = lambda_client
+        self._lambda_client_lock = threading.Lock()
 
     @property
     def lambda_client(self):
-        self._lambda_client = self._lambda_client or boto3.client("lambda")
+        # Layers can be downloaded concurrently, make sure only one client gets created
+        with self._lambda_client_lock:
+            self._lambda_client = self._lambda_client or boto3.client("lambda")
         return self._lambda_client
 
     @property
@@ -60,6 +67,9 @@ class LayerDownloader:
         """
         Download a list of layers to the cache
 
+        Several layers are downloaded concurrently on up to _MAX_DOWNLOAD_WORKERS threads. Their progress bars
+        would interleave on the terminal, so in that case only a "Downloading <arn>" line is logged per layer.
+
         Parameters
         ----------
         layers list(samcli.commands.local.lib.provider.Layer)
@@ -72,13 +82,14 @@ class LayerDownloader:
         List(Path)
             List of Paths to where the layer was cached
         """
-        layer_dirs = []
-        for layer in layers:
-            layer_dirs.append(self.download(layer, force))
+        if len(layers) <= 1:
+            return [self.download(layer, force) for layer in layers]
 
-        return layer_dirs
+        # Each layer is an independent download, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=min(self._MAX_DOWNLOAD_WORKERS, len(layers))) as executor:
+            return list(executor.map(lambda layer: self.download(layer, force, show_progress=False), layers))
 
-    def download(self, layer: LayerVersion, force=False) -> LayerVersion:
+    def download(self, layer: LayerVersion, force=False, show_progress=True) -> LayerVersion:
         """
         Download a given layer to the local cache.
 
@@ -88,6 +99,8 @@ class LayerDownloader:
             Layer representing the layer to be downloaded.
         force bool
             True to download the layer even if it exists already on the system
+        show_progress bool
+            True to show a progress bar while the layer is downloaded, False to only log a line
 
         Returns
         -------
@@ -107,13 +120,16 @@ class LayerDownloader:
             LOG.info("%s is already cached. Skipping download", layer.arn)
             return layer
 
+        if not show_progress:
+            LOG.info("Downloading %s", layer.layer_arn)
+
         layer_zip_path = layer.codeuri + ".zip"
         layer_zip_uri = self._fetch_layer_uri(layer)
         unzip_from_uri(
             layer_zip_uri,
             layer_zip_path,
             unzip_output_dir=layer.codeuri,
-            progressbar_label="Downloading {}".format(layer.layer_arn),
+            progressbar_label="Downloading {}".format(layer.layer_arn) if show_progress else None,
         )
 
         return layer
@@ -8,7 +8,6 @@ import logging
 import json
 from unittest import TestCase
 
-import docker
 import jmespath
 from pathlib import Path
 
@@ -27,6 +26,7 @@ class BuildIntegBase(TestCase):
         integration_dir = Path(__file__).resolve().parents[1]
         cls.test_data_path = str(Path(integration_dir, "testdata", "buildcmd"))
         cls.template_path = str(Path(cls.test_data_path, cls.template))
+        cls._docker_client = None
 
     def setUp(self):
         # To invoke a function created by the build command, we need the built artifacts to be in a
@@ -42,6 +42,10 @@ class BuildIntegBase(TestCase):
 
         self.default_build_dir = Path(self.working_dir, ".aws-sam", "build")
         self.built_template = self.default_build_dir.joinpath("template.yaml")
+        # Where the templates' SomeRelativePath resources are expected to point to from the default build dir
+        self.some_relative_path = os.path.relpath(
+            os.path.join(self.test_data_path, "SomeRelativePath"), self.default_build_dir
+        )
 
     def tearDown(self):
         self.custom_build_dir and shutil.rmtree(self.custom_build_dir, ignore_errors=True)
@@ -73,7 +77,6 @@ class BuildIntegBase(TestCase):
         container_env_var_file=None,
         build_image=None,
     ):
-
         command_list = [self.cmd, "build"]
 
         if function_identifier:
@@ -119,19 +122,30 @@ class BuildIntegBase(TestCase):
 
         return command_list
 
+    @classmethod
+    def get_docker_client(cls):
+        if cls._docker_client is None:
+            # docker is only needed by the container builds, importing it lazily keeps test collection fast
+            import docker
+
+            cls._docker_client = docker.from_env()
+        return cls._docker_client
+
     def verify_docker_container_cleanedup(self, runtime):
         if IS_WINDOWS:
             time.sleep(1)
-        docker_client = docker.from_env()
-        samcli_containers = docker_client.containers.list(
-            all=True, filters={"ancestor": f"public.ecr.aws/sam/build-{runtime}"}
-        )
+        filters = {"ancestor": f"public.ecr.aws/sam/build-{runtime}"}
+        if os.getenv("PYTEST_XDIST_WORKER"):
+            # Other workers may be building with the same image right now, so their running containers can't be
+            # told apart from a leaked one. sam build waits for its build container to exit before removing it, so
+            # a container this build failed to remove is left as created or exited, and those are still checked
+            filters["status"] = ["created", "exited"]
+        samcli_containers = self.get_docker_client().containers.list(all=True, filters=filters)
         self.assertFalse(bool(samcli_containers), "Build containers have not been removed")
 
     def verify_pulling_only_latest_tag(self, runtime):
-        docker_client = docker.from_env()
         image_name = f"public.ecr.aws/sam/build-{runtime}"
-        images = docker_client.images.list(name=image_name)
+        images = self.get_docker_client().images.list(name=image_name)
         self.assertFalse(
             len(images) == 0,
             f"Image {image_name} was not pulled",
@@ -142,9 +156,55 @@ class BuildIntegBase(TestCase):
         )
         self.assertEqual(f"public.ecr.aws/sam/build-{runtime}:latest", images[0].tags[0])
 
+    @staticmethod
+    def _names_in_dir(directory, names):
+        """
+        Returns which of the given names are entries of the directory. The directory is scanned once and the scan stops
+        as soon as all the names are found, without building a list of all of its entries.
+        """
+        found = set()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name in names:
+                    found.add(entry.name)
+                    if len(found) == len(names):
+                        break
+        return found
+
+    def _assert_dir_contains(self, directory, names):
+        self.assertEqual(self._names_in_dir(directory, names), set(names))
+
     def _make_parameter_override_arg(self, overrides):
         return " ".join(["ParameterKey={},ParameterValue={}".format(key, value) for key, value in overrides.items()])
 
+    def _verify_built_artifact(self, build_dir, function_logical_id, expected_files):
+        self._verify_resource_artifact(build_dir, function_logical_id, expected_files)
+
+    def _verify_resource_artifact(
+        self, build_dir, resource_logical_id, expected_files, code_property_name="CodeUri", artifact_subfolder=""
+    ):
+        """
+        Verifies the build directory holds the template and the artifact folder of the resource, the built template
+        points the resource at that folder, and the folder contains the expected files
+
+        Returns
+        -------
+        Path
+            Artifact directory of the resource
+        """
+        self.assertTrue(build_dir.exists(), "Build directory should be created")
+
+        self._assert_dir_contains(build_dir, {"template.yaml", resource_logical_id})
+
+        template_path = build_dir.joinpath("template.yaml")
+        resource_artifact_dir = build_dir.joinpath(resource_logical_id, artifact_subfolder)
+
+        # Make sure the template has correct CodeUri for resource
+        self._verify_resource_property(template_path, resource_logical_id, code_property_name, resource_logical_id)
+
+        self._assert_dir_contains(resource_artifact_dir, expected_files)
+        return resource_artifact_dir
+
     def _verify_resource_property(self, template_path, logical_id, property, expected_value):
 
         with open(template_path, "r") as fp:
@@ -162,21 +222,20 @@ class BuildIntegBase(TestCase):
             "invoke",
             function_logical_id,
             "-t",
-            str(template_path),
+            os.fspath(template_path),
             "--no-event",
             "--parameter-overrides",
             overrides,
         ]
 
         process_execute = run_command(cmdlist)
-        process_execute.process.wait()
 
         process_stdout = process_execute.stdout.decode("utf-8")
         self.assertEqual(json.loads(process_stdout), expected_result)
 
 
 class BuildIntegRubyBase(BuildIntegBase):
-    EXPECTED_FILES_PROJECT_MANIFEST = {"app.rb"}
+    EXPECTED_FILES_PROJECT_MANIFEST = frozenset({"app.rb"})
     EXPECTED_RUBY_GEM = "aws-record"
 
     FUNCTION_LOGICAL_ID = "Function"
@@ -196,24 +255,19 @@ class BuildIntegRubyBase(BuildIntegBase):
             self.EXPECTED_RUBY_GEM,
         )
 
+        some_relative_path = os.path.relpath(os.path.join(relative_path, "SomeRelativePath"), self.default_build_dir)
         self._verify_resource_property(
-            str(self.built_template),
+            self.built_template,
             "OtherRelativePathResource",
             "BodyS3Location",
-            os.path.relpath(
-                os.path.normpath(os.path.join(str(relative_path), "SomeRelativePath")),
-                str(self.default_build_dir),
-            ),
+            some_relative_path,
         )
 
         self._verify_resource_property(
-            str(self.built_template),
+            self.built_template,
             "GlueResource",
             "Command.ScriptLocation",
-            os.path.relpath(
-                os.path.normpath(os.path.join(str(relative_path), "SomeRelativePath")),
-                str(self.default_build_dir),
-            ),
+            some_relative_path,
         )
 
         if use_container:
@@ -221,41 +275,33 @@ class BuildIntegRubyBase(BuildIntegBase):
             self.verify_pulling_only_latest_tag(runtime)
 
     def _verify_built_artifact(self, build_dir, function_logical_id, expected_files, expected_modules):
-        self.assertTrue(build_dir.exists(), "Build directory should be created")
+        resource_artifact_dir = self._verify_resource_artifact(build_dir, function_logical_id, expected_files)
 
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
-        self.assertIn(function_logical_id, build_dir_files)
-
-        template_path = build_dir.joinpath("template.yaml")
-        resource_artifact_dir = build_dir.joinpath(function_logical_id)
-
-        # Make sure the template has correct CodeUri for resource
-        self._verify_resource_property(str(template_path), function_logical_id, "CodeUri", function_logical_id)
-
-        all_artifacts = set(os.listdir(str(resource_artifact_dir)))
-        actual_files = all_artifacts.intersection(expected_files)
-        self.assertEqual(actual_files, expected_files)
-
-        ruby_version = None
-        ruby_bundled_path = None
-
-        # Walk through ruby version to get to the gem path
-        for dirpath, dirname, _ in os.walk(str(resource_artifact_dir.joinpath("vendor", "bundle", "ruby"))):
-            ruby_version = dirname
-            ruby_bundled_path = Path(dirpath)
-            break
+        # The ruby version directory leads to the gem path
+        ruby_bundled_path = resource_artifact_dir.joinpath("vendor", "bundle", "ruby")
+        ruby_version = self._first_subdir(ruby_bundled_path)
 
         # If Gemfile is in root folder, vendor folder will also be created there
         if ruby_version is None:
-            for dirpath, dirname, _ in os.walk(str(Path(self.working_dir).joinpath("vendor", "bundle", "ruby"))):
-                ruby_version = dirname
-                ruby_bundled_path = Path(dirpath)
-                break
+            ruby_bundled_path = Path(self.working_dir).joinpath("vendor", "bundle", "ruby")
+            ruby_version = self._first_subdir(ruby_bundled_path)
+
+        gem_path = ruby_bundled_path.joinpath(ruby_version, "gems")
 
-        gem_path = ruby_bundled_path.joinpath(ruby_version[0], "gems")
+        with os.scandir(gem_path) as gems:
+            # Gem directories are named after the gem followed by its version
+            self.assertTrue(any(gem.name.startswith(self.EXPECTED_RUBY_GEM) for gem in gems))
 
-        self.assertTrue(any([True if self.EXPECTED_RUBY_GEM in gem else False for gem in os.listdir(str(gem_path))]))
+    @staticmethod
+    def _first_subdir(directory):
+        """
+        Returns the name of the first sub directory of the given directory, or None if there is none
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return next((entry.name for entry in entries if entry.is_dir()), None)
+        except FileNotFoundError:
+            return None
 
 
 class DedupBuildIntegBase(BuildIntegBase):
@@ -270,9 +316,7 @@ class DedupBuildIntegBase(BuildIntegBase):
     def _verify_build_artifact(self, build_dir, function_logical_id):
         self.assertTrue(build_dir.exists(), "Build directory should be created")
 
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
-        self.assertIn(function_logical_id, build_dir_files)
+        self._assert_dir_contains(build_dir, {"template.yaml", function_logical_id})
 
     def _verify_process_code_and_output(self, command_result):
         self.assertEqual(command_result.process.returncode, 0)
@@ -300,8 +344,7 @@ class NestedBuildIntegBase(BuildIntegBase):
     def _verify_build_artifact(self, build_dir, function_full_path):
         self.assertTrue(build_dir.exists(), "Build directory should be created")
 
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
+        self._assert_dir_contains(build_dir, {"template.yaml"})
         # full_path is always posix path
         path_components = posixpath.split(function_full_path)
         artifact_path = Path(build_dir, *path_components)
@@ -314,10 +357,11 @@ class NestedBuildIntegBase(BuildIntegBase):
 
     def _verify_process_code_and_output(self, command_result, function_full_paths):
         self.assertEqual(command_result.process.returncode, 0)
+        process_stderr = command_result.stderr.decode("utf-8")
         # check HelloWorld and HelloMars functions are built in the same build
         for function_full_path in function_full_paths:
             self.assertRegex(
-                command_result.stderr.decode("utf-8"),
+                process_stderr,
                 f"Building codeuri: .* runtime: .* metadata: .* functions: \\[.*'{function_full_path}'.*\\]",
             )
 
@@ -345,8 +389,7 @@ class IntrinsicIntegBase(BuildIntegBase):
     def _verify_build_artifact(self, build_dir, function_full_path):
         self.assertTrue(build_dir.exists(), "Build directory should be created")
 
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
+        self._assert_dir_contains(build_dir, {"template.yaml"})
         # full_path is always posix path
         path_components = posixpath.split(function_full_path)
         artifact_path = Path(build_dir, *path_components)
@@ -359,16 +402,14 @@ class IntrinsicIntegBase(BuildIntegBase):
 
     def _verify_process_code_and_output(self, command_result, function_full_paths, layer_full_path):
         self.assertEqual(command_result.process.returncode, 0)
+        process_stderr = command_result.stderr.decode("utf-8")
         # check HelloWorld and HelloMars functions are built in the same build
         for function_full_path in function_full_paths:
             self.assertRegex(
-                command_result.stderr.decode("utf-8"),
+                process_stderr,
                 f"Building codeuri: .* runtime: .* metadata: .* functions: \\[.*'{function_full_path}'.*\\]",
             )
-        self.assertIn(
-            f"Building layer '{layer_full_path}'",
-            command_result.stderr.decode("utf-8"),
-        )
+        self.assertIn(f"Building layer '{layer_full_path}'", process_stderr)
 
     def _verify_invoke_built_functions(self, template_path, functions, error_message):
         """
@@ -383,12 +424,11 @@ class IntrinsicIntegBase(BuildIntegBase):
                 "invoke",
                 function_logical_id,
                 "-t",
-                str(template_path),
+                os.fspath(template_path),
                 "--no-event",
             ]
 
             process_execute = run_command(cmdlist)
-            process_execute.process.wait()
 
             process_stderr = process_execute.stderr.decode("utf-8")
             if error_message:
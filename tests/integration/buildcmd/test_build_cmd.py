@@ -1,5 +1,6 @@
 import re
 import shutil
+import tempfile
 import sys
 import os
 import logging
@@ -41,13 +42,15 @@ TIMEOUT = 420  # 7 mins
 class TestBuildCommand_PythonFunctions_Images(BuildIntegBase):
     template = "template_image.yaml"
 
-    EXPECTED_FILES_PROJECT_MANIFEST = {
-        "__init__.py",
-        "main.py",
-        "numpy",
-        # 'cryptography',
-        "requirements.txt",
-    }
+    EXPECTED_FILES_PROJECT_MANIFEST = frozenset(
+        {
+            "__init__.py",
+            "main.py",
+            "numpy",
+            # 'cryptography',
+            "requirements.txt",
+        }
+    )
 
     FUNCTION_LOGICAL_ID_IMAGE = "ImageFunction"
 
@@ -77,13 +80,15 @@ class TestBuildCommand_PythonFunctions_Images(BuildIntegBase):
     "Skip build tests on windows when running in CI unless overridden",
 )
 class TestBuildCommand_PythonFunctions(BuildIntegBase):
-    EXPECTED_FILES_PROJECT_MANIFEST = {
-        "__init__.py",
-        "main.py",
-        "numpy",
-        # 'cryptography',
-        "requirements.txt",
-    }
+    EXPECTED_FILES_PROJECT_MANIFEST = frozenset(
+        {
+            "__init__.py",
+            "main.py",
+            "numpy",
+            # 'cryptography',
+            "requirements.txt",
+        }
+    )
 
     FUNCTION_LOGICAL_ID = "Function"
 
@@ -115,27 +120,21 @@ class TestBuildCommand_PythonFunctions(BuildIntegBase):
         )
 
         self._verify_resource_property(
-            str(self.built_template),
+            self.built_template,
             "OtherRelativePathResource",
             "BodyS3Location",
-            os.path.relpath(
-                os.path.normpath(os.path.join(str(self.test_data_path), "SomeRelativePath")),
-                str(self.default_build_dir),
-            ),
+            self.some_relative_path,
         )
 
         self._verify_resource_property(
-            str(self.built_template),
+            self.built_template,
             "GlueResource",
             "Command.ScriptLocation",
-            os.path.relpath(
-                os.path.normpath(os.path.join(str(self.test_data_path), "SomeRelativePath")),
-                str(self.default_build_dir),
-            ),
+            self.some_relative_path,
         )
 
         self._verify_resource_property(
-            str(self.built_template),
+            self.built_template,
             "ExampleNestedStack",
             "TemplateURL",
             "https://s3.amazonaws.com/examplebucket/exampletemplate.yml",
@@ -150,23 +149,6 @@ class TestBuildCommand_PythonFunctions(BuildIntegBase):
             self.verify_docker_container_cleanedup(runtime)
             self.verify_pulling_only_latest_tag(runtime)
 
-    def _verify_built_artifact(self, build_dir, function_logical_id, expected_files):
-        self.assertTrue(build_dir.exists(), "Build directory should be created")
-
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
-        self.assertIn(function_logical_id, build_dir_files)
-
-        template_path = build_dir.joinpath("template.yaml")
-        resource_artifact_dir = build_dir.joinpath(function_logical_id)
-
-        # Make sure the template has correct CodeUri for resource
-        self._verify_resource_property(str(template_path), function_logical_id, "CodeUri", function_logical_id)
-
-        all_artifacts = set(os.listdir(str(resource_artifact_dir)))
-        actual_files = all_artifacts.intersection(expected_files)
-        self.assertEqual(actual_files, expected_files)
-
     def _get_python_version(self):
         return "python{}.{}".format(sys.version_info.major, sys.version_info.minor)
 
@@ -186,7 +168,7 @@ class TestBuildCommand_ErrorCases(BuildIntegBase):
         process_execute = run_command(cmdlist, cwd=self.working_dir)
         self.assertEqual(1, process_execute.process.returncode)
 
-        self.assertIn("Build Failed", str(process_execute.stdout))
+        self.assertIn(b"Build Failed", process_execute.stdout)
 
 
 @skipIf(
@@ -194,8 +176,8 @@ class TestBuildCommand_ErrorCases(BuildIntegBase):
     "Skip build tests on windows when running in CI unless overridden",
 )
 class TestBuildCommand_NodeFunctions(BuildIntegBase):
-    EXPECTED_FILES_PROJECT_MANIFEST = {"node_modules", "main.js"}
-    EXPECTED_NODE_MODULES = {"minimal-request-promise"}
+    EXPECTED_FILES_PROJECT_MANIFEST = frozenset({"node_modules", "main.js"})
+    EXPECTED_NODE_MODULES = frozenset({"minimal-request-promise"})
 
     FUNCTION_LOGICAL_ID = "Function"
 
@@ -228,23 +210,17 @@ class TestBuildCommand_NodeFunctions(BuildIntegBase):
         )
 
         self._verify_resource_property(
-            str(self.built_template),
+            self.built_template,
             "OtherRelativePathResource",
             "BodyS3Location",
-            os.path.relpath(
-                os.path.normpath(os.path.join(str(self.test_data_path), "SomeRelativePath")),
-                str(self.default_build_dir),
-            ),
+            self.some_relative_path,
         )
 
         self._verify_resource_property(
-            str(self.built_template),
+            self.built_template,
             "GlueResource",
             "Command.ScriptLocation",
-            os.path.relpath(
-                os.path.normpath(os.path.join(str(self.test_data_path), "SomeRelativePath")),
-                str(self.default_build_dir),
-            ),
+            self.some_relative_path,
         )
 
         if use_container:
@@ -252,25 +228,9 @@ class TestBuildCommand_NodeFunctions(BuildIntegBase):
             self.verify_pulling_only_latest_tag(runtime)
 
     def _verify_built_artifact(self, build_dir, function_logical_id, expected_files, expected_modules):
-        self.assertTrue(build_dir.exists(), "Build directory should be created")
-
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
-        self.assertIn(function_logical_id, build_dir_files)
-
-        template_path = build_dir.joinpath("template.yaml")
-        resource_artifact_dir = build_dir.joinpath(function_logical_id)
-
-        # Make sure the template has correct CodeUri for resource
-        self._verify_resource_property(str(template_path), function_logical_id, "CodeUri", function_logical_id)
+        resource_artifact_dir = self._verify_resource_artifact(build_dir, function_logical_id, expected_files)
 
-        all_artifacts = set(os.listdir(str(resource_artifact_dir)))
-        actual_files = all_artifacts.intersection(expected_files)
-        self.assertEqual(actual_files, expected_files)
-
-        all_modules = set(os.listdir(str(resource_artifact_dir.joinpath("node_modules"))))
-        actual_files = all_modules.intersection(expected_modules)
-        self.assertEqual(actual_files, expected_modules)
+        self._assert_dir_contains(resource_artifact_dir.joinpath("node_modules"), expected_modules)
 
 
 @skipIf(
@@ -300,13 +260,25 @@ class TestBuildCommand_RubyFunctionsWithGemfileInTheRoot(BuildIntegRubyBase):
     This doesn't apply to containerized build, since it copies only the function folder to the container
     """
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.application_dir = tempfile.mkdtemp()
+        cls._create_application_environment(cls.application_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.application_dir, ignore_errors=True)
+        super().tearDownClass()
+
     @parameterized.expand([("ruby2.5"), ("ruby2.7")])
     @pytest.mark.flaky(reruns=3)
     def test_building_ruby_in_process_with_root_gemfile(self, runtime):
         self._prepare_application_environment()
         self._test_with_default_gemfile(runtime, False, "RubyWithRootGemfile", self.working_dir)
 
-    def _prepare_application_environment(self):
+    @classmethod
+    def _create_application_environment(cls, application_dir):
         """
         Create an application environment where Gemfile will be in the root folder of the app;
         ├── RubyWithRootGemfile
@@ -315,14 +287,18 @@ class TestBuildCommand_RubyFunctionsWithGemfileInTheRoot(BuildIntegRubyBase):
         └── template.yaml
         """
         # copy gemfile to the root of the project
-        shutil.copyfile(Path(self.template_path).parent.joinpath("Gemfile"), Path(self.working_dir).joinpath("Gemfile"))
+        shutil.copyfile(Path(cls.template_path).parent.joinpath("Gemfile"), Path(application_dir).joinpath("Gemfile"))
         # copy function source code in its folder
         osutils.copytree(
-            Path(self.template_path).parent.joinpath("RubyWithRootGemfile"),
-            Path(self.working_dir).joinpath("RubyWithRootGemfile"),
+            Path(cls.template_path).parent.joinpath("RubyWithRootGemfile"),
+            Path(application_dir).joinpath("RubyWithRootGemfile"),
         )
         # copy template to the root folder
-        shutil.copyfile(Path(self.template_path), Path(self.working_dir).joinpath("template.yaml"))
+        shutil.copyfile(Path(cls.template_path), Path(application_dir).joinpath("template.yaml"))
+
+    def _prepare_application_environment(self):
+        # the build vendors gems next to the Gemfile, so every test works on its own copy of the application
+        osutils.copytree(self.application_dir, self.working_dir)
         # update template path with new location
         self.template_path = str(Path(self.working_dir).joinpath("template.yaml"))
 
@@ -332,9 +308,9 @@ class TestBuildCommand_RubyFunctionsWithGemfileInTheRoot(BuildIntegRubyBase):
     "Skip build tests on windows when running in CI unless overridden",
 )
 class TestBuildCommand_Java(BuildIntegBase):
-    EXPECTED_FILES_PROJECT_MANIFEST_GRADLE = {"aws", "lib", "META-INF"}
-    EXPECTED_FILES_PROJECT_MANIFEST_MAVEN = {"aws", "lib"}
-    EXPECTED_DEPENDENCIES = {"annotations-2.1.0.jar", "aws-lambda-java-core-1.1.0.jar"}
+    EXPECTED_FILES_PROJECT_MANIFEST_GRADLE = frozenset({"aws", "lib", "META-INF"})
+    EXPECTED_FILES_PROJECT_MANIFEST_MAVEN = frozenset({"aws", "lib"})
+    EXPECTED_DEPENDENCIES = frozenset({"annotations-2.1.0.jar", "aws-lambda-java-core-1.1.0.jar"})
 
     FUNCTION_LOGICAL_ID = "Function"
     USING_GRADLE_PATH = os.path.join("Java", "gradle")
@@ -415,23 +391,17 @@ class TestBuildCommand_Java(BuildIntegBase):
         )
 
         self._verify_resource_property(
-            str(self.built_template),
+            self.built_template,
             "OtherRelativePathResource",
             "BodyS3Location",
-            os.path.relpath(
-                os.path.normpath(os.path.join(str(self.test_data_path), "SomeRelativePath")),
-                str(self.default_build_dir),
-            ),
+            self.some_relative_path,
         )
 
         self._verify_resource_property(
-            str(self.built_template),
+            self.built_template,
             "GlueResource",
             "Command.ScriptLocation",
-            os.path.relpath(
-                os.path.normpath(os.path.join(str(self.test_data_path), "SomeRelativePath")),
-                str(self.default_build_dir),
-            ),
+            self.some_relative_path,
         )
 
         # If we are testing in the container, invoke the function as well. Otherwise we cannot guarantee docker is on appveyor
@@ -449,24 +419,9 @@ class TestBuildCommand_Java(BuildIntegBase):
             self.verify_pulling_only_latest_tag(runtime)
 
     def _verify_built_artifact(self, build_dir, function_logical_id, expected_files, expected_modules):
+        resource_artifact_dir = self._verify_resource_artifact(build_dir, function_logical_id, expected_files)
 
-        self.assertTrue(build_dir.exists(), "Build directory should be created")
-
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
-        self.assertIn(function_logical_id, build_dir_files)
-
-        template_path = build_dir.joinpath("template.yaml")
-        resource_artifact_dir = build_dir.joinpath(function_logical_id)
-
-        # Make sure the template has correct CodeUri for resource
-        self._verify_resource_property(str(template_path), function_logical_id, "CodeUri", function_logical_id)
-
-        all_artifacts = set(os.listdir(str(resource_artifact_dir)))
-        actual_files = all_artifacts.intersection(expected_files)
-        self.assertEqual(actual_files, expected_files)
-
-        lib_dir_contents = set(os.listdir(str(resource_artifact_dir.joinpath("lib"))))
+        lib_dir_contents = set(os.listdir(resource_artifact_dir.joinpath("lib")))
         self.assertEqual(lib_dir_contents, expected_modules)
 
 
@@ -476,16 +431,18 @@ class TestBuildCommand_Java(BuildIntegBase):
 )
 class TestBuildCommand_Dotnet_cli_package(BuildIntegBase):
     FUNCTION_LOGICAL_ID = "Function"
-    EXPECTED_FILES_PROJECT_MANIFEST = {
-        "Amazon.Lambda.APIGatewayEvents.dll",
-        "HelloWorld.pdb",
-        "Amazon.Lambda.Core.dll",
-        "HelloWorld.runtimeconfig.json",
-        "Amazon.Lambda.Serialization.Json.dll",
-        "Newtonsoft.Json.dll",
-        "HelloWorld.deps.json",
-        "HelloWorld.dll",
-    }
+    EXPECTED_FILES_PROJECT_MANIFEST = frozenset(
+        {
+            "Amazon.Lambda.APIGatewayEvents.dll",
+            "HelloWorld.pdb",
+            "Amazon.Lambda.Core.dll",
+            "HelloWorld.runtimeconfig.json",
+            "Amazon.Lambda.Serialization.Json.dll",
+            "Newtonsoft.Json.dll",
+            "HelloWorld.deps.json",
+            "HelloWorld.dll",
+        }
+    )
 
     @parameterized.expand(
         [
@@ -518,23 +475,17 @@ class TestBuildCommand_Dotnet_cli_package(BuildIntegBase):
         )
 
         self._verify_resource_property(
-            str(self.built_template),
+            self.built_template,
             "OtherRelativePathResource",
             "BodyS3Location",
-            os.path.relpath(
-                os.path.normpath(os.path.join(str(self.test_data_path), "SomeRelativePath")),
-                str(self.default_build_dir),
-            ),
+            self.some_relative_path,
         )
 
         self._verify_resource_property(
-            str(self.built_template),
+            self.built_template,
             "GlueResource",
             "Command.ScriptLocation",
-            os.path.relpath(
-                os.path.normpath(os.path.join(str(self.test_data_path), "SomeRelativePath")),
-                str(self.default_build_dir),
-            ),
+            self.some_relative_path,
         )
 
         expected = "{'message': 'Hello World'}"
@@ -562,24 +513,6 @@ class TestBuildCommand_Dotnet_cli_package(BuildIntegBase):
         # Must error out, because container builds are not supported
         self.assertEqual(process_execute.process.returncode, 1)
 
-    def _verify_built_artifact(self, build_dir, function_logical_id, expected_files):
-
-        self.assertTrue(build_dir.exists(), "Build directory should be created")
-
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
-        self.assertIn(function_logical_id, build_dir_files)
-
-        template_path = build_dir.joinpath("template.yaml")
-        resource_artifact_dir = build_dir.joinpath(function_logical_id)
-
-        # Make sure the template has correct CodeUri for resource
-        self._verify_resource_property(str(template_path), function_logical_id, "CodeUri", function_logical_id)
-
-        all_artifacts = set(os.listdir(str(resource_artifact_dir)))
-        actual_files = all_artifacts.intersection(expected_files)
-        self.assertEqual(actual_files, expected_files)
-
 
 @skipIf(
     ((IS_WINDOWS and RUNNING_ON_CI) and not CI_OVERRIDE),
@@ -587,7 +520,7 @@ class TestBuildCommand_Dotnet_cli_package(BuildIntegBase):
 )
 class TestBuildCommand_Go_Modules(BuildIntegBase):
     FUNCTION_LOGICAL_ID = "Function"
-    EXPECTED_FILES_PROJECT_MANIFEST = {"hello-world"}
+    EXPECTED_FILES_PROJECT_MANIFEST = frozenset({"hello-world"})
 
     @parameterized.expand([("go1.x", "Go", None), ("go1.x", "Go", "debug")])
     @pytest.mark.flaky(reruns=3)
@@ -605,7 +538,7 @@ class TestBuildCommand_Go_Modules(BuildIntegBase):
             newenv["SAM_BUILD_MODE"] = mode
 
         newenv["GOPROXY"] = "direct"
-        newenv["GOPATH"] = str(self.working_dir)
+        newenv["GOPATH"] = self.working_dir
 
         run_command(cmdlist, cwd=self.working_dir, env=newenv)
 
@@ -614,13 +547,10 @@ class TestBuildCommand_Go_Modules(BuildIntegBase):
         )
 
         self._verify_resource_property(
-            str(self.built_template),
+            self.built_template,
             "OtherRelativePathResource",
             "BodyS3Location",
-            os.path.relpath(
-                os.path.normpath(os.path.join(str(self.test_data_path), "SomeRelativePath")),
-                str(self.default_build_dir),
-            ),
+            self.some_relative_path,
         )
 
         expected = "{'message': 'Hello World'}"
@@ -645,23 +575,6 @@ class TestBuildCommand_Go_Modules(BuildIntegBase):
         # Must error out, because container builds are not supported
         self.assertEqual(process_execute.process.returncode, 1)
 
-    def _verify_built_artifact(self, build_dir, function_logical_id, expected_files):
-        self.assertTrue(build_dir.exists(), "Build directory should be created")
-
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
-        self.assertIn(function_logical_id, build_dir_files)
-
-        template_path = build_dir.joinpath("template.yaml")
-        resource_artifact_dir = build_dir.joinpath(function_logical_id)
-
-        # Make sure the template has correct CodeUri for resource
-        self._verify_resource_property(str(template_path), function_logical_id, "CodeUri", function_logical_id)
-
-        all_artifacts = set(os.listdir(str(resource_artifact_dir)))
-        actual_files = all_artifacts.intersection(expected_files)
-        self.assertEqual(actual_files, expected_files)
-
 
 @skipIf(
     ((IS_WINDOWS and RUNNING_ON_CI) and not CI_OVERRIDE),
@@ -670,13 +583,15 @@ class TestBuildCommand_Go_Modules(BuildIntegBase):
 class TestBuildCommand_SingleFunctionBuilds(BuildIntegBase):
     template = "many-functions-template.yaml"
 
-    EXPECTED_FILES_PROJECT_MANIFEST = {
-        "__init__.py",
-        "main.py",
-        "numpy",
-        # 'cryptography',
-        "requirements.txt",
-    }
+    EXPECTED_FILES_PROJECT_MANIFEST = frozenset(
+        {
+            "__init__.py",
+            "main.py",
+            "numpy",
+            # 'cryptography',
+            "requirements.txt",
+        }
+    )
 
     @pytest.mark.flaky(reruns=3)
     def test_function_not_found(self):
@@ -686,7 +601,7 @@ class TestBuildCommand_SingleFunctionBuilds(BuildIntegBase):
         process_execute = run_command(cmdlist, cwd=self.working_dir)
 
         self.assertEqual(process_execute.process.returncode, 1)
-        self.assertIn("FunctionNotInTemplate not found", str(process_execute.stderr))
+        self.assertIn(b"FunctionNotInTemplate not found", process_execute.stderr)
 
     @parameterized.expand(
         [
@@ -721,23 +636,6 @@ class TestBuildCommand_SingleFunctionBuilds(BuildIntegBase):
             self.verify_docker_container_cleanedup(runtime)
             self.verify_pulling_only_latest_tag(runtime)
 
-    def _verify_built_artifact(self, build_dir, function_logical_id, expected_files):
-        self.assertTrue(build_dir.exists(), "Build directory should be created")
-
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
-        self.assertIn(function_logical_id, build_dir_files)
-
-        template_path = build_dir.joinpath("template.yaml")
-        resource_artifact_dir = build_dir.joinpath(function_logical_id)
-
-        # Make sure the template has correct CodeUri for resource
-        self._verify_resource_property(str(template_path), function_logical_id, "CodeUri", function_logical_id)
-
-        all_artifacts = set(os.listdir(str(resource_artifact_dir)))
-        actual_files = all_artifacts.intersection(expected_files)
-        self.assertEqual(actual_files, expected_files)
-
     def _get_python_version(self):
         return "python{}.{}".format(sys.version_info.major, sys.version_info.minor)
 
@@ -749,8 +647,8 @@ class TestBuildCommand_SingleFunctionBuilds(BuildIntegBase):
 class TestBuildCommand_LayerBuilds(BuildIntegBase):
     template = "layers-functions-template.yaml"
 
-    EXPECTED_FILES_PROJECT_MANIFEST = {"__init__.py", "main.py", "requirements.txt"}
-    EXPECTED_LAYERS_FILES_PROJECT_MANIFEST = {"__init__.py", "layer.py", "numpy", "requirements.txt"}
+    EXPECTED_FILES_PROJECT_MANIFEST = frozenset({"__init__.py", "main.py", "requirements.txt"})
+    EXPECTED_LAYERS_FILES_PROJECT_MANIFEST = frozenset({"__init__.py", "layer.py", "numpy", "requirements.txt"})
 
     @parameterized.expand([("python3.7", False, "LayerOne"), ("python3.7", "use_container", "LayerOne")])
     def test_build_single_layer(self, runtime, use_container, layer_identifier):
@@ -892,21 +790,9 @@ class TestBuildCommand_LayerBuilds(BuildIntegBase):
     def _verify_built_artifact(
         self, build_dir, resource_logical_id, expected_files, code_property_name, artifact_subfolder=""
     ):
-        self.assertTrue(build_dir.exists(), "Build directory should be created")
-
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
-        self.assertIn(resource_logical_id, build_dir_files)
-
-        template_path = build_dir.joinpath("template.yaml")
-        resource_artifact_dir = build_dir.joinpath(resource_logical_id, artifact_subfolder)
-
-        # Make sure the template has correct CodeUri for resource
-        self._verify_resource_property(str(template_path), resource_logical_id, code_property_name, resource_logical_id)
-
-        all_artifacts = set(os.listdir(str(resource_artifact_dir)))
-        actual_files = all_artifacts.intersection(expected_files)
-        self.assertEqual(actual_files, expected_files)
+        self._verify_resource_artifact(
+            build_dir, resource_logical_id, expected_files, code_property_name, artifact_subfolder
+        )
 
     def _get_python_version(self):
         return "python{}.{}".format(sys.version_info.major, sys.version_info.minor)
@@ -923,7 +809,7 @@ class TestBuildCommand_ProvidedFunctions(BuildIntegBase):
     # Test Suite for runtime: provided and where selection of the build workflow is implicitly makefile builder
     # if the makefile is present.
 
-    EXPECTED_FILES_PROJECT_MANIFEST = {"__init__.py", "main.py", "requests", "requirements.txt"}
+    EXPECTED_FILES_PROJECT_MANIFEST = frozenset({"__init__.py", "main.py", "requests", "requirements.txt"})
 
     FUNCTION_LOGICAL_ID = "Function"
 
@@ -973,46 +859,23 @@ class TestBuildCommand_ProvidedFunctions(BuildIntegBase):
             self.verify_docker_container_cleanedup(runtime)
             self.verify_pulling_only_latest_tag(runtime)
 
-    def _verify_built_artifact(self, build_dir, function_logical_id, expected_files):
-
-        self.assertTrue(build_dir.exists(), "Build directory should be created")
-
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
-        self.assertIn(function_logical_id, build_dir_files)
-
-        template_path = build_dir.joinpath("template.yaml")
-        resource_artifact_dir = build_dir.joinpath(function_logical_id)
-
-        # Make sure the template has correct CodeUri for resource
-        self._verify_resource_property(str(template_path), function_logical_id, "CodeUri", function_logical_id)
-
-        all_artifacts = set(os.listdir(str(resource_artifact_dir)))
-        actual_files = all_artifacts.intersection(expected_files)
-        self.assertEqual(actual_files, expected_files)
-
     def _verify_built_artifact_in_subapp(self, build_dir, subapp_path, function_logical_id, expected_files):
 
         self.assertTrue(build_dir.exists(), "Build directory should be created")
         subapp_build_dir = Path(build_dir, subapp_path)
         self.assertTrue(subapp_build_dir.exists(), f"Build directory for sub app {subapp_path} should be created")
 
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
+        self._assert_dir_contains(build_dir, {"template.yaml"})
 
-        subapp_build_dir_files = os.listdir(str(subapp_build_dir))
-        self.assertIn("template.yaml", subapp_build_dir_files)
-        self.assertIn(function_logical_id, subapp_build_dir_files)
+        self._assert_dir_contains(subapp_build_dir, {"template.yaml", function_logical_id})
 
         template_path = subapp_build_dir.joinpath("template.yaml")
         resource_artifact_dir = subapp_build_dir.joinpath(function_logical_id)
 
         # Make sure the template has correct CodeUri for resource
-        self._verify_resource_property(str(template_path), function_logical_id, "CodeUri", function_logical_id)
+        self._verify_resource_property(template_path, function_logical_id, "CodeUri", function_logical_id)
 
-        all_artifacts = set(os.listdir(str(resource_artifact_dir)))
-        actual_files = all_artifacts.intersection(expected_files)
-        self.assertEqual(actual_files, expected_files)
+        self._assert_dir_contains(resource_artifact_dir, expected_files)
 
     def _get_python_version(self):
         return "python{}.{}".format(sys.version_info.major, sys.version_info.minor)
@@ -1026,7 +889,7 @@ class TestBuildWithBuildMethod(BuildIntegBase):
     # Test Suite where `BuildMethod` is explicitly specified.
 
     template = "custom-build-function.yaml"
-    EXPECTED_FILES_PROJECT_MANIFEST = {"__init__.py", "main.py", "requests", "requirements.txt"}
+    EXPECTED_FILES_PROJECT_MANIFEST = frozenset({"__init__.py", "main.py", "requests", "requirements.txt"})
 
     FUNCTION_LOGICAL_ID = "Function"
 
@@ -1126,24 +989,6 @@ class TestBuildWithBuildMethod(BuildIntegBase):
         self.assertEqual(command.process.returncode, 1)
         self.assertEqual(command.stdout.strip(), b"Build Failed")
 
-    def _verify_built_artifact(self, build_dir, function_logical_id, expected_files):
-
-        self.assertTrue(build_dir.exists(), "Build directory should be created")
-
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
-        self.assertIn(function_logical_id, build_dir_files)
-
-        template_path = build_dir.joinpath("template.yaml")
-        resource_artifact_dir = build_dir.joinpath(function_logical_id)
-
-        # Make sure the template has correct CodeUri for resource
-        self._verify_resource_property(str(template_path), function_logical_id, "CodeUri", function_logical_id)
-
-        all_artifacts = set(os.listdir(str(resource_artifact_dir)))
-        actual_files = all_artifacts.intersection(expected_files)
-        self.assertEqual(actual_files, expected_files)
-
     def _get_python_version(self):
         return "python{}.{}".format(sys.version_info.major, sys.version_info.minor)
 
@@ -1418,17 +1263,15 @@ class TestBuildWithInlineCode(BuildIntegBase):
         codeuri_logical_id = "CodeUriFunction"
         inline_logical_id = "InlineCodeFunction"
 
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("template.yaml", build_dir_files)
-        self.assertIn(codeuri_logical_id, build_dir_files)
-        self.assertNotIn(inline_logical_id, build_dir_files)
+        self._assert_dir_contains(build_dir, {"template.yaml", codeuri_logical_id})
+        self.assertFalse(self._names_in_dir(build_dir, {inline_logical_id}))
 
         template_path = build_dir.joinpath("template.yaml")
 
         # Make sure the template has correct CodeUri for resource
-        self._verify_resource_property(str(template_path), codeuri_logical_id, "CodeUri", codeuri_logical_id)
+        self._verify_resource_property(template_path, codeuri_logical_id, "CodeUri", codeuri_logical_id)
         # Make sure the template has correct InlineCode for resource
-        self._verify_resource_property(str(template_path), inline_logical_id, "InlineCode", "def handler(): pass")
+        self._verify_resource_property(template_path, inline_logical_id, "InlineCode", "def handler(): pass")
 
 
 @skipIf(
@@ -1470,14 +1313,12 @@ class TestBuildWithJsonContainerEnvVars(BuildIntegBase):
     def _verify_built_env_var(self, build_dir):
         self.assertTrue(build_dir.exists(), "Build directory should be created")
 
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("CheckEnvVarsFunction", build_dir_files)
+        self._assert_dir_contains(build_dir, {"CheckEnvVarsFunction"})
 
-        function_files = os.listdir(str(build_dir.joinpath("CheckEnvVarsFunction")))
-        self.assertIn("env_vars_result.txt", function_files)
+        self._assert_dir_contains(build_dir.joinpath("CheckEnvVarsFunction"), {"env_vars_result.txt"})
 
         output_file = build_dir.joinpath("CheckEnvVarsFunction", "env_vars_result.txt")
-        with open(str(output_file), "r", encoding="utf-8") as r:
+        with open(output_file, "r", encoding="utf-8") as r:
             actual = r.read()
             self.assertEqual(actual.strip(), "MyVar")
 
@@ -1514,14 +1355,12 @@ class TestBuildWithInlineContainerEnvVars(BuildIntegBase):
     def _verify_built_env_var(self, build_dir):
         self.assertTrue(build_dir.exists(), "Build directory should be created")
 
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("CheckEnvVarsFunction", build_dir_files)
+        self._assert_dir_contains(build_dir, {"CheckEnvVarsFunction"})
 
-        function_files = os.listdir(str(build_dir.joinpath("CheckEnvVarsFunction")))
-        self.assertIn("env_vars_result.txt", function_files)
+        self._assert_dir_contains(build_dir.joinpath("CheckEnvVarsFunction"), {"env_vars_result.txt"})
 
         output_file = build_dir.joinpath("CheckEnvVarsFunction", "env_vars_result.txt")
-        with open(str(output_file), "r", encoding="utf-8") as r:
+        with open(output_file, "r", encoding="utf-8") as r:
             actual = r.read()
             self.assertEqual(actual.strip(), "MyVar")
 
@@ -1749,13 +1588,15 @@ class TestBuildWithNestedStacks3LevelWithSymlink(NestedBuildIntegBase):
 )
 class TestBuildWithNestedStacksImage(NestedBuildIntegBase):
 
-    EXPECTED_FILES_PROJECT_MANIFEST = {
-        "__init__.py",
-        "main.py",
-        "numpy",
-        # 'cryptography',
-        "requirements.txt",
-    }
+    EXPECTED_FILES_PROJECT_MANIFEST = frozenset(
+        {
+            "__init__.py",
+            "main.py",
+            "numpy",
+            # 'cryptography',
+            "requirements.txt",
+        }
+    )
 
     @parameterized.expand(
         [
@@ -1870,8 +1711,7 @@ class TestBuildWithCustomBuildImage(BuildIntegBase):
     def _verify_build_succeeds(self, build_dir):
         self.assertTrue(build_dir.exists(), "Build directory should be created")
 
-        build_dir_files = os.listdir(str(build_dir))
-        self.assertIn("BuildImageFunction", build_dir_files)
+        self._assert_dir_contains(build_dir, {"BuildImageFunction"})
 
 
 @parameterized_class(
@@ -1932,13 +1772,15 @@ class TestBuildPassingLayerAcrossStacks(IntrinsicIntegBase):
 
 class TestBuildWithS3FunctionsOrLayers(NestedBuildIntegBase):
     template = "template-with-s3-code.yaml"
-    EXPECTED_FILES_PROJECT_MANIFEST = {
-        "__init__.py",
-        "main.py",
-        "numpy",
-        # 'cryptography',
-        "requirements.txt",
-    }
+    EXPECTED_FILES_PROJECT_MANIFEST = frozenset(
+        {
+            "__init__.py",
+            "main.py",
+            "numpy",
+            # 'cryptography',
+            "requirements.txt",
+        }
+    )
 
     @pytest.mark.flaky(reruns=3)
     def test_functions_layers_with_s3_codeuri(self):
@@ -3,6 +3,7 @@ import shutil
 import tempfile
 import uuid
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import skipIf
 
 import boto3
@@ -20,6 +21,7 @@ from tests.testing_utils import CommandResult, run_command, run_command_with_inp
 # This is to restrict package tests to run outside of CI/CD, when the branch is not master or tests are not run by Canary
 SKIP_DEPLOY_TESTS = RUNNING_ON_CI and RUNNING_TEST_FOR_MASTER_ON_CI and not RUN_BY_CANARY
 CFN_SLEEP = 3
+MAX_DELETE_WORKERS = 8
 TIMEOUT = 300
 CFN_PYTHON_VERSION_SUFFIX = os.environ.get("PYTHON_VERSION", "0.0.0").replace(".", "-")
 
@@ -54,10 +56,11 @@ class TestDeploy(PackageIntegBase, DeployIntegBase):
 
     def tearDown(self):
         shutil.rmtree(os.path.join(os.getcwd(), ".aws-sam", "build"), ignore_errors=True)
-        for stack_name in self.stack_names:
-            # because of the termination protection, do not delete aws-sam-cli-managed-default stack
-            if stack_name != SAM_CLI_STACK_NAME:
-                self.cf_client.delete_stack(StackName=stack_name)
+        # because of the termination protection, do not delete aws-sam-cli-managed-default stack
+        stack_names = [stack_name for stack_name in self.stack_names if stack_name != SAM_CLI_STACK_NAME]
+        # deletions are independent of each other, issue them concurrently instead of one request after another
+        with ThreadPoolExecutor(max_workers=MAX_DELETE_WORKERS) as executor:
+            list(executor.map(lambda stack_name: self.cf_client.delete_stack(StackName=stack_name), stack_names))
         super().tearDown()
 
     @parameterized.expand(["aws-serverless-function.yaml"])
@@ -7,9 +7,15 @@ import tempfile
 from unittest import TestCase
 
 import boto3
+from botocore.exceptions import ClientError
 from pathlib import Path
 
 S3_SLEEP = 3
+SAR_READY_TIMEOUT = 30
+SAR_READY_MAX_DELAY = 1
+SAR_THROTTLING_ERROR_CODES = frozenset(["TooManyRequestsException", "ThrottlingException", "Throttling"])
+SAR_NOT_FOUND_ERROR_CODE = "NotFoundException"
+WHITESPACE_TO_STRIP = str.maketrans("", "", "\n\r ")
 
 
 class PublishAppIntegBase(TestCase):
@@ -24,6 +30,19 @@ class PublishAppIntegBase(TestCase):
         cls.temp_dir = Path(tempfile.mkdtemp())
         cls.test_data_path = Path(__file__).resolve().parents[1].joinpath("testdata", "publish")
         cls.sar_client = boto3.client("serverlessrepo", region_name=cls.region_name)
+        # Fixtures are read and copied once, every test only rewrites the files holding placeholders
+        shutil.rmtree(str(cls.temp_dir), ignore_errors=True)
+        shutil.copytree(str(cls.test_data_path), str(cls.temp_dir))
+        cls.fixture_templates = {
+            f.name: f.read_text(encoding="utf-8")
+            for f in cls.test_data_path.iterdir()
+            if f.suffix in (".yaml", ".json")
+        }
+        cls.placeholder_fixtures = frozenset(
+            name
+            for name, content in cls.fixture_templates.items()
+            if cls.bucket_name_placeholder in content or cls.application_name_placeholder in content
+        )
 
         # Intialize S3 client
         s3 = boto3.resource("s3")
@@ -53,27 +72,75 @@ class PublishAppIntegBase(TestCase):
         cls.s3_bucket.put_object(Key="main.py", Body=code_body)
 
     @classmethod
-    def replace_template_placeholder(cls, placeholder, replace_text):
-        for f in cls.temp_dir.iterdir():
-            if f.suffix == ".yaml" or f.suffix == ".json":
-                content = f.read_text(encoding="utf-8")
-                f.write_text(content.replace(placeholder, replace_text))
+    def tearDownClass(cls):
+        shutil.rmtree(str(cls.temp_dir), ignore_errors=True)
 
     def setUp(self):
-        shutil.rmtree(str(self.temp_dir), ignore_errors=True)
-        shutil.copytree(str(self.test_data_path), str(self.temp_dir))
-
         # Replace placeholders with the created S3 bucket name and application name
         self.application_name = str(uuid.uuid4())
-        self.replace_template_placeholder(self.bucket_name_placeholder, self.bucket_name)
-        self.replace_template_placeholder(self.application_name_placeholder, self.application_name)
-
-    def tearDown(self):
-        shutil.rmtree(str(self.temp_dir), ignore_errors=True)
+        self.fixtures = dict(self.fixture_templates)
+        for name in self.placeholder_fixtures:
+            content = self.fixture_templates[name]
+            content = content.replace(self.bucket_name_placeholder, self.bucket_name).replace(
+                self.application_name_placeholder, self.application_name
+            )
+            self.temp_dir.joinpath(name).write_text(content)
+            self.fixtures[name] = content
+
+    def wait_until_sar_ready(self):
+        """
+        Polls SAR with an exponential backoff until it answers without throttling the account
+        """
+        self._poll_sar(
+            lambda: self.sar_client.list_applications(MaxItems=1) is not None,
+            SAR_THROTTLING_ERROR_CODES,
+            "SAR did not answer without throttling",
+        )
+
+    def wait_until_application_ready(self, application_id, semantic_version):
+        """
+        Polls SAR with an exponential backoff until the application can be read with the given version, which
+        is what publish needs to update it
+        """
+
+        def application_is_ready():
+            application = self.sar_client.get_application(ApplicationId=application_id)
+            return application.get("Version", {}).get("SemanticVersion") == semantic_version
+
+        self._poll_sar(
+            application_is_ready,
+            SAR_THROTTLING_ERROR_CODES | {SAR_NOT_FOUND_ERROR_CODE},
+            "Application {} with version {} was not readable".format(application_id, semantic_version),
+        )
+
+    def _poll_sar(self, is_ready, retry_error_codes, failure_message):
+        delay = 0.05
+        deadline = time.monotonic() + SAR_READY_TIMEOUT
+        last_error = None
+        while True:
+            try:
+                if is_ready():
+                    return
+            except ClientError as ex:
+                if ex.response["Error"]["Code"] not in retry_error_codes:
+                    raise
+                last_error = ex
+            if time.monotonic() >= deadline:
+                self.fail("{} within {} seconds, last error: {}".format(failure_message, SAR_READY_TIMEOUT, last_error))
+            time.sleep(delay)
+            delay = min(delay * 2, SAR_READY_MAX_DELAY)
+
+    def load_fixture_text(self, name):
+        return self.fixtures[name]
+
+    def load_fixture_json(self, name):
+        return json.loads(self.fixtures[name])
 
     def assert_metadata_details(self, app_metadata, std_output):
-        # Strip newlines and spaces in the std output
-        stripped_std_output = std_output.replace("\n", "").replace("\r", "").replace(" ", "")
+        # Decode once and strip newlines and spaces in the std output in a single pass
+        if isinstance(std_output, bytes):
+            std_output = std_output.decode("utf-8")
+        stripped_std_output = std_output.translate(WHITESPACE_TO_STRIP)
         # Assert expected app metadata in the std output regardless of key order
         for key, value in app_metadata.items():
             self.assertIn('"{}":{}'.format(key, json.dumps(value)), stripped_std_output)
@@ -89,15 +156,15 @@ class PublishAppIntegBase(TestCase):
         command_list = [self.base_command(), "publish"]
 
         if template_path:
-            command_list = command_list + ["-t", str(template_path)]
+            command_list += ["-t", str(template_path)]
 
         if region:
-            command_list = command_list + ["--region", region]
+            command_list += ["--region", region]
 
         if profile:
-            command_list = command_list + ["--profile", profile]
+            command_list += ["--profile", profile]
 
         if semantic_version:
-            command_list = command_list + ["--semantic-version", semantic_version]
+            command_list += ["--semantic-version", semantic_version]
 
-        return command_list
+        return tuple(command_list)
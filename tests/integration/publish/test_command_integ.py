@@ -1,7 +1,5 @@
 import re
-import time
-import json
-from subprocess import Popen, PIPE, TimeoutExpired
+from subprocess import Popen, PIPE, DEVNULL, TimeoutExpired
 
 from unittest import skipIf
 
@@ -16,6 +14,8 @@ from tests.testing_utils import run_command
 # This is to restrict publish tests to run outside of CI/CD, when the branch is not master and tests are not run by Canary.
 SKIP_PUBLISH_TESTS = RUNNING_ON_CI and RUNNING_TEST_FOR_MASTER_ON_CI and not RUN_BY_CANARY
 TIMEOUT = 300
+# Application ARN within the console link printed by publish
+APPLICATION_ARN_REGEX = re.compile(r"arn:[\w\-]+:serverlessrepo:[\w\-]+:[0-9]+:applications\~[\S]+")
 
 
 @skipIf(SKIP_PUBLISH_TESTS, "Skip publish tests in CI/CD only")
@@ -23,14 +23,13 @@ class TestPublishExistingApp(PublishAppIntegBase):
     def setUp(self):
         super().setUp()
         # Create application for each test
-        app_metadata_text = self.temp_dir.joinpath("metadata_create_app.json").read_text()
-        app_metadata = json.loads(app_metadata_text)
-        app_metadata["TemplateBody"] = self.temp_dir.joinpath("template_create_app.yaml").read_text()
+        app_metadata = self.load_fixture_json("metadata_create_app.json")
+        app_metadata["TemplateBody"] = self.load_fixture_text("template_create_app.yaml")
         response = self.sar_client.create_application(**app_metadata)
         self.application_id = response["ApplicationId"]
 
-        # Sleep for a little bit to make server happy
-        time.sleep(2)
+        # Wait until publish can read the application it is going to update
+        self.wait_until_application_ready(self.application_id, app_metadata["SemanticVersion"])
 
     def tearDown(self):
         super().tearDown()
@@ -39,37 +38,26 @@ class TestPublishExistingApp(PublishAppIntegBase):
 
     @parameterized.expand(
         [
-            ("template_update_app.yaml", "metadata_update_app.json"),
-            ("template_create_app_version.yaml", "metadata_create_app_version.json"),
-            ("template_create_app_with_readme_body.yaml", "metadata_create_app_with_readme_body.json"),
+            ("template_update_app.yaml", "metadata_update_app.json", None),
+            ("template_create_app_version.yaml", "metadata_create_app_version.json", None),
+            ("template_create_app_version.yaml", "metadata_create_app_version.json", "0.1.0"),
+            ("template_create_app_with_readme_body.yaml", "metadata_create_app_with_readme_body.json", None),
         ]
     )
-    def test_update_application(self, template_filename, expected_template_filename):
+    def test_update_application(self, template_filename, expected_template_filename, semantic_version):
         template_path = self.temp_dir.joinpath(template_filename)
-        command_list = self.get_command_list(template_path=template_path, region=self.region_name)
-
-        result = run_command(command_list)
-        expected_msg = 'The following metadata of application "{}" has been updated:'.format(self.application_id)
-        result_msg = result.stdout.decode("utf-8")
-        self.assertIn(expected_msg, result_msg)
-
-        app_metadata_text = self.temp_dir.joinpath(expected_template_filename).read_text()
-        app_metadata = json.loads(app_metadata_text)
-        self.assert_metadata_details(app_metadata, result_msg)
-
-    def test_update_application_version_with_semantic_version_option(self):
-        template_path = self.temp_dir.joinpath("template_create_app_version.yaml")
         command_list = self.get_command_list(
-            template_path=template_path, region=self.region_name, semantic_version="0.1.0"
+            template_path=template_path, region=self.region_name, semantic_version=semantic_version
         )
+
         result = run_command(command_list)
         expected_msg = 'The following metadata of application "{}" has been updated:'.format(self.application_id)
-        self.assertIn(expected_msg, result.stdout.decode("utf-8"))
+        self.assertIn(expected_msg.encode("utf-8"), result.stdout)
 
-        app_metadata_text = self.temp_dir.joinpath("metadata_create_app_version.json").read_text()
-        app_metadata = json.loads(app_metadata_text)
-        app_metadata[SEMANTIC_VERSION] = "0.1.0"
-        self.assert_metadata_details(app_metadata, result.stdout.decode("utf-8"))
+        app_metadata = self.load_fixture_json(expected_template_filename)
+        if semantic_version:
+            app_metadata[SEMANTIC_VERSION] = semantic_version
+        self.assert_metadata_details(app_metadata, result.stdout)
 
 
 @skipIf(SKIP_PUBLISH_TESTS, "Skip publish tests in CI/CD only")
@@ -77,8 +65,8 @@ class TestPublishNewApp(PublishAppIntegBase):
     def setUp(self):
         super().setUp()
         self.application_id = None
-        # Sleep for a little bit to make server happy
-        time.sleep(2)
+        # Wait until SAR answers without throttling before publishing
+        self.wait_until_sar_ready()
 
     def tearDown(self):
         super().tearDown()
@@ -91,32 +79,34 @@ class TestPublishNewApp(PublishAppIntegBase):
         command_list = self.get_command_list(template_path=template_path, region=self.region_name)
 
         result = run_command(command_list)
-        expected_msg = "Created new application with the following metadata:"
-        self.assertIn(expected_msg, result.stdout.decode("utf-8"))
+        expected_msg = b"Created new application with the following metadata:"
+        self.assertIn(expected_msg, result.stdout)
 
-        app_metadata_text = self.temp_dir.joinpath("metadata_create_app.json").read_text()
-        app_metadata = json.loads(app_metadata_text)
-        self.assert_metadata_details(app_metadata, result.stdout.decode("utf-8"))
+        result_msg = result.stdout.decode("utf-8")
+        app_metadata = self.load_fixture_json("metadata_create_app.json")
+        self.assert_metadata_details(app_metadata, result_msg)
 
         # Get console link application id from stdout
-        pattern = r"arn:[\w\-]+:serverlessrepo:[\w\-]+:[0-9]+:applications\~[\S]+"
-        match = re.search(pattern, result.stdout.decode("utf-8"))
+        match = APPLICATION_ARN_REGEX.search(result_msg)
         self.application_id = match.group().replace("~", "/")
 
     def test_publish_not_packaged_template(self):
         template_path = self.temp_dir.joinpath("template_not_packaged.yaml")
         command_list = self.get_command_list(template_path=template_path, region=self.region_name)
 
-        process = Popen(command_list, stderr=PIPE)
-        try:
-            _, stderr = process.communicate(timeout=TIMEOUT)
-        except TimeoutExpired:
-            process.kill()
-            raise
+        # stdout is not needed, and leaving the process context waits for the child even when the test fails
+        with Popen(command_list, stdout=DEVNULL, stderr=PIPE) as process:
+            try:
+                _, stderr = process.communicate(timeout=TIMEOUT)
+            except TimeoutExpired:
+                process.kill()
+                # drain the pipe so the killed process can be reaped
+                process.communicate()
+                raise
         process_stderr = stderr.strip()
 
-        expected_msg = "Please make sure that you have uploaded application artifacts to S3"
-        self.assertIn(expected_msg, process_stderr.decode("utf-8"))
+        expected_msg = b"Please make sure that you have uploaded application artifacts to S3"
+        self.assertIn(expected_msg, process_stderr)
 
     def test_create_application_infer_region_from_env(self):
         template_path = self.temp_dir.joinpath("template_create_app.yaml")
@@ -124,12 +114,11 @@ class TestPublishNewApp(PublishAppIntegBase):
 
         result = run_command(command_list)
 
-        expected_msg = "Created new application with the following metadata:"
-        self.assertIn(expected_msg, result.stdout.decode("utf-8"))
+        expected_msg = b"Created new application with the following metadata:"
+        self.assertIn(expected_msg, result.stdout)
 
         # Get console link application id from stdout
-        pattern = r"arn:[\w\-]+:serverlessrepo:[\w\-]+:[0-9]+:applications\~[\S]+"
-        match = re.search(pattern, result.stdout.decode("utf-8"))
+        match = APPLICATION_ARN_REGEX.search(result.stdout.decode("utf-8"))
         self.application_id = match.group().replace("~", "/")
         self.assertIn(self.region_name, self.application_id)
 
@@ -140,6 +129,6 @@ class TestPublishNewApp(PublishAppIntegBase):
         )
 
         result = run_command(command_list)
-        expected_msg = "Created new application with the following metadata:"
-        self.assertIn(expected_msg, result.stdout.decode("utf-8"))
-        self.assertIn('"LicenseBody": "license-body"', result.stdout.decode("utf-8"))
+        expected_msg = b"Created new application with the following metadata:"
+        self.assertIn(expected_msg, result.stdout)
+        self.assertIn(b'"LicenseBody": "license-body"', result.stdout)
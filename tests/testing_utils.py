@@ -22,12 +22,18 @@ CommandResult = namedtuple("CommandResult", "process stdout stderr")
 TIMEOUT = 300
 
 
+def _log_output(stdout_data, stderr_data):
+    # Command output can be large, only decode it when it is going to be logged
+    if LOG.isEnabledFor(logging.INFO):
+        LOG.info("Stdout: %s", stdout_data.decode("utf-8", errors="replace"))
+        LOG.info("Stderr: %s", stderr_data.decode("utf-8", errors="replace"))
+
+
 def run_command(command_list, cwd=None, env=None, timeout=TIMEOUT) -> CommandResult:
     process_execute = Popen(command_list, cwd=cwd, env=env, stdout=PIPE, stderr=PIPE)
     try:
         stdout_data, stderr_data = process_execute.communicate(timeout=timeout)
-        LOG.info(f"Stdout: {stdout_data.decode('utf-8')}")
-        LOG.info(f"Stderr: {stderr_data.decode('utf-8')}")
+        _log_output(stdout_data, stderr_data)
         return CommandResult(process_execute, stdout_data, stderr_data)
     except TimeoutExpired:
         LOG.error(f"Command: {command_list}, TIMED OUT")
@@ -40,8 +46,7 @@ def run_command_with_input(command_list, stdin_input, timeout=TIMEOUT) -> Comman
     process_execute = Popen(command_list, stdout=PIPE, stderr=PIPE, stdin=PIPE)
     try:
         stdout_data, stderr_data = process_execute.communicate(stdin_input, timeout=timeout)
-        LOG.info(f"Stdout: {stdout_data.decode('utf-8')}")
-        LOG.info(f"Stderr: {stderr_data.decode('utf-8')}")
+        _log_output(stdout_data, stderr_data)
         return CommandResult(process_execute, stdout_data, stderr_data)
     except TimeoutExpired:
         LOG.error(f"Command: {command_list}, TIMED OUT")
@@ -9,6 +9,37 @@ from samcli.commands.deploy.guided_context import GuidedContext
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 
 
+def _label(text):
+    """
+    Renders a prompt or confirmation label the way GuidedContext does, indented and in bold
+    """
+    return "\t" + click.style(text, bold=True)
+
+
+# Prompt and confirmation labels built once for every expected call
+CONFIRM_CHANGESET_LABEL = _label("Confirm changes before deploy")
+ALLOW_ROLE_CREATION_LABEL = _label("Allow SAM CLI IAM role creation")
+SAVE_ARGUMENTS_LABEL = _label("Save arguments to configuration file")
+STACK_NAME_LABEL = _label("Stack Name")
+REGION_LABEL = _label("AWS Region")
+CAPABILITIES_LABEL = _label("Capabilities")
+AUTHORIZATION_LABEL = _label("HelloWorldFunction may not have authorization defined, Is this okay?")
+
+# Leading calls shared by most guided prompt runs
+BASE_CONFIRMATION_CALLS = (
+    call(CONFIRM_CHANGESET_LABEL, default=True),
+    call(ALLOW_ROLE_CREATION_LABEL, default=True),
+)
+BASE_PROMPT_CALLS = (
+    call(STACK_NAME_LABEL, default="test", type=click.STRING),
+    call(REGION_LABEL, default="region", type=click.STRING),
+)
+
+# Answers to the confirmations, with and without the public resource authorization question
+CONFIRM_ANSWERS = (True, False, "", True)
+CONFIRM_ANSWERS_PUBLIC_RESOURCES = (True, False, True, False, "")
+
+
 class TestGuidedContext(TestCase):
     def setUp(self):
         self.gc = GuidedContext(
@@ -22,171 +53,115 @@ class TestGuidedContext(TestCase):
             image_repositories={"HelloWorldFunction": "image-repo"},
         )
 
-    @patch("samcli.commands.deploy.guided_context.prompt")
-    @patch("samcli.commands.deploy.guided_context.confirm")
-    @patch("samcli.commands.deploy.guided_context.manage_stack")
-    @patch("samcli.commands.deploy.guided_context.auth_per_resource")
-    @patch("samcli.commands.deploy.guided_context.SamLocalStackProvider.get_stacks")
-    @patch("samcli.commands.deploy.guided_context.get_template_artifacts_format")
-    @patch("samcli.commands.deploy.guided_context.SamFunctionProvider")
-    @patch("samcli.commands.deploy.guided_context.signer_config_per_function")
-    def test_guided_prompts_check_defaults_non_public_resources_zips(
-        self,
-        patched_signer_config_per_function,
-        patched_sam_function_provider,
-        patched_get_template_artifacts_format,
-        patched_get_buildable_stacks,
-        patchedauth_per_resource,
-        patched_manage_stack,
-        patched_confirm,
-        patched_prompt,
-    ):
-        patched_sam_function_provider.return_value = {}
-        patched_get_template_artifacts_format.return_value = [ZIP]
-        patched_get_buildable_stacks.return_value = (Mock(), [])
+        # Collaborators every guided prompt test needs mocked
+        self.patched_prompt = self._start_patch("prompt")
+        self.patched_confirm = self._start_patch("confirm")
+        self.patched_manage_stack = self._start_patch("manage_stack")
+        self.patched_auth_per_resource = self._start_patch("auth_per_resource")
+        self.patched_get_buildable_stacks = self._start_patch("SamLocalStackProvider.get_stacks")
+        self.patched_get_template_artifacts_format = self._start_patch("get_template_artifacts_format")
+        self.patched_sam_function_provider = self._start_patch("SamFunctionProvider")
+        self.patched_signer_config_per_function = self._start_patch("signer_config_per_function")
+        self.patched_manage_stack.return_value = "managed_s3_stack"
+        self.patched_signer_config_per_function.return_value = ({}, {})
+
+    def _start_patch(self, target):
+        patcher = patch(f"samcli.commands.deploy.guided_context.{target}")
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_guided_prompts_check_defaults_non_public_resources_zips(self):
+        self.patched_sam_function_provider.return_value = {}
+        self.patched_get_template_artifacts_format.return_value = [ZIP]
+        self.patched_get_buildable_stacks.return_value = (Mock(), [])
         # Series of inputs to confirmations so that full range of questions are asked.
-        patchedauth_per_resource.return_value = [
+        self.patched_auth_per_resource.return_value = [
             ("HelloWorldFunction", True),
         ]
-        patched_confirm.side_effect = [True, False, "", True]
-        patched_manage_stack.return_value = "managed_s3_stack"
-        patched_signer_config_per_function.return_value = ({}, {})
+        self.patched_confirm.side_effect = CONFIRM_ANSWERS
         self.gc.guided_prompts(parameter_override_keys=None)
         # Now to check for all the defaults on confirmations.
-        expected_confirmation_calls = [
-            call(f"\t{self.gc.start_bold}Confirm changes before deploy{self.gc.end_bold}", default=True),
-            call(f"\t{self.gc.start_bold}Allow SAM CLI IAM role creation{self.gc.end_bold}", default=True),
-            call(f"\t{self.gc.start_bold}Save arguments to configuration file{self.gc.end_bold}", default=True),
+        expected_confirmation_calls = list(BASE_CONFIRMATION_CALLS) + [
+            call(SAVE_ARGUMENTS_LABEL, default=True),
         ]
-        self.assertEqual(expected_confirmation_calls, patched_confirm.call_args_list)
+        self.assertEqual(expected_confirmation_calls, self.patched_confirm.call_args_list)
 
         # Now to check for all the defaults on prompts.
-        expected_prompt_calls = [
-            call(f"\t{self.gc.start_bold}Stack Name{self.gc.end_bold}", default="test", type=click.STRING),
-            call(f"\t{self.gc.start_bold}AWS Region{self.gc.end_bold}", default="region", type=click.STRING),
-            call(f"\t{self.gc.start_bold}Capabilities{self.gc.end_bold}", default=["CAPABILITY_IAM"], type=ANY),
+        expected_prompt_calls = list(BASE_PROMPT_CALLS) + [
+            call(CAPABILITIES_LABEL, default=["CAPABILITY_IAM"], type=ANY),
         ]
-        self.assertEqual(expected_prompt_calls, patched_prompt.call_args_list)
-
-    @patch("samcli.commands.deploy.guided_context.prompt")
-    @patch("samcli.commands.deploy.guided_context.confirm")
-    @patch("samcli.commands.deploy.guided_context.manage_stack")
-    @patch("samcli.commands.deploy.guided_context.auth_per_resource")
-    @patch("samcli.commands.deploy.guided_context.SamLocalStackProvider.get_stacks")
-    @patch("samcli.commands.deploy.guided_context.get_template_artifacts_format")
-    @patch("samcli.commands.deploy.guided_context.SamFunctionProvider")
-    @patch("samcli.commands.deploy.guided_context.signer_config_per_function")
-    def test_guided_prompts_check_defaults_public_resources_zips(
-        self,
-        patched_signer_config_per_function,
-        patched_sam_function_provider,
-        patched_get_template_artifacts_format,
-        patched_get_buildable_stacks,
-        patchedauth_per_resource,
-        patched_manage_stack,
-        patched_confirm,
-        patched_prompt,
-    ):
-        patched_signer_config_per_function.return_value = (None, None)
-        patched_sam_function_provider.return_value = {}
-        patched_get_template_artifacts_format.return_value = [ZIP]
-        patched_get_buildable_stacks.return_value = (Mock(), [])
+        self.assertEqual(expected_prompt_calls, self.patched_prompt.call_args_list)
+
+    def test_guided_prompts_check_defaults_public_resources_zips(self):
+        self.patched_signer_config_per_function.return_value = (None, None)
+        self.patched_sam_function_provider.return_value = {}
+        self.patched_get_template_artifacts_format.return_value = [ZIP]
+        self.patched_get_buildable_stacks.return_value = (Mock(), [])
         # Series of inputs to confirmations so that full range of questions are asked.
-        patchedauth_per_resource.return_value = [("HelloWorldFunction", False)]
-        patched_confirm.side_effect = [True, False, True, False, ""]
-        patched_manage_stack.return_value = "managed_s3_stack"
+        self.patched_auth_per_resource.return_value = [("HelloWorldFunction", False)]
+        self.patched_confirm.side_effect = CONFIRM_ANSWERS_PUBLIC_RESOURCES
         self.gc.guided_prompts(parameter_override_keys=None)
         # Now to check for all the defaults on confirmations.
-        expected_confirmation_calls = [
-            call(f"\t{self.gc.start_bold}Confirm changes before deploy{self.gc.end_bold}", default=True),
-            call(f"\t{self.gc.start_bold}Allow SAM CLI IAM role creation{self.gc.end_bold}", default=True),
+        expected_confirmation_calls = list(BASE_CONFIRMATION_CALLS) + [
             call(
-                f"\t{self.gc.start_bold}HelloWorldFunction may not have authorization defined, Is this okay?{self.gc.end_bold}",
+                AUTHORIZATION_LABEL,
                 default=False,
             ),
-            call(f"\t{self.gc.start_bold}Save arguments to configuration file{self.gc.end_bold}", default=True),
+            call(SAVE_ARGUMENTS_LABEL, default=True),
         ]
-        self.assertEqual(expected_confirmation_calls, patched_confirm.call_args_list)
+        self.assertEqual(expected_confirmation_calls, self.patched_confirm.call_args_list)
 
         # Now to check for all the defaults on prompts.
-        expected_prompt_calls = [
-            call(f"\t{self.gc.start_bold}Stack Name{self.gc.end_bold}", default="test", type=click.STRING),
-            call(f"\t{self.gc.start_bold}AWS Region{self.gc.end_bold}", default="region", type=click.STRING),
-            call(f"\t{self.gc.start_bold}Capabilities{self.gc.end_bold}", default=["CAPABILITY_IAM"], type=ANY),
+        expected_prompt_calls = list(BASE_PROMPT_CALLS) + [
+            call(CAPABILITIES_LABEL, default=["CAPABILITY_IAM"], type=ANY),
         ]
-        self.assertEqual(expected_prompt_calls, patched_prompt.call_args_list)
+        self.assertEqual(expected_prompt_calls, self.patched_prompt.call_args_list)
 
-    @patch("samcli.commands.deploy.guided_context.prompt")
-    @patch("samcli.commands.deploy.guided_context.confirm")
-    @patch("samcli.commands.deploy.guided_context.manage_stack")
-    @patch("samcli.commands.deploy.guided_context.auth_per_resource")
-    @patch("samcli.commands.deploy.guided_context.SamLocalStackProvider.get_stacks")
     @patch("samcli.commands.deploy.guided_context.get_template_function_resource_ids")
-    @patch("samcli.commands.deploy.guided_context.get_template_artifacts_format")
-    @patch("samcli.commands.deploy.guided_context.SamFunctionProvider")
     @patch("samcli.commands.deploy.guided_context.click.secho")
     @patch("samcli.commands.deploy.guided_context.tag_translation")
-    @patch("samcli.commands.deploy.guided_context.signer_config_per_function")
     def test_guided_prompts_check_defaults_public_resources_images(
-        self,
-        patched_signer_config_per_function,
-        patched_tag_translation,
-        patched_click_secho,
-        patched_sam_function_provider,
-        patched_get_template_artifacts_format,
-        mock_get_template_function_resource_ids,
-        patched_get_buildable_stacks,
-        patchedauth_per_resource,
-        patched_manage_stack,
-        patched_confirm,
-        patched_prompt,
+        self, patched_tag_translation, patched_click_secho, mock_get_template_function_resource_ids
     ):
 
         mock_get_template_function_resource_ids.return_value = ["HelloWorldFunction"]
-        patched_signer_config_per_function.return_value = (None, None)
+        self.patched_signer_config_per_function.return_value = (None, None)
         patched_tag_translation.return_value = "helloworld-123456-v1"
-        patched_sam_function_provider.return_value = MagicMock(
+        self.patched_sam_function_provider.return_value = MagicMock(
             functions={"HelloWorldFunction": MagicMock(packagetype=IMAGE, imageuri="helloworld:v1")}
         )
-        patched_get_template_artifacts_format.return_value = [IMAGE]
-        patched_get_buildable_stacks.return_value = (Mock(), [])
-        patched_prompt.side_effect = [
+        self.patched_get_template_artifacts_format.return_value = [IMAGE]
+        self.patched_get_buildable_stacks.return_value = (Mock(), [])
+        self.patched_prompt.side_effect = [
             "sam-app",
             "region",
             "123456789012.dkr.ecr.region.amazonaws.com/myrepo",
             "CAPABILITY_IAM",
         ]
         # Series of inputs to confirmations so that full range of questions are asked.
-        patchedauth_per_resource.return_value = [("HelloWorldFunction", False)]
-        patched_confirm.side_effect = [True, False, True, False, ""]
-        patched_manage_stack.return_value = "managed_s3_stack"
+        self.patched_auth_per_resource.return_value = [("HelloWorldFunction", False)]
+        self.patched_confirm.side_effect = CONFIRM_ANSWERS_PUBLIC_RESOURCES
         self.gc.guided_prompts(parameter_override_keys=None)
         # Now to check for all the defaults on confirmations.
-        expected_confirmation_calls = [
-            call(f"\t{self.gc.start_bold}Confirm changes before deploy{self.gc.end_bold}", default=True),
-            call(f"\t{self.gc.start_bold}Allow SAM CLI IAM role creation{self.gc.end_bold}", default=True),
+        expected_confirmation_calls = list(BASE_CONFIRMATION_CALLS) + [
             call(
-                f"\t{self.gc.start_bold}HelloWorldFunction may not have authorization defined, Is this okay?{self.gc.end_bold}",
+                AUTHORIZATION_LABEL,
                 default=False,
             ),
-            call(f"\t{self.gc.start_bold}Save arguments to configuration file{self.gc.end_bold}", default=True),
+            call(SAVE_ARGUMENTS_LABEL, default=True),
         ]
-        self.assertEqual(expected_confirmation_calls, patched_confirm.call_args_list)
+        self.assertEqual(expected_confirmation_calls, self.patched_confirm.call_args_list)
 
         # Now to check for all the defaults on prompts.
-        expected_prompt_calls = [
-            call(f"\t{self.gc.start_bold}Stack Name{self.gc.end_bold}", default="test", type=click.STRING),
-            call(f"\t{self.gc.start_bold}AWS Region{self.gc.end_bold}", default="region", type=click.STRING),
+        expected_prompt_calls = list(BASE_PROMPT_CALLS) + [
             call(
-                f"\t{self.gc.start_bold}Image Repository for HelloWorldFunction{self.gc.end_bold}",
+                _label("Image Repository for HelloWorldFunction"),
                 default="image-repo",
             ),
-            call(f"\t{self.gc.start_bold}Capabilities{self.gc.end_bold}", default=["CAPABILITY_IAM"], type=ANY),
+            call(CAPABILITIES_LABEL, default=["CAPABILITY_IAM"], type=ANY),
         ]
-        self.assertEqual(expected_prompt_calls, patched_prompt.call_args_list)
+        self.assertEqual(expected_prompt_calls, self.patched_prompt.call_args_list)
         # Now to check click secho outputs
-        print(expected_prompt_calls)
-        print(patched_prompt.call_args_list)
         expected_click_secho_calls = [
             call(
                 f"\t  helloworld:v1 to be pushed to 123456789012.dkr.ecr.region.amazonaws.com/myrepo:helloworld-123456-v1"
@@ -197,75 +172,51 @@ class TestGuidedContext(TestCase):
         ]
         self.assertEqual(expected_click_secho_calls, patched_click_secho.call_args_list)
 
-    @patch("samcli.commands.deploy.guided_context.prompt")
-    @patch("samcli.commands.deploy.guided_context.confirm")
-    @patch("samcli.commands.deploy.guided_context.manage_stack")
-    @patch("samcli.commands.deploy.guided_context.auth_per_resource")
-    @patch("samcli.commands.deploy.guided_context.SamLocalStackProvider.get_stacks")
-    @patch("samcli.commands.deploy.guided_context.get_template_artifacts_format")
     @patch("samcli.commands.deploy.guided_context.get_template_function_resource_ids")
-    @patch("samcli.commands.deploy.guided_context.SamFunctionProvider")
     @patch("samcli.commands.deploy.guided_context.click.secho")
-    @patch("samcli.commands.deploy.guided_context.signer_config_per_function")
     def test_guided_prompts_check_defaults_public_resources_images_ecr_url(
-        self,
-        patched_signer_config_per_function,
-        patched_click_secho,
-        patched_sam_function_provider,
-        mock_get_template_function_resource_ids,
-        patched_get_template_artifacts_format,
-        patched_get_buildable_stacks,
-        patchedauth_per_resource,
-        patched_manage_stack,
-        patched_confirm,
-        patched_prompt,
+        self, patched_click_secho, mock_get_template_function_resource_ids
     ):
         mock_get_template_function_resource_ids.return_value = ["HelloWorldFunction"]
 
-        patched_sam_function_provider.return_value = MagicMock(
+        self.patched_sam_function_provider.return_value = MagicMock(
             functions={
                 "HelloWorldFunction": MagicMock(
                     packagetype=IMAGE, imageuri="123456789012.dkr.ecr.region.amazonaws.com/myrepo"
                 )
             }
         )
-        patched_get_template_artifacts_format.return_value = [IMAGE]
-        patched_get_buildable_stacks.return_value = (Mock(), [])
-        patched_prompt.side_effect = [
+        self.patched_get_template_artifacts_format.return_value = [IMAGE]
+        self.patched_get_buildable_stacks.return_value = (Mock(), [])
+        self.patched_prompt.side_effect = [
             "sam-app",
             "region",
             "123456789012.dkr.ecr.region.amazonaws.com/myrepo",
             "CAPABILITY_IAM",
         ]
         # Series of inputs to confirmations so that full range of questions are asked.
-        patchedauth_per_resource.return_value = [("HelloWorldFunction", False)]
-        patched_confirm.side_effect = [True, False, True, False, ""]
-        patched_manage_stack.return_value = "managed_s3_stack"
-        patched_signer_config_per_function.return_value = ({}, {})
+        self.patched_auth_per_resource.return_value = [("HelloWorldFunction", False)]
+        self.patched_confirm.side_effect = CONFIRM_ANSWERS_PUBLIC_RESOURCES
         self.gc.guided_prompts(parameter_override_keys=None)
         # Now to check for all the defaults on confirmations.
-        expected_confirmation_calls = [
-            call(f"\t{self.gc.start_bold}Confirm changes before deploy{self.gc.end_bold}", default=True),
-            call(f"\t{self.gc.start_bold}Allow SAM CLI IAM role creation{self.gc.end_bold}", default=True),
+        expected_confirmation_calls = list(BASE_CONFIRMATION_CALLS) + [
             call(
-                f"\t{self.gc.start_bold}HelloWorldFunction may not have authorization defined, Is this okay?{self.gc.end_bold}",
+                AUTHORIZATION_LABEL,
                 default=False,
             ),
-            call(f"\t{self.gc.start_bold}Save arguments to configuration file{self.gc.end_bold}", default=True),
+            call(SAVE_ARGUMENTS_LABEL, default=True),
         ]
-        self.assertEqual(expected_confirmation_calls, patched_confirm.call_args_list)
+        self.assertEqual(expected_confirmation_calls, self.patched_confirm.call_args_list)
 
         # Now to check for all the defaults on prompts.
-        expected_prompt_calls = [
-            call(f"\t{self.gc.start_bold}Stack Name{self.gc.end_bold}", default="test", type=click.STRING),
-            call(f"\t{self.gc.start_bold}AWS Region{self.gc.end_bold}", default="region", type=click.STRING),
+        expected_prompt_calls = list(BASE_PROMPT_CALLS) + [
             call(
-                f"\t{self.gc.start_bold}Image Repository for HelloWorldFunction{self.gc.end_bold}",
+                _label("Image Repository for HelloWorldFunction"),
                 default="image-repo",
             ),
-            call(f"\t{self.gc.start_bold}Capabilities{self.gc.end_bold}", default=["CAPABILITY_IAM"], type=ANY),
+            call(CAPABILITIES_LABEL, default=["CAPABILITY_IAM"], type=ANY),
         ]
-        self.assertEqual(expected_prompt_calls, patched_prompt.call_args_list)
+        self.assertEqual(expected_prompt_calls, self.patched_prompt.call_args_list)
         # Now to check click secho outputs and no references to images pushed.
         expected_click_secho_calls = [
             call(nl=True),
@@ -274,92 +225,50 @@ class TestGuidedContext(TestCase):
         ]
         self.assertEqual(expected_click_secho_calls, patched_click_secho.call_args_list)
 
-    @patch("samcli.commands.deploy.guided_context.prompt")
-    @patch("samcli.commands.deploy.guided_context.confirm")
-    @patch("samcli.commands.deploy.guided_context.manage_stack")
-    @patch("samcli.commands.deploy.guided_context.auth_per_resource")
-    @patch("samcli.commands.deploy.guided_context.SamLocalStackProvider.get_stacks")
-    @patch("samcli.commands.deploy.guided_context.get_template_artifacts_format")
     @patch("samcli.commands.deploy.guided_context.get_template_function_resource_ids")
-    @patch("samcli.commands.deploy.guided_context.SamFunctionProvider")
     @patch("samcli.commands.deploy.guided_context.click.secho")
-    @patch("samcli.commands.deploy.guided_context.signer_config_per_function")
-    def test_guided_prompts_images_no_image_uri(
-        self,
-        patched_signer_config_per_function,
-        patched_click_secho,
-        patched_sam_function_provider,
-        mock_get_template_function_resource_ids,
-        patched_get_template_artifacts_format,
-        patched_get_buildable_stacks,
-        patchedauth_per_resource,
-        patched_manage_stack,
-        patched_confirm,
-        patched_prompt,
-    ):
+    def test_guided_prompts_images_no_image_uri(self, patched_click_secho, mock_get_template_function_resource_ids):
         mock_get_template_function_resource_ids.return_value = ["HelloWorldFunction"]
 
         # Set ImageUri to be None, the sam app was never built.
-        patched_sam_function_provider.return_value = MagicMock(
+        self.patched_sam_function_provider.return_value = MagicMock(
             functions={"HelloWorldFunction": MagicMock(packagetype=IMAGE, imageuri=None)}
         )
-        patched_get_template_artifacts_format.return_value = [IMAGE]
-        patched_get_buildable_stacks.return_value = (Mock(), [])
-        patched_prompt.side_effect = [
+        self.patched_get_template_artifacts_format.return_value = [IMAGE]
+        self.patched_get_buildable_stacks.return_value = (Mock(), [])
+        self.patched_prompt.side_effect = [
             "sam-app",
             "region",
             "123456789012.dkr.ecr.region.amazonaws.com/myrepo",
             "CAPABILITY_IAM",
         ]
         # Series of inputs to confirmations so that full range of questions are asked.
-        patchedauth_per_resource.return_value = [("HelloWorldFunction", False)]
-        patched_confirm.side_effect = [True, False, True, False, ""]
-        patched_manage_stack.return_value = "managed_s3_stack"
-        patched_signer_config_per_function.return_value = ({}, {})
+        self.patched_auth_per_resource.return_value = [("HelloWorldFunction", False)]
+        self.patched_confirm.side_effect = CONFIRM_ANSWERS_PUBLIC_RESOURCES
         with self.assertRaises(GuidedDeployFailedError):
             self.gc.guided_prompts(parameter_override_keys=None)
 
-    @patch("samcli.commands.deploy.guided_context.prompt")
-    @patch("samcli.commands.deploy.guided_context.confirm")
-    @patch("samcli.commands.deploy.guided_context.manage_stack")
-    @patch("samcli.commands.deploy.guided_context.auth_per_resource")
-    @patch("samcli.commands.deploy.guided_context.SamLocalStackProvider.get_stacks")
-    @patch("samcli.commands.deploy.guided_context.get_template_artifacts_format")
     @patch("samcli.commands.deploy.guided_context.get_template_function_resource_ids")
-    @patch("samcli.commands.deploy.guided_context.SamFunctionProvider")
     @patch("samcli.commands.deploy.guided_context.click.secho")
-    @patch("samcli.commands.deploy.guided_context.signer_config_per_function")
     def test_guided_prompts_images_blank_image_repository(
-        self,
-        patched_signer_config_per_function,
-        patched_click_secho,
-        patched_sam_function_provider,
-        mock_get_template_function_resource_ids,
-        patched_get_template_artifacts_format,
-        patched_get_buildable_stacks,
-        patchedauth_per_resource,
-        patched_manage_stack,
-        patched_confirm,
-        patched_prompt,
+        self, patched_click_secho, mock_get_template_function_resource_ids
     ):
         mock_get_template_function_resource_ids.return_value = ["HelloWorldFunction"]
 
-        patched_sam_function_provider.return_value = MagicMock(
+        self.patched_sam_function_provider.return_value = MagicMock(
             functions={"HelloWorldFunction": MagicMock(packagetype=IMAGE, imageuri="mysamapp:v1")}
         )
-        patched_get_template_artifacts_format.return_value = [IMAGE]
-        patched_get_buildable_stacks.return_value = (Mock(), [])
+        self.patched_get_template_artifacts_format.return_value = [IMAGE]
+        self.patched_get_buildable_stacks.return_value = (Mock(), [])
         # set Image repository to be blank.
-        patched_prompt.side_effect = [
+        self.patched_prompt.side_effect = [
             "sam-app",
             "region",
             "",
         ]
         # Series of inputs to confirmations so that full range of questions are asked.
-        patchedauth_per_resource.return_value = [("HelloWorldFunction", False)]
-        patched_confirm.side_effect = [True, False, True, False, ""]
-        patched_manage_stack.return_value = "managed_s3_stack"
-        patched_signer_config_per_function.return_value = ({}, {})
+        self.patched_auth_per_resource.return_value = [("HelloWorldFunction", False)]
+        self.patched_confirm.side_effect = CONFIRM_ANSWERS_PUBLIC_RESOURCES
         with self.assertRaises(GuidedDeployFailedError):
             self.gc.guided_prompts(parameter_override_keys=None)
 
@@ -367,223 +276,98 @@ class TestGuidedContext(TestCase):
         [
             param((("CAPABILITY_IAM",),)),
             param((("CAPABILITY_AUTO_EXPAND",),)),
-            param(
-                (
-                    (
-                        "CAPABILITY_AUTO_EXPAND",
-                        "CAPABILITY_IAM",
-                    ),
-                )
-            ),
+            param((("CAPABILITY_AUTO_EXPAND", "CAPABILITY_IAM"),)),
         ]
     )
-    @patch("samcli.commands.deploy.guided_context.prompt")
-    @patch("samcli.commands.deploy.guided_context.confirm")
-    @patch("samcli.commands.deploy.guided_context.manage_stack")
-    @patch("samcli.commands.deploy.guided_context.auth_per_resource")
-    @patch("samcli.commands.deploy.guided_context.SamLocalStackProvider.get_stacks")
-    @patch("samcli.commands.deploy.guided_context.get_template_artifacts_format")
-    @patch("samcli.commands.deploy.guided_context.SamFunctionProvider")
-    @patch("samcli.commands.deploy.guided_context.signer_config_per_function")
-    def test_guided_prompts_with_given_capabilities(
-        self,
-        given_capabilities,
-        patched_signer_config_per_function,
-        patched_sam_function_provider,
-        patched_get_template_artifacts_format,
-        patched_get_buildable_stacks,
-        patchedauth_per_resource,
-        patched_manage_stack,
-        patched_confirm,
-        patched_prompt,
-    ):
-        patched_signer_config_per_function.return_value = ({}, {})
-        patched_get_buildable_stacks.return_value = (Mock(), [])
+    def test_guided_prompts_with_given_capabilities(self, given_capabilities):
+        self.patched_get_buildable_stacks.return_value = (Mock(), [])
         self.gc.capabilities = given_capabilities
         # Series of inputs to confirmations so that full range of questions are asked.
-        patched_confirm.side_effect = [True, False, "", True]
+        self.patched_confirm.side_effect = CONFIRM_ANSWERS
         self.gc.guided_prompts(parameter_override_keys=None)
         # Now to check for all the defaults on confirmations.
-        expected_confirmation_calls = [
-            call(f"\t{self.gc.start_bold}Confirm changes before deploy{self.gc.end_bold}", default=True),
-            call(f"\t{self.gc.start_bold}Allow SAM CLI IAM role creation{self.gc.end_bold}", default=True),
-            call(f"\t{self.gc.start_bold}Save arguments to configuration file{self.gc.end_bold}", default=True),
+        expected_confirmation_calls = list(BASE_CONFIRMATION_CALLS) + [
+            call(SAVE_ARGUMENTS_LABEL, default=True),
         ]
-        self.assertEqual(expected_confirmation_calls, patched_confirm.call_args_list)
+        self.assertEqual(expected_confirmation_calls, self.patched_confirm.call_args_list)
 
         # Now to check for all the defaults on prompts.
         expected_capabilities = list(given_capabilities[0])
-        expected_prompt_calls = [
-            call(f"\t{self.gc.start_bold}Stack Name{self.gc.end_bold}", default="test", type=click.STRING),
-            call(f"\t{self.gc.start_bold}AWS Region{self.gc.end_bold}", default="region", type=click.STRING),
-            call(f"\t{self.gc.start_bold}Capabilities{self.gc.end_bold}", default=expected_capabilities, type=ANY),
+        expected_prompt_calls = list(BASE_PROMPT_CALLS) + [
+            call(CAPABILITIES_LABEL, default=expected_capabilities, type=ANY),
         ]
-        self.assertEqual(expected_prompt_calls, patched_prompt.call_args_list)
-
-    @patch("samcli.commands.deploy.guided_context.prompt")
-    @patch("samcli.commands.deploy.guided_context.confirm")
-    @patch("samcli.commands.deploy.guided_context.manage_stack")
-    @patch("samcli.commands.deploy.guided_context.auth_per_resource")
-    @patch("samcli.commands.deploy.guided_context.SamLocalStackProvider.get_stacks")
-    @patch("samcli.commands.deploy.guided_context.get_template_artifacts_format")
-    @patch("samcli.commands.deploy.guided_context.SamFunctionProvider")
-    @patch("samcli.commands.deploy.guided_context.signer_config_per_function")
-    def test_guided_prompts_check_configuration_file_prompt_calls(
-        self,
-        patched_signer_config_per_function,
-        patched_sam_function_provider,
-        patched_get_template_artifacts_format,
-        patched_get_buildable_stacks,
-        patchedauth_per_resource,
-        patched_manage_stack,
-        patched_confirm,
-        patched_prompt,
-    ):
-        patched_sam_function_provider.return_value = {}
-        patched_get_template_artifacts_format.return_value = [ZIP]
-        patched_get_buildable_stacks.return_value = (Mock(), [])
-        patched_signer_config_per_function.return_value = ({}, {})
+        self.assertEqual(expected_prompt_calls, self.patched_prompt.call_args_list)
+
+    def test_guided_prompts_check_configuration_file_prompt_calls(self):
+        self.patched_sam_function_provider.return_value = {}
+        self.patched_get_template_artifacts_format.return_value = [ZIP]
+        self.patched_get_buildable_stacks.return_value = (Mock(), [])
         # Series of inputs to confirmations so that full range of questions are asked.
-        patchedauth_per_resource.return_value = [("HelloWorldFunction", False)]
-        patched_confirm.side_effect = [True, False, True, True, ""]
-        patched_manage_stack.return_value = "managed_s3_stack"
+        self.patched_auth_per_resource.return_value = [("HelloWorldFunction", False)]
+        self.patched_confirm.side_effect = (True, False, True, True, "")
         self.gc.guided_prompts(parameter_override_keys=None)
         # Now to check for all the defaults on confirmations.
-        expected_confirmation_calls = [
-            call(f"\t{self.gc.start_bold}Confirm changes before deploy{self.gc.end_bold}", default=True),
-            call(f"\t{self.gc.start_bold}Allow SAM CLI IAM role creation{self.gc.end_bold}", default=True),
+        expected_confirmation_calls = list(BASE_CONFIRMATION_CALLS) + [
             call(
-                f"\t{self.gc.start_bold}HelloWorldFunction may not have authorization defined, Is this okay?{self.gc.end_bold}",
+                AUTHORIZATION_LABEL,
                 default=False,
             ),
-            call(f"\t{self.gc.start_bold}Save arguments to configuration file{self.gc.end_bold}", default=True),
+            call(SAVE_ARGUMENTS_LABEL, default=True),
         ]
-        self.assertEqual(expected_confirmation_calls, patched_confirm.call_args_list)
+        self.assertEqual(expected_confirmation_calls, self.patched_confirm.call_args_list)
 
-        expected_prompt_calls = [
-            call(f"\t{self.gc.start_bold}Stack Name{self.gc.end_bold}", default="test", type=click.STRING),
-            call(f"\t{self.gc.start_bold}AWS Region{self.gc.end_bold}", default="region", type=click.STRING),
-            call(f"\t{self.gc.start_bold}Capabilities{self.gc.end_bold}", default=["CAPABILITY_IAM"], type=ANY),
+        expected_prompt_calls = list(BASE_PROMPT_CALLS) + [
+            call(CAPABILITIES_LABEL, default=["CAPABILITY_IAM"], type=ANY),
             call(
-                f"\t{self.gc.start_bold}SAM configuration file{self.gc.end_bold}",
+                _label("SAM configuration file"),
                 default="samconfig.toml",
                 type=click.STRING,
             ),
             call(
-                f"\t{self.gc.start_bold}SAM configuration environment{self.gc.end_bold}",
+                _label("SAM configuration environment"),
                 default="default",
                 type=click.STRING,
             ),
         ]
-        self.assertEqual(expected_prompt_calls, patched_prompt.call_args_list)
-
-    @patch("samcli.commands.deploy.guided_context.prompt")
-    @patch("samcli.commands.deploy.guided_context.confirm")
-    @patch("samcli.commands.deploy.guided_context.manage_stack")
-    @patch("samcli.commands.deploy.guided_context.auth_per_resource")
-    @patch("samcli.commands.deploy.guided_context.SamLocalStackProvider.get_stacks")
-    @patch("samcli.commands.deploy.guided_context.get_template_artifacts_format")
-    @patch("samcli.commands.deploy.guided_context.SamFunctionProvider")
-    @patch("samcli.commands.deploy.guided_context.signer_config_per_function")
-    def test_guided_prompts_check_parameter_from_template(
-        self,
-        patched_signer_config_per_function,
-        patched_sam_function_provider,
-        patched_get_template_artifacts_format,
-        patched_get_buildable_stacks,
-        patchedauth_per_resource,
-        patched_manage_stack,
-        patched_confirm,
-        patched_prompt,
-    ):
-        patched_sam_function_provider.return_value = {}
-        patched_get_template_artifacts_format.return_value = [ZIP]
-        patched_get_buildable_stacks.return_value = (Mock(), [])
-        # Series of inputs to confirmations so that full range of questions are asked.
-        patchedauth_per_resource.return_value = [("HelloWorldFunction", False)]
-        patched_confirm.side_effect = [True, False, True, False, ""]
-        patched_manage_stack.return_value = "managed_s3_stack"
-        patched_signer_config_per_function.return_value = ({}, {})
-        parameter_override_from_template = {"MyTestKey": {"Default": "MyTemplateDefaultVal"}}
-        self.gc.parameter_overrides_from_cmdline = {}
-        self.gc.guided_prompts(parameter_override_keys=parameter_override_from_template)
-        # Now to check for all the defaults on confirmations.
-        expected_confirmation_calls = [
-            call(f"\t{self.gc.start_bold}Confirm changes before deploy{self.gc.end_bold}", default=True),
-            call(f"\t{self.gc.start_bold}Allow SAM CLI IAM role creation{self.gc.end_bold}", default=True),
-            call(
-                f"\t{self.gc.start_bold}HelloWorldFunction may not have authorization defined, Is this okay?{self.gc.end_bold}",
-                default=False,
-            ),
-            call(f"\t{self.gc.start_bold}Save arguments to configuration file{self.gc.end_bold}", default=True),
-        ]
-        self.assertEqual(expected_confirmation_calls, patched_confirm.call_args_list)
+        self.assertEqual(expected_prompt_calls, self.patched_prompt.call_args_list)
 
-        expected_prompt_calls = [
-            call(f"\t{self.gc.start_bold}Stack Name{self.gc.end_bold}", default="test", type=click.STRING),
-            call(f"\t{self.gc.start_bold}AWS Region{self.gc.end_bold}", default="region", type=click.STRING),
-            call(
-                f"\t{self.gc.start_bold}Parameter MyTestKey{self.gc.end_bold}",
-                default="MyTemplateDefaultVal",
-                type=click.STRING,
-            ),
-            call(f"\t{self.gc.start_bold}Capabilities{self.gc.end_bold}", default=["CAPABILITY_IAM"], type=ANY),
+    @parameterized.expand(
+        [
+            # Without an override, the template default is offered
+            param({}, "MyTemplateDefaultVal"),
+            # An override from the command line or config wins over the template default
+            param({"MyTestKey": "OverridedValFromCmdLine", "NotUsedKey": "NotUsedVal"}, "OverridedValFromCmdLine"),
         ]
-        self.assertEqual(expected_prompt_calls, patched_prompt.call_args_list)
-
-    @patch("samcli.commands.deploy.guided_context.prompt")
-    @patch("samcli.commands.deploy.guided_context.confirm")
-    @patch("samcli.commands.deploy.guided_context.manage_stack")
-    @patch("samcli.commands.deploy.guided_context.auth_per_resource")
-    @patch("samcli.commands.deploy.guided_context.SamLocalStackProvider.get_stacks")
-    @patch("samcli.commands.deploy.guided_context.get_template_artifacts_format")
-    @patch("samcli.commands.deploy.guided_context.SamFunctionProvider")
-    @patch("samcli.commands.deploy.guided_context.signer_config_per_function")
-    def test_guided_prompts_check_parameter_from_cmd_or_config(
-        self,
-        patched_signer_config_per_function,
-        patched_sam_function_provider,
-        patched_get_template_artifacts_format,
-        patched_get_buildable_stacks,
-        patchedauth_per_resource,
-        patched_manage_stack,
-        patched_confirm,
-        patched_prompt,
-    ):
-        patched_sam_function_provider.return_value = {}
-        patched_get_template_artifacts_format.return_value = [ZIP]
-        patched_get_buildable_stacks.return_value = (Mock(), [])
+    )
+    def test_guided_prompts_check_parameter(self, parameter_overrides_from_cmdline, expected_default):
+        self.patched_sam_function_provider.return_value = {}
+        self.patched_get_template_artifacts_format.return_value = [ZIP]
+        self.patched_get_buildable_stacks.return_value = (Mock(), [])
         # Series of inputs to confirmations so that full range of questions are asked.
-        patchedauth_per_resource.return_value = [("HelloWorldFunction", False)]
-        patched_confirm.side_effect = [True, False, True, False, ""]
-        patched_signer_config_per_function.return_value = ({}, {})
-        patched_manage_stack.return_value = "managed_s3_stack"
+        self.patched_auth_per_resource.return_value = [("HelloWorldFunction", False)]
+        self.patched_confirm.side_effect = CONFIRM_ANSWERS_PUBLIC_RESOURCES
         parameter_override_from_template = {"MyTestKey": {"Default": "MyTemplateDefaultVal"}}
-        self.gc.parameter_overrides_from_cmdline = {"MyTestKey": "OverridedValFromCmdLine", "NotUsedKey": "NotUsedVal"}
+        self.gc.parameter_overrides_from_cmdline = parameter_overrides_from_cmdline
         self.gc.guided_prompts(parameter_override_keys=parameter_override_from_template)
         # Now to check for all the defaults on confirmations.
-        expected_confirmation_calls = [
-            call(f"\t{self.gc.start_bold}Confirm changes before deploy{self.gc.end_bold}", default=True),
-            call(f"\t{self.gc.start_bold}Allow SAM CLI IAM role creation{self.gc.end_bold}", default=True),
+        expected_confirmation_calls = list(BASE_CONFIRMATION_CALLS) + [
             call(
-                f"\t{self.gc.start_bold}HelloWorldFunction may not have authorization defined, Is this okay?{self.gc.end_bold}",
+                AUTHORIZATION_LABEL,
                 default=False,
             ),
-            call(f"\t{self.gc.start_bold}Save arguments to configuration file{self.gc.end_bold}", default=True),
+            call(SAVE_ARGUMENTS_LABEL, default=True),
         ]
-        self.assertEqual(expected_confirmation_calls, patched_confirm.call_args_list)
+        self.assertEqual(expected_confirmation_calls, self.patched_confirm.call_args_list)
 
-        expected_prompt_calls = [
-            call(f"\t{self.gc.start_bold}Stack Name{self.gc.end_bold}", default="test", type=click.STRING),
-            call(f"\t{self.gc.start_bold}AWS Region{self.gc.end_bold}", default="region", type=click.STRING),
+        expected_prompt_calls = list(BASE_PROMPT_CALLS) + [
             call(
-                f"\t{self.gc.start_bold}Parameter MyTestKey{self.gc.end_bold}",
-                default="OverridedValFromCmdLine",
+                _label("Parameter MyTestKey"),
+                default=expected_default,
                 type=click.STRING,
             ),
-            call(f"\t{self.gc.start_bold}Capabilities{self.gc.end_bold}", default=["CAPABILITY_IAM"], type=ANY),
+            call(CAPABILITIES_LABEL, default=["CAPABILITY_IAM"], type=ANY),
         ]
-        self.assertEqual(expected_prompt_calls, patched_prompt.call_args_list)
+        self.assertEqual(expected_prompt_calls, self.patched_prompt.call_args_list)
 
     @parameterized.expand(
         [
@@ -594,57 +378,32 @@ class TestGuidedContext(TestCase):
             (True, ({"MyFunction1"}, {"MyLayer1": {"MyFunction1"}, "MyLayer2": {"MyFunction1"}})),
         ]
     )
-    @patch("samcli.commands.deploy.guided_context.prompt")
-    @patch("samcli.commands.deploy.guided_context.confirm")
     @patch("samcli.commands.deploy.code_signer_utils.prompt")
-    @patch("samcli.commands.deploy.guided_context.manage_stack")
-    @patch("samcli.commands.deploy.guided_context.auth_per_resource")
-    @patch("samcli.commands.deploy.guided_context.SamLocalStackProvider.get_stacks")
-    @patch("samcli.commands.deploy.guided_context.signer_config_per_function")
-    @patch("samcli.commands.deploy.guided_context.get_template_artifacts_format")
-    @patch("samcli.commands.deploy.guided_context.SamFunctionProvider")
     def test_guided_prompts_with_code_signing(
-        self,
-        given_sign_packages_flag,
-        given_code_signing_configs,
-        patched_sam_function_provider,
-        patched_get_template_artifacts_format,
-        patched_signer_config_per_function,
-        patched_get_buildable_stacks,
-        patchedauth_per_resource,
-        patched_manage_stack,
-        patched_code_signer_prompt,
-        patched_confirm,
-        patched_prompt,
+        self, given_sign_packages_flag, given_code_signing_configs, patched_code_signer_prompt
     ):
-        # given_sign_packages_flag = True
-        # given_code_signing_configs = ({"MyFunction1"}, {"MyLayer1": {"MyFunction1"}, "MyLayer2": {"MyFunction1"}})
-        patched_sam_function_provider.return_value = {}
-        patched_get_template_artifacts_format.return_value = [ZIP]
-        patched_signer_config_per_function.return_value = given_code_signing_configs
-        patched_get_buildable_stacks.return_value = (Mock(), [])
+        self.patched_sam_function_provider.return_value = {}
+        self.patched_get_template_artifacts_format.return_value = [ZIP]
+        self.patched_get_buildable_stacks.return_value = (Mock(), [])
+        self.patched_signer_config_per_function.return_value = given_code_signing_configs
         # Series of inputs to confirmations so that full range of questions are asked.
-        patched_confirm.side_effect = [True, False, given_sign_packages_flag, "", True]
+        self.patched_confirm.side_effect = (True, False, given_sign_packages_flag, "", True)
         self.gc.guided_prompts(parameter_override_keys=None)
         # Now to check for all the defaults on confirmations.
-        expected_confirmation_calls = [
-            call(f"\t{self.gc.start_bold}Confirm changes before deploy{self.gc.end_bold}", default=True),
-            call(f"\t{self.gc.start_bold}Allow SAM CLI IAM role creation{self.gc.end_bold}", default=True),
+        expected_confirmation_calls = list(BASE_CONFIRMATION_CALLS) + [
             call(
-                f"\t{self.gc.start_bold}Do you want to sign your code?{self.gc.end_bold}",
+                _label("Do you want to sign your code?"),
                 default=True,
             ),
-            call(f"\t{self.gc.start_bold}Save arguments to configuration file{self.gc.end_bold}", default=True),
+            call(SAVE_ARGUMENTS_LABEL, default=True),
         ]
-        self.assertEqual(expected_confirmation_calls, patched_confirm.call_args_list)
+        self.assertEqual(expected_confirmation_calls, self.patched_confirm.call_args_list)
 
         # Now to check for all the defaults on prompts.
-        expected_prompt_calls = [
-            call(f"\t{self.gc.start_bold}Stack Name{self.gc.end_bold}", default="test", type=click.STRING),
-            call(f"\t{self.gc.start_bold}AWS Region{self.gc.end_bold}", default="region", type=click.STRING),
-            call(f"\t{self.gc.start_bold}Capabilities{self.gc.end_bold}", default=["CAPABILITY_IAM"], type=ANY),
+        expected_prompt_calls = list(BASE_PROMPT_CALLS) + [
+            call(CAPABILITIES_LABEL, default=["CAPABILITY_IAM"], type=ANY),
         ]
-        self.assertEqual(expected_prompt_calls, patched_prompt.call_args_list)
+        self.assertEqual(expected_prompt_calls, self.patched_prompt.call_args_list)
 
         if given_sign_packages_flag:
             # we are going to expect prompts for functions and layers for each one of them,
@@ -652,9 +411,13 @@ class TestGuidedContext(TestCase):
             number_of_functions = len(given_code_signing_configs[0])
             number_of_layers = len(given_code_signing_configs[1])
             expected_code_sign_calls = [
-                call(f"\t{self.gc.start_bold}Signing Profile Name{self.gc.end_bold}", default=None, type=click.STRING),
                 call(
-                    f"\t{self.gc.start_bold}Signing Profile Owner Account ID (optional){self.gc.end_bold}",
+                    _label("Signing Profile Name"),
+                    default=None,
+                    type=click.STRING,
+                ),
+                call(
+                    _label("Signing Profile Owner Account ID (optional)"),
                     default="",
                     type=click.STRING,
                     show_default=False,
@@ -664,67 +427,44 @@ class TestGuidedContext(TestCase):
             self.assertEqual(expected_code_sign_calls, patched_code_signer_prompt.call_args_list)
 
     @patch("samcli.commands.deploy.guided_context.get_session")
-    @patch("samcli.commands.deploy.guided_context.prompt")
-    @patch("samcli.commands.deploy.guided_context.confirm")
-    @patch("samcli.commands.deploy.guided_context.manage_stack")
-    @patch("samcli.commands.deploy.guided_context.auth_per_resource")
-    @patch("samcli.commands.deploy.guided_context.SamLocalStackProvider.get_stacks")
-    @patch("samcli.commands.deploy.guided_context.get_template_artifacts_format")
-    @patch("samcli.commands.deploy.guided_context.SamFunctionProvider")
-    @patch("samcli.commands.deploy.guided_context.signer_config_per_function")
-    def test_guided_prompts_check_default_config_region(
-        self,
-        patched_signer_config_per_function,
-        patched_sam_function_provider,
-        patched_get_template_artifacts_format,
-        patched_get_buildable_stacks,
-        patchedauth_per_resource,
-        patched_manage_stack,
-        patched_confirm,
-        patched_prompt,
-        patched_get_session,
-    ):
-        patched_sam_function_provider.return_value = {}
-        patched_get_template_artifacts_format.return_value = [ZIP]
-        patched_get_buildable_stacks.return_value = (Mock(), [])
+    def test_guided_prompts_check_default_config_region(self, patched_get_session):
+        self.patched_sam_function_provider.return_value = {}
+        self.patched_get_template_artifacts_format.return_value = [ZIP]
+        self.patched_get_buildable_stacks.return_value = (Mock(), [])
         # Series of inputs to confirmations so that full range of questions are asked.
-        patchedauth_per_resource.return_value = [("HelloWorldFunction", False)]
-        patched_confirm.side_effect = [True, False, True, True, ""]
-        patched_signer_config_per_function.return_value = ({}, {})
-        patched_manage_stack.return_value = "managed_s3_stack"
+        self.patched_auth_per_resource.return_value = [("HelloWorldFunction", False)]
+        self.patched_confirm.side_effect = (True, False, True, True, "")
         patched_get_session.return_value.get_config_variable.return_value = "default_config_region"
         # setting the default region to None
         self.gc.region = None
         self.gc.guided_prompts(parameter_override_keys=None)
         # Now to check for all the defaults on confirmations.
-        expected_confirmation_calls = [
-            call(f"\t{self.gc.start_bold}Confirm changes before deploy{self.gc.end_bold}", default=True),
-            call(f"\t{self.gc.start_bold}Allow SAM CLI IAM role creation{self.gc.end_bold}", default=True),
+        expected_confirmation_calls = list(BASE_CONFIRMATION_CALLS) + [
             call(
-                f"\t{self.gc.start_bold}HelloWorldFunction may not have authorization defined, Is this okay?{self.gc.end_bold}",
+                AUTHORIZATION_LABEL,
                 default=False,
             ),
-            call(f"\t{self.gc.start_bold}Save arguments to configuration file{self.gc.end_bold}", default=True),
+            call(SAVE_ARGUMENTS_LABEL, default=True),
         ]
-        self.assertEqual(expected_confirmation_calls, patched_confirm.call_args_list)
+        self.assertEqual(expected_confirmation_calls, self.patched_confirm.call_args_list)
 
         expected_prompt_calls = [
-            call(f"\t{self.gc.start_bold}Stack Name{self.gc.end_bold}", default="test", type=click.STRING),
+            call(STACK_NAME_LABEL, default="test", type=click.STRING),
             call(
-                f"\t{self.gc.start_bold}AWS Region{self.gc.end_bold}",
+                REGION_LABEL,
                 default="default_config_region",
                 type=click.STRING,
             ),
-            call(f"\t{self.gc.start_bold}Capabilities{self.gc.end_bold}", default=["CAPABILITY_IAM"], type=ANY),
+            call(CAPABILITIES_LABEL, default=["CAPABILITY_IAM"], type=ANY),
             call(
-                f"\t{self.gc.start_bold}SAM configuration file{self.gc.end_bold}",
+                _label("SAM configuration file"),
                 default="samconfig.toml",
                 type=click.STRING,
             ),
             call(
-                f"\t{self.gc.start_bold}SAM configuration environment{self.gc.end_bold}",
+                _label("SAM configuration environment"),
                 default="default",
                 type=click.STRING,
             ),
         ]
-        self.assertEqual(expected_prompt_calls, patched_prompt.call_args_list)
+        self.assertEqual(expected_prompt_calls, self.patched_prompt.call_args_list)
@@ -534,7 +534,9 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             self.assertEqual(result, runner_mock)
 
             LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
-            lambda_image_patch.assert_called_once_with(download_mock, True, True)
+            lambda_image_patch.assert_called_once_with(
+                download_mock, True, True, docker_client=container_manager_mock.docker_client
+            )
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
                 function_provider=ANY,
@@ -607,7 +609,9 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             self.assertEqual(result, runner_mock)
 
             WarmLambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
-            lambda_image_patch.assert_called_once_with(download_mock, True, True)
+            lambda_image_patch.assert_called_once_with(
+                download_mock, True, True, docker_client=container_manager_mock.docker_client
+            )
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
                 function_provider=ANY,
@@ -681,7 +685,9 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             self.assertEqual(result, runner_mock)
 
             LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
-            lambda_image_patch.assert_called_once_with(download_mock, True, True)
+            lambda_image_patch.assert_called_once_with(
+                download_mock, True, True, docker_client=container_manager_mock.docker_client
+            )
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
                 function_provider=ANY,
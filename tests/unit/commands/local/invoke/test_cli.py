@@ -4,6 +4,8 @@ Tests Local Invoke CLI
 
 from unittest import TestCase
 from unittest.mock import patch, Mock
+
+import pytest
 from parameterized import parameterized, param
 
 from samcli.local.docker.exceptions import ContainerNotStartableException
@@ -44,87 +46,24 @@ class TestCli(TestCase):
         self.container_host = "localhost"
         self.container_host_interface = "127.0.0.1"
 
-    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
-    @patch("samcli.commands.local.invoke.cli._get_event")
-    def test_cli_must_setup_context_and_invoke(self, get_event_mock, InvokeContextMock):
-        event_data = "data"
-        get_event_mock.return_value = event_data
-
-        ctx_mock = Mock()
-        ctx_mock.region = self.region_name
-        ctx_mock.profile = self.profile
+        self.event_data = "data"
+        self.get_event_mock = self._start_patch("samcli.commands.local.invoke.cli._get_event")
+        self.get_event_mock.return_value = self.event_data
 
+        self.invoke_context_mock = self._start_patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
         # Mock the __enter__ method to return a object inside a context manager
-        context_mock = Mock()
-        InvokeContextMock.return_value.__enter__.return_value = context_mock
-
-        invoke_cli(
-            ctx=ctx_mock,
-            function_identifier=self.function_id,
-            template=self.template,
-            event=self.eventfile,
-            no_event=self.no_event,
-            env_vars=self.env_vars,
-            debug_port=self.debug_ports,
-            debug_args=self.debug_args,
-            debugger_path=self.debugger_path,
-            container_env_vars=self.container_env_vars,
-            docker_volume_basedir=self.docker_volume_basedir,
-            docker_network=self.docker_network,
-            log_file=self.log_file,
-            skip_pull_image=self.skip_pull_image,
-            parameter_overrides=self.parameter_overrides,
-            layer_cache_basedir=self.layer_cache_basedir,
-            force_image_build=self.force_image_build,
-            shutdown=self.shutdown,
-            container_host=self.container_host,
-            container_host_interface=self.container_host_interface,
-        )
-
-        InvokeContextMock.assert_called_with(
-            template_file=self.template,
-            function_identifier=self.function_id,
-            env_vars_file=self.env_vars,
-            docker_volume_basedir=self.docker_volume_basedir,
-            docker_network=self.docker_network,
-            log_file=self.log_file,
-            skip_pull_image=self.skip_pull_image,
-            debug_ports=self.debug_ports,
-            debug_args=self.debug_args,
-            debugger_path=self.debugger_path,
-            container_env_vars_file=self.container_env_vars,
-            parameter_overrides=self.parameter_overrides,
-            layer_cache_basedir=self.layer_cache_basedir,
-            force_image_build=self.force_image_build,
-            shutdown=self.shutdown,
-            aws_region=self.region_name,
-            aws_profile=self.profile,
-            container_host=self.container_host,
-            container_host_interface=self.container_host_interface,
-        )
+        self.context_mock = Mock()
+        self.invoke_context_mock.return_value.__enter__.return_value = self.context_mock
 
-        context_mock.local_lambda_runner.invoke.assert_called_with(
-            context_mock.function_identifier, event=event_data, stdout=context_mock.stdout, stderr=context_mock.stderr
-        )
-        get_event_mock.assert_called_with(self.eventfile)
+        self.ctx_mock = Mock()
+        self.ctx_mock.region = self.region_name
+        self.ctx_mock.profile = self.profile
 
-    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
-    @patch("samcli.commands.local.invoke.cli._get_event")
-    def test_cli_must_invoke_with_no_event(self, get_event_mock, InvokeContextMock):
-        self.event = None
-
-        ctx_mock = Mock()
-        ctx_mock.region = self.region_name
-        ctx_mock.profile = self.profile
-
-        # Mock the __enter__ method to return a object inside a context manager
-        context_mock = Mock()
-        InvokeContextMock.return_value.__enter__.return_value = context_mock
-        invoke_cli(
-            ctx=ctx_mock,
+        # Arguments of every do_cli call, and the InvokeContext arguments they translate to
+        self.invoke_kwargs = dict(
             function_identifier=self.function_id,
             template=self.template,
-            event=self.event,
+            event=self.eventfile,
             no_event=self.no_event,
             env_vars=self.env_vars,
             debug_port=self.debug_ports,
@@ -142,8 +81,7 @@ class TestCli(TestCase):
             container_host=self.container_host,
             container_host_interface=self.container_host_interface,
         )
-
-        InvokeContextMock.assert_called_with(
+        self.expected_context_kwargs = dict(
             template_file=self.template,
             function_identifier=self.function_id,
             env_vars_file=self.env_vars,
@@ -165,268 +103,78 @@ class TestCli(TestCase):
             container_host_interface=self.container_host_interface,
         )
 
-        get_event_mock.assert_not_called()
-        context_mock.local_lambda_runner.invoke.assert_called_with(
-            context_mock.function_identifier, event="{}", stdout=context_mock.stdout, stderr=context_mock.stderr
-        )
+    def _start_patch(self, target):
+        patcher = patch(target)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
 
     @parameterized.expand(
         [
-            param(FunctionNotFound("not found"), "Function id not found in template"),
-            param(DockerImagePullFailedException("Failed to pull image"), "Failed to pull image"),
+            param("eventfile", "data"),
+            param(STDIN_FILE_NAME, "data"),
+            # Without an event file the function is invoked with an empty JSON event
+            param(None, "{}"),
         ]
     )
-    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
-    @patch("samcli.commands.local.invoke.cli._get_event")
-    def test_must_raise_user_exception_on_function_not_found(
-        self, side_effect_exception, expected_exectpion_message, get_event_mock, InvokeContextMock
-    ):
-        event_data = "data"
-        get_event_mock.return_value = event_data
-
-        ctx_mock = Mock()
-        ctx_mock.region = self.region_name
-        ctx_mock.profile = self.profile
+    def test_cli_must_setup_context_and_invoke(self, event, expected_event_data):
+        self.invoke_kwargs["event"] = event
+        invoke_cli(ctx=self.ctx_mock, **self.invoke_kwargs)
 
-        # Mock the __enter__ method to return a object inside a context manager
-        context_mock = Mock()
-        InvokeContextMock.return_value.__enter__.return_value = context_mock
-
-        context_mock.local_lambda_runner.invoke.side_effect = side_effect_exception
-
-        with self.assertRaises(UserException) as ex_ctx:
+        self.invoke_context_mock.assert_called_with(**self.expected_context_kwargs)
 
-            invoke_cli(
-                ctx=ctx_mock,
-                function_identifier=self.function_id,
-                template=self.template,
-                event=self.eventfile,
-                no_event=self.no_event,
-                env_vars=self.env_vars,
-                debug_port=self.debug_ports,
-                debug_args=self.debug_args,
-                debugger_path=self.debugger_path,
-                container_env_vars=self.container_env_vars,
-                docker_volume_basedir=self.docker_volume_basedir,
-                docker_network=self.docker_network,
-                log_file=self.log_file,
-                skip_pull_image=self.skip_pull_image,
-                parameter_overrides=self.parameter_overrides,
-                layer_cache_basedir=self.layer_cache_basedir,
-                force_image_build=self.force_image_build,
-                shutdown=self.shutdown,
-                container_host=self.container_host,
-                container_host_interface=self.container_host_interface,
-            )
-
-        msg = str(ex_ctx.exception)
-        self.assertEqual(msg, expected_exectpion_message)
+        self.context_mock.local_lambda_runner.invoke.assert_called_with(
+            self.context_mock.function_identifier,
+            event=expected_event_data,
+            stdout=self.context_mock.stdout,
+            stderr=self.context_mock.stderr,
+        )
+        if event:
+            self.get_event_mock.assert_called_with(event)
+        else:
+            self.get_event_mock.assert_not_called()
 
     @parameterized.expand(
         [
+            # Errors raised while creating the InvokeContext
+            param(InvalidSamDocumentException("bad template"), "bad template", raised_by_context=True),
             param(
-                InvalidIntermediateImageError("ImageUri not set to a reference-able image for Function: MyFunction"),
-                "ImageUri not set to a reference-able image for Function: MyFunction",
-            ),
-        ]
-    )
-    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
-    @patch("samcli.commands.local.invoke.cli._get_event")
-    def test_must_raise_user_exception_on_function_local_invoke_image_not_found_for_IMAGE_packagetype(
-        self, side_effect_exception, expected_exectpion_message, get_event_mock, InvokeContextMock
-    ):
-        event_data = "data"
-        get_event_mock.return_value = event_data
-
-        ctx_mock = Mock()
-        ctx_mock.region = self.region_name
-        ctx_mock.profile = self.profile
-
-        # Mock the __enter__ method to return a object inside a context manager
-        context_mock = Mock()
-        InvokeContextMock.return_value.__enter__.return_value = context_mock
-
-        context_mock.local_lambda_runner.invoke.side_effect = side_effect_exception
-
-        with self.assertRaises(UserException) as ex_ctx:
-
-            invoke_cli(
-                ctx=ctx_mock,
-                function_identifier=self.function_id,
-                template=self.template,
-                event=self.eventfile,
-                no_event=self.no_event,
-                env_vars=self.env_vars,
-                debug_port=self.debug_ports,
-                debug_args=self.debug_args,
-                debugger_path=self.debugger_path,
-                container_env_vars=self.container_env_vars,
-                docker_volume_basedir=self.docker_volume_basedir,
-                docker_network=self.docker_network,
-                log_file=self.log_file,
-                skip_pull_image=self.skip_pull_image,
-                parameter_overrides=self.parameter_overrides,
-                layer_cache_basedir=self.layer_cache_basedir,
-                force_image_build=self.force_image_build,
-                shutdown=self.shutdown,
-                container_host=self.container_host,
-                container_host_interface=self.container_host_interface,
-            )
-
-        msg = str(ex_ctx.exception)
-        self.assertEqual(msg, expected_exectpion_message)
-
-    @parameterized.expand(
-        [
-            (InvalidSamDocumentException("bad template"), "bad template"),
-            (
                 InvalidLayerReference(),
                 "Layer References need to be of type " "'AWS::Serverless::LayerVersion' or 'AWS::Lambda::LayerVersion'",
+                raised_by_context=True,
+            ),
+            param(DebuggingNotSupported("Debugging not supported"), "Debugging not supported", raised_by_context=True),
+            param(OverridesNotWellDefinedError("bad env vars"), "bad env vars", raised_by_context=True),
+            # Errors raised while invoking the function
+            param(FunctionNotFound("not found"), "Function id not found in template"),
+            param(DockerImagePullFailedException("Failed to pull image"), "Failed to pull image"),
+            param(
+                InvalidIntermediateImageError("ImageUri not set to a reference-able image for Function: MyFunction"),
+                "ImageUri not set to a reference-able image for Function: MyFunction",
             ),
-            (DebuggingNotSupported("Debugging not supported"), "Debugging not supported"),
-        ]
-    )
-    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
-    @patch("samcli.commands.local.invoke.cli._get_event")
-    def test_must_raise_user_exception_on_invalid_sam_template(
-        self, exeception_to_raise, execption_message, get_event_mock, InvokeContextMock
-    ):
-        event_data = "data"
-        get_event_mock.return_value = event_data
-
-        ctx_mock = Mock()
-        ctx_mock.region = self.region_name
-        ctx_mock.profile = self.profile
-
-        InvokeContextMock.side_effect = exeception_to_raise
-
-        with self.assertRaises(UserException) as ex_ctx:
-
-            invoke_cli(
-                ctx=ctx_mock,
-                function_identifier=self.function_id,
-                template=self.template,
-                event=self.eventfile,
-                no_event=self.no_event,
-                env_vars=self.env_vars,
-                debug_port=self.debug_ports,
-                debug_args=self.debug_args,
-                debugger_path=self.debugger_path,
-                container_env_vars=self.container_env_vars,
-                docker_volume_basedir=self.docker_volume_basedir,
-                docker_network=self.docker_network,
-                log_file=self.log_file,
-                skip_pull_image=self.skip_pull_image,
-                parameter_overrides=self.parameter_overrides,
-                layer_cache_basedir=self.layer_cache_basedir,
-                force_image_build=self.force_image_build,
-                shutdown=self.shutdown,
-                container_host=self.container_host,
-                container_host_interface=self.container_host_interface,
-            )
-
-        msg = str(ex_ctx.exception)
-        self.assertEqual(msg, execption_message)
-
-    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
-    @patch("samcli.commands.local.invoke.cli._get_event")
-    def test_must_raise_user_exception_on_invalid_env_vars(self, get_event_mock, InvokeContextMock):
-        event_data = "data"
-        get_event_mock.return_value = event_data
-
-        ctx_mock = Mock()
-        ctx_mock.region = self.region_name
-        ctx_mock.profile = self.profile
-
-        InvokeContextMock.side_effect = OverridesNotWellDefinedError("bad env vars")
-
-        with self.assertRaises(UserException) as ex_ctx:
-
-            invoke_cli(
-                ctx=ctx_mock,
-                function_identifier=self.function_id,
-                template=self.template,
-                event=self.eventfile,
-                no_event=self.no_event,
-                env_vars=self.env_vars,
-                debug_port=self.debug_ports,
-                debug_args=self.debug_args,
-                debugger_path=self.debugger_path,
-                container_env_vars=self.container_env_vars,
-                docker_volume_basedir=self.docker_volume_basedir,
-                docker_network=self.docker_network,
-                log_file=self.log_file,
-                skip_pull_image=self.skip_pull_image,
-                parameter_overrides=self.parameter_overrides,
-                layer_cache_basedir=self.layer_cache_basedir,
-                force_image_build=self.force_image_build,
-                shutdown=self.shutdown,
-                container_host=self.container_host,
-                container_host_interface=self.container_host_interface,
-            )
-
-        msg = str(ex_ctx.exception)
-        self.assertEqual(msg, "bad env vars")
-
-    @parameterized.expand(
-        [
             param(
                 ContainerNotStartableException("Container cannot be started, no free ports on host"),
                 "Container cannot be started, no free ports on host",
             ),
         ]
     )
-    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
-    @patch("samcli.commands.local.invoke.cli._get_event")
-    def test_must_raise_user_exception_on_function_no_free_ports(
-        self, side_effect_exception, expected_exectpion_message, get_event_mock, InvokeContextMock
-    ):
-        event_data = "data"
-        get_event_mock.return_value = event_data
-
-        ctx_mock = Mock()
-        ctx_mock.region = self.region_name
-        ctx_mock.profile = self.profile
-
-        # Mock the __enter__ method to return a object inside a context manager
-        context_mock = Mock()
-        InvokeContextMock.return_value.__enter__.return_value = context_mock
-
-        context_mock.local_lambda_runner.invoke.side_effect = side_effect_exception
+    def test_must_raise_user_exception(self, exception_to_raise, expected_exception_message, raised_by_context=False):
+        if raised_by_context:
+            self.invoke_context_mock.side_effect = exception_to_raise
+        else:
+            self.context_mock.local_lambda_runner.invoke.side_effect = exception_to_raise
 
         with self.assertRaises(UserException) as ex_ctx:
 
-            invoke_cli(
-                ctx=ctx_mock,
-                function_identifier=self.function_id,
-                template=self.template,
-                event=self.eventfile,
-                no_event=self.no_event,
-                env_vars=self.env_vars,
-                debug_port=self.debug_ports,
-                debug_args=self.debug_args,
-                debugger_path=self.debugger_path,
-                container_env_vars=self.container_env_vars,
-                docker_volume_basedir=self.docker_volume_basedir,
-                docker_network=self.docker_network,
-                log_file=self.log_file,
-                skip_pull_image=self.skip_pull_image,
-                parameter_overrides=self.parameter_overrides,
-                layer_cache_basedir=self.layer_cache_basedir,
-                force_image_build=self.force_image_build,
-                shutdown=self.shutdown,
-                container_host=self.container_host,
-                container_host_interface=self.container_host_interface,
-            )
+            invoke_cli(ctx=self.ctx_mock, **self.invoke_kwargs)
 
         msg = str(ex_ctx.exception)
-        self.assertEqual(msg, expected_exectpion_message)
+        self.assertEqual(msg, expected_exception_message)
 
 
-class TestGetEvent(TestCase):
-    @parameterized.expand([param(STDIN_FILE_NAME), param("somefile")])
+@pytest.mark.parametrize("filename", [STDIN_FILE_NAME, "somefile"])
+class TestGetEvent:
     @patch("samcli.commands.local.invoke.cli.click")
-    def test_must_work_with_stdin(self, filename, click_mock):
+    def test_must_work_with_stdin(self, click_mock, filename):
         event_data = "some data"
 
         # Mock file pointer
@@ -438,5 +186,5 @@ class TestGetEvent(TestCase):
 
         result = invoke_cli_get_event(filename)
 
-        self.assertEqual(result, event_data)
+        assert result == event_data
         fp_mock.read.assert_called_with()
@@ -12,11 +12,20 @@ from samcli.lib.providers.cfn_api_provider import CfnApiProvider
 
 
 class TestApiProvider_init(TestCase):
-    @patch.object(ApiProvider, "_extract_api")
-    def test_provider_with_valid_template(self, extract_api_mock):
-        extract_api_mock.return_value = Api(routes={"set", "of", "values"})
-        template = {"Resources": {"a": "b"}}
-        stack_mock = Mock(template_dict=template, resources=template["Resources"])
+    @classmethod
+    def setUpClass(cls):
+        cls.template = {"Resources": {"a": "b"}}
+        cls.extract_api_patcher = patch.object(
+            ApiProvider, "_extract_api", return_value=Api(routes={"set", "of", "values"})
+        )
+        cls.extract_api_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.extract_api_patcher.stop()
+
+    def test_provider_with_valid_template(self):
+        stack_mock = Mock(template_dict=self.template, resources=self.template["Resources"])
 
         provider = ApiProvider([stack_mock])
         self.assertEqual(len(provider.routes), 3)
@@ -24,179 +33,52 @@ class TestApiProvider_init(TestCase):
 
 
 class TestApiProviderSelection(TestCase):
-    def make_mock_stacks_with_resources(self, resources):
-        stack_mock = Mock(resources=resources)
-        return [stack_mock]
-
-    def test_default_provider(self):
-        resources = {
-            "TestApi": {
-                "Type": "AWS::UNKNOWN_TYPE",
-                "Properties": {
-                    "StageName": "dev",
-                    "DefinitionBody": {
-                        "paths": {
-                            "/path": {
-                                "get": {
-                                    "x-amazon-apigateway-integration": {
-                                        "httpMethod": "POST",
-                                        "type": "aws_proxy",
-                                        "uri": {
-                                            "Fn::Sub": "arn:aws:apigateway:${AWS::Region}:lambda:path/2015-03-31"
-                                            "/functions/${NoApiEventFunction.Arn}/invocations"
-                                        },
-                                        "responses": {},
-                                    }
-                                }
-                            }
+    @classmethod
+    def setUpClass(cls):
+        # find_api_provider only inspects resource types, so every test can share one definition body
+        cls._definition_body = {
+            "paths": {
+                "/path": {
+                    "get": {
+                        "x-amazon-apigateway-integration": {
+                            "httpMethod": "POST",
+                            "type": "aws_proxy",
+                            "uri": {
+                                "Fn::Sub": "arn:aws:apigateway:${AWS::Region}:lambda:path/2015-03-31"
+                                "/functions/${NoApiEventFunction.Arn}/invocations"
+                            },
+                            "responses": {},
                         }
-                    },
-                },
-            }
-        }
-
-        provider = ApiProvider.find_api_provider(self.make_mock_stacks_with_resources(resources))
-        self.assertTrue(isinstance(provider, SamApiProvider))
-
-    def test_api_provider_sam_api(self):
-        resources = {
-            "TestApi": {
-                "Type": "AWS::Serverless::Api",
-                "Properties": {
-                    "StageName": "dev",
-                    "DefinitionBody": {
-                        "paths": {
-                            "/path": {
-                                "get": {
-                                    "x-amazon-apigateway-integration": {
-                                        "httpMethod": "POST",
-                                        "type": "aws_proxy",
-                                        "uri": {
-                                            "Fn::Sub": "arn:aws:apigateway:${AWS::Region}:lambda:path/2015-03-31"
-                                            "/functions/${NoApiEventFunction.Arn}/invocations"
-                                        },
-                                        "responses": {},
-                                    }
-                                }
-                            }
-                        }
-                    },
-                },
+                    }
+                }
             }
         }
 
-        provider = ApiProvider.find_api_provider(self.make_mock_stacks_with_resources(resources))
-        self.assertTrue(isinstance(provider, SamApiProvider))
-
-    def test_api_provider_sam_function(self):
-        resources = {
-            "TestApi": {
-                "Type": "AWS::Serverless::Function",
-                "Properties": {
-                    "StageName": "dev",
-                    "DefinitionBody": {
-                        "paths": {
-                            "/path": {
-                                "get": {
-                                    "x-amazon-apigateway-integration": {
-                                        "httpMethod": "POST",
-                                        "type": "aws_proxy",
-                                        "uri": {
-                                            "Fn::Sub": "arn:aws:apigateway:${AWS::Region}:lambda:path/2015-03-31"
-                                            "/functions/${NoApiEventFunction.Arn}/invocations"
-                                        },
-                                        "responses": {},
-                                    }
-                                }
-                            }
-                        }
-                    },
-                },
-            }
-        }
+    def make_mock_stacks_with_resources(self, resources):
+        stack_mock = Mock(resources=resources)
+        return [stack_mock]
 
-        provider = ApiProvider.find_api_provider(self.make_mock_stacks_with_resources(resources))
+    def make_resource(self, type_name, body_key="DefinitionBody"):
+        return {"Type": type_name, "Properties": {"StageName": "dev", body_key: self._definition_body}}
 
-        self.assertTrue(isinstance(provider, SamApiProvider))
-
-    def test_api_provider_cloud_formation(self):
-        resources = {
-            "TestApi": {
-                "Type": "AWS::ApiGateway::RestApi",
-                "Properties": {
-                    "StageName": "dev",
-                    "Body": {
-                        "paths": {
-                            "/path": {
-                                "get": {
-                                    "x-amazon-apigateway-integration": {
-                                        "httpMethod": "POST",
-                                        "type": "aws_proxy",
-                                        "uri": {
-                                            "Fn::Sub": "arn:aws:apigateway:${AWS::Region}:lambda:path/2015-03-31"
-                                            "/functions/${NoApiEventFunction.Arn}/invocations"
-                                        },
-                                        "responses": {},
-                                    }
-                                }
-                            }
-                        }
-                    },
-                },
-            }
-        }
+    @parameterized.expand(
+        [
+            ("AWS::UNKNOWN_TYPE", "DefinitionBody", SamApiProvider),
+            ("AWS::Serverless::Api", "DefinitionBody", SamApiProvider),
+            ("AWS::Serverless::Function", "DefinitionBody", SamApiProvider),
+            ("AWS::ApiGateway::RestApi", "Body", CfnApiProvider),
+        ]
+    )
+    def test_provider_selection(self, type_name, body_key, expected_provider_class):
+        resources = {"TestApi": self.make_resource(type_name, body_key)}
 
         provider = ApiProvider.find_api_provider(self.make_mock_stacks_with_resources(resources))
-        self.assertTrue(isinstance(provider, CfnApiProvider))
+        self.assertIsInstance(provider, expected_provider_class)
 
     def test_multiple_api_provider_cloud_formation(self):
         resources = OrderedDict()
-        resources["TestApi"] = {
-            "Type": "AWS::ApiGateway::RestApi",
-            "Properties": {
-                "StageName": "dev",
-                "Body": {
-                    "paths": {
-                        "/path": {
-                            "get": {
-                                "x-amazon-apigateway-integration": {
-                                    "httpMethod": "POST",
-                                    "type": "aws_proxy",
-                                    "uri": {
-                                        "Fn::Sub": "arn:aws:apigateway:${AWS::Region}:lambda:path/2015-03-31"
-                                        "/functions/${NoApiEventFunction.Arn}/invocations"
-                                    },
-                                    "responses": {},
-                                }
-                            }
-                        }
-                    }
-                },
-            },
-        }
-        resources["OtherApi"] = {
-            "Type": "AWS::Serverless::Api",
-            "Properties": {
-                "StageName": "dev",
-                "DefinitionBody": {
-                    "paths": {
-                        "/path": {
-                            "get": {
-                                "x-amazon-apigateway-integration": {
-                                    "httpMethod": "POST",
-                                    "type": "aws_proxy",
-                                    "uri": {
-                                        "Fn::Sub": "arn:aws:apigateway:${AWS::Region}:lambda:path/2015-03-31"
-                                        "/functions/${NoApiEventFunction.Arn}/invocations"
-                                    },
-                                    "responses": {},
-                                }
-                            }
-                        }
-                    }
-                },
-            },
-        }
+        resources["TestApi"] = self.make_resource("AWS::ApiGateway::RestApi", "Body")
+        resources["OtherApi"] = self.make_resource("AWS::Serverless::Api")
 
         provider = ApiProvider.find_api_provider(self.make_mock_stacks_with_resources(resources))
         self.assertTrue(isinstance(provider, CfnApiProvider))
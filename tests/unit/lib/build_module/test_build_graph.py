@@ -1,8 +1,9 @@
+import tempfile
 from unittest import TestCase
+from unittest.mock import patch
 from uuid import uuid4
 from pathlib import Path
 
-import tomlkit
 from parameterized import parameterized
 
 from samcli.lib.build.build_graph import (
@@ -73,12 +74,16 @@ def generate_function(
     )
 
 
+# Function is an immutable NamedTuple, so tests that only need a default function can share one instance
+DEFAULT_FUNCTION = generate_function()
+
+
 class TestConversionFunctions(TestCase):
     def test_function_build_definition_to_toml_table(self):
         build_definition = FunctionBuildDefinition(
             "runtime", "codeuri", ZIP, {"key": "value"}, "source_md5", env_vars={"env_vars": "value1"}
         )
-        build_definition.add_function(generate_function())
+        build_definition.add_function(DEFAULT_FUNCTION)
 
         toml_table = _function_build_definition_to_toml_table(build_definition)
 
@@ -92,7 +97,7 @@ class TestConversionFunctions(TestCase):
 
     def test_layer_build_definition_to_toml_table(self):
         build_definition = LayerBuildDefinition("name", "codeuri", "method", "runtime", env_vars={"env_vars": "value"})
-        build_definition.layer = generate_function()
+        build_definition.layer = DEFAULT_FUNCTION
 
         toml_table = _layer_build_definition_to_toml_table(build_definition)
 
@@ -105,14 +110,16 @@ class TestConversionFunctions(TestCase):
         self.assertEqual(toml_table[ENV_VARS_FIELD], build_definition.env_vars)
 
     def test_toml_table_to_function_build_definition(self):
-        toml_table = tomlkit.table()
-        toml_table[CODE_URI_FIELD] = "codeuri"
-        toml_table[RUNTIME_FIELD] = "runtime"
-        toml_table[PACKAGETYPE_FIELD] = ZIP
-        toml_table[METADATA_FIELD] = {"key": "value"}
-        toml_table[FUNCTIONS_FIELD] = ["function1"]
-        toml_table[SOURCE_MD5_FIELD] = "source_md5"
-        toml_table[ENV_VARS_FIELD] = {"env_vars": "value"}
+        # the conversion only reads through the mapping interface, so a plain dict stands in for the toml table
+        toml_table = {
+            CODE_URI_FIELD: "codeuri",
+            RUNTIME_FIELD: "runtime",
+            PACKAGETYPE_FIELD: ZIP,
+            METADATA_FIELD: {"key": "value"},
+            FUNCTIONS_FIELD: ["function1"],
+            SOURCE_MD5_FIELD: "source_md5",
+            ENV_VARS_FIELD: {"env_vars": "value"},
+        }
         uuid = str(uuid4())
 
         build_definition = _toml_table_to_function_build_definition(uuid, toml_table)
@@ -127,14 +134,14 @@ class TestConversionFunctions(TestCase):
         self.assertEqual(build_definition.env_vars, toml_table[ENV_VARS_FIELD])
 
     def test_toml_table_to_layer_build_definition(self):
-        toml_table = tomlkit.table()
-        toml_table[LAYER_NAME_FIELD] = "name"
-        toml_table[CODE_URI_FIELD] = "codeuri"
-        toml_table[BUILD_METHOD_FIELD] = "method"
-        toml_table[COMPATIBLE_RUNTIMES_FIELD] = "runtime"
-        toml_table[COMPATIBLE_RUNTIMES_FIELD] = "layer1"
-        toml_table[SOURCE_MD5_FIELD] = "source_md5"
-        toml_table[ENV_VARS_FIELD] = {"env_vars": "value"}
+        toml_table = {
+            LAYER_NAME_FIELD: "name",
+            CODE_URI_FIELD: "codeuri",
+            BUILD_METHOD_FIELD: "method",
+            COMPATIBLE_RUNTIMES_FIELD: "layer1",
+            SOURCE_MD5_FIELD: "source_md5",
+            ENV_VARS_FIELD: {"env_vars": "value"},
+        }
         uuid = str(uuid4())
 
         build_definition = _toml_table_to_layer_build_definition(uuid, toml_table)
@@ -185,107 +192,112 @@ class TestBuildGraph(TestCase):
     env_vars = "{ENV_VARS['env_vars']}"
     """
 
+    @classmethod
+    def setUpClass(cls):
+        # One scratch directory for the class, every test builds in its own sub directory of it
+        cls._temp_base_dir_context = osutils.mkdir_temp()
+        cls.temp_base_dir = cls._temp_base_dir_context.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._temp_base_dir_context.__exit__(None, None, None)
+
+    def _create_build_dir(self):
+        build_dir = Path(tempfile.mkdtemp(dir=self.temp_base_dir), ".aws-sam", "build")
+        build_dir.mkdir(parents=True)
+        return build_dir
+
+    def _read_build_graph_contents(self):
+        # Build graphs which are only read get the build.toml contents from memory, without touching the disk
+        with patch.object(Path, "read_text", return_value=TestBuildGraph.BUILD_GRAPH_CONTENTS) as read_text_mock:
+            build_graph = BuildGraph(str(Path("build_base_dir", ".aws-sam", "build")))
+        read_text_mock.assert_called_once_with()
+        return build_graph
+
     def test_should_instantiate_first_time(self):
-        with osutils.mkdir_temp() as temp_base_dir:
-            build_dir = Path(temp_base_dir, ".aws-sam", "build")
-            build_dir.mkdir(parents=True)
-            build_graph1 = BuildGraph(str(build_dir.resolve()))
-            build_graph1.clean_redundant_definitions_and_update(True)
+        build_dir = self._create_build_dir()
+        build_graph1 = BuildGraph(str(build_dir.resolve()))
+        build_graph1.clean_redundant_definitions_and_update(True)
 
-            build_graph2 = BuildGraph(str(build_dir.resolve()))
+        build_graph2 = BuildGraph(str(build_dir.resolve()))
 
-            self.assertEqual(
-                build_graph1.get_function_build_definitions(), build_graph2.get_function_build_definitions()
-            )
+        self.assertEqual(build_graph1.get_function_build_definitions(), build_graph2.get_function_build_definitions())
 
     def test_should_instantiate_first_time_and_update(self):
-        with osutils.mkdir_temp() as temp_base_dir:
-            build_dir = Path(temp_base_dir, ".aws-sam", "build")
-            build_dir.mkdir(parents=True)
-
-            # create a build graph and persist it
-            build_graph1 = BuildGraph(str(build_dir))
-            build_definition1 = FunctionBuildDefinition(
-                TestBuildGraph.RUNTIME,
-                TestBuildGraph.CODEURI,
-                TestBuildGraph.ZIP,
-                TestBuildGraph.METADATA,
-                TestBuildGraph.SOURCE_MD5,
-                TestBuildGraph.ENV_VARS,
-            )
-            function1 = generate_function(
-                runtime=TestBuildGraph.RUNTIME, codeuri=TestBuildGraph.CODEURI, metadata=TestBuildGraph.METADATA
-            )
-            build_graph1.put_function_build_definition(build_definition1, function1)
-            build_graph1.clean_redundant_definitions_and_update(True)
-
-            # read previously persisted graph and compare
-            build_graph2 = BuildGraph(str(build_dir))
-            self.assertEqual(
-                len(build_graph1.get_function_build_definitions()), len(build_graph2.get_function_build_definitions())
-            )
-            self.assertEqual(
-                list(build_graph1.get_function_build_definitions())[0],
-                list(build_graph2.get_function_build_definitions())[0],
-            )
+        build_dir = self._create_build_dir()
+
+        # create a build graph and persist it
+        build_graph1 = BuildGraph(str(build_dir))
+        build_definition1 = FunctionBuildDefinition(
+            TestBuildGraph.RUNTIME,
+            TestBuildGraph.CODEURI,
+            TestBuildGraph.ZIP,
+            TestBuildGraph.METADATA,
+            TestBuildGraph.SOURCE_MD5,
+            TestBuildGraph.ENV_VARS,
+        )
+        function1 = generate_function(
+            runtime=TestBuildGraph.RUNTIME, codeuri=TestBuildGraph.CODEURI, metadata=TestBuildGraph.METADATA
+        )
+        build_graph1.put_function_build_definition(build_definition1, function1)
+        build_graph1.clean_redundant_definitions_and_update(True)
+
+        # read previously persisted graph and compare
+        build_graph2 = BuildGraph(str(build_dir))
+        self.assertEqual(
+            len(build_graph1.get_function_build_definitions()), len(build_graph2.get_function_build_definitions())
+        )
+        self.assertEqual(
+            list(build_graph1.get_function_build_definitions())[0],
+            list(build_graph2.get_function_build_definitions())[0],
+        )
 
     def test_should_read_existing_build_graph(self):
-        with osutils.mkdir_temp() as temp_base_dir:
-            build_dir = Path(temp_base_dir, ".aws-sam", "build")
-            build_dir.mkdir(parents=True)
-
-            build_graph_path = Path(build_dir.parent, "build.toml")
-            build_graph_path.write_text(TestBuildGraph.BUILD_GRAPH_CONTENTS)
-
-            build_graph = BuildGraph(str(build_dir))
-            for build_definition in build_graph.get_function_build_definitions():
-                self.assertEqual(build_definition.codeuri, TestBuildGraph.CODEURI)
-                self.assertEqual(build_definition.runtime, TestBuildGraph.RUNTIME)
-                self.assertEqual(build_definition.packagetype, TestBuildGraph.ZIP)
-                self.assertEqual(build_definition.metadata, TestBuildGraph.METADATA)
-                self.assertEqual(build_definition.source_md5, TestBuildGraph.SOURCE_MD5)
-                self.assertEqual(build_definition.env_vars, TestBuildGraph.ENV_VARS)
+        build_graph = self._read_build_graph_contents()
+        build_definitions = list(build_graph.get_function_build_definitions())
+        self.assertEqual(len(build_definitions), 1)
+
+        build_definition = build_definitions[0]
+        self.assertEqual(build_definition.codeuri, TestBuildGraph.CODEURI)
+        self.assertEqual(build_definition.runtime, TestBuildGraph.RUNTIME)
+        self.assertEqual(build_definition.packagetype, TestBuildGraph.ZIP)
+        self.assertEqual(build_definition.metadata, TestBuildGraph.METADATA)
+        self.assertEqual(build_definition.source_md5, TestBuildGraph.SOURCE_MD5)
+        self.assertEqual(build_definition.env_vars, TestBuildGraph.ENV_VARS)
 
     def test_functions_should_be_added_existing_build_graph(self):
-        with osutils.mkdir_temp() as temp_base_dir:
-            build_dir = Path(temp_base_dir, ".aws-sam", "build")
-            build_dir.mkdir(parents=True)
-
-            build_graph_path = Path(build_dir.parent, "build.toml")
-            build_graph_path.write_text(TestBuildGraph.BUILD_GRAPH_CONTENTS)
-
-            build_graph = BuildGraph(str(build_dir))
-
-            build_definition1 = FunctionBuildDefinition(
-                TestBuildGraph.RUNTIME,
-                TestBuildGraph.CODEURI,
-                TestBuildGraph.ZIP,
-                TestBuildGraph.METADATA,
-                TestBuildGraph.SOURCE_MD5,
-                TestBuildGraph.ENV_VARS,
-            )
-            function1 = generate_function(
-                runtime=TestBuildGraph.RUNTIME, codeuri=TestBuildGraph.CODEURI, metadata=TestBuildGraph.METADATA
-            )
-            build_graph.put_function_build_definition(build_definition1, function1)
-
-            self.assertTrue(len(build_graph.get_function_build_definitions()), 1)
-            for build_definition in build_graph.get_function_build_definitions():
-                self.assertTrue(len(build_definition.functions), 1)
-                self.assertTrue(build_definition.functions[0], function1)
-                self.assertEqual(build_definition.uuid, TestBuildGraph.UUID)
-
-            build_definition2 = FunctionBuildDefinition(
-                "another_runtime",
-                "another_codeuri",
-                TestBuildGraph.ZIP,
-                None,
-                "another_source_md5",
-                {"env_vars": "value2"},
-            )
-            function2 = generate_function(name="another_function")
-            build_graph.put_function_build_definition(build_definition2, function2)
-            self.assertTrue(len(build_graph.get_function_build_definitions()), 2)
+        build_graph = self._read_build_graph_contents()
+
+        build_definition1 = FunctionBuildDefinition(
+            TestBuildGraph.RUNTIME,
+            TestBuildGraph.CODEURI,
+            TestBuildGraph.ZIP,
+            TestBuildGraph.METADATA,
+            TestBuildGraph.SOURCE_MD5,
+            TestBuildGraph.ENV_VARS,
+        )
+        function1 = generate_function(
+            runtime=TestBuildGraph.RUNTIME, codeuri=TestBuildGraph.CODEURI, metadata=TestBuildGraph.METADATA
+        )
+        build_graph.put_function_build_definition(build_definition1, function1)
+
+        self.assertTrue(len(build_graph.get_function_build_definitions()), 1)
+        for build_definition in build_graph.get_function_build_definitions():
+            self.assertTrue(len(build_definition.functions), 1)
+            self.assertTrue(build_definition.functions[0], function1)
+            self.assertEqual(build_definition.uuid, TestBuildGraph.UUID)
+
+        build_definition2 = FunctionBuildDefinition(
+            "another_runtime",
+            "another_codeuri",
+            TestBuildGraph.ZIP,
+            None,
+            "another_source_md5",
+            {"env_vars": "value2"},
+        )
+        function2 = generate_function(name="another_function")
+        build_graph.put_function_build_definition(build_definition2, function2)
+        self.assertTrue(len(build_graph.get_function_build_definitions()), 2)
 
 
 class TestBuildDefinition(TestCase):
@@ -293,7 +305,7 @@ class TestBuildDefinition(TestCase):
         build_definition = FunctionBuildDefinition(
             "runtime", "codeuri", ZIP, "metadata", "source_md5", {"env_vars": "value"}
         )
-        build_definition.add_function(generate_function())
+        build_definition.add_function(DEFAULT_FUNCTION)
 
         self.assertEqual(build_definition.get_handler_name(), "handler")
         self.assertEqual(build_definition.get_function_name(), "name")
@@ -324,54 +336,25 @@ class TestBuildDefinition(TestCase):
 
     @parameterized.expand(
         [
-            (
-                "runtime",
-                "codeuri",
-                ({"key": "value"}),
-                "source_md5",
-                "runtime",
-                "codeuri",
-                ({"key": "different_value"}),
-                "source_md5",
-            ),
-            (
-                "runtime",
-                "codeuri",
-                ({"key": "value"}),
-                "source_md5",
-                "different_runtime",
-                "codeuri",
-                ({"key": "value"}),
-                "source_md5",
-            ),
-            (
-                "runtime",
-                "codeuri",
-                ({"key": "value"}),
-                "source_md5",
-                "runtime",
-                "different_codeuri",
-                ({"key": "value"}),
-                "source_md5",
-            ),
+            ("metadata", {"key": "different_value"}, False),
+            ("runtime", "different_runtime", False),
+            ("codeuri", "different_codeuri", False),
             # custom build method with Makefile definition should always be identified as different
-            (
-                "runtime",
-                "codeuri",
-                ({"BuildMethod": "makefile"}),
-                "source_md5",
-                "runtime",
-                "codeuri",
-                ({"BuildMethod": "makefile"}),
-                "source_md5",
-            ),
+            ("metadata", {"BuildMethod": "makefile"}, True),
         ]
     )
-    def test_different_runtime_codeuri_metadata_should_not_reflect_as_same_object(
-        self, runtime1, codeuri1, metadata1, source_md5_1, runtime2, codeuri2, metadata2, source_md5_2
-    ):
-        build_definition1 = FunctionBuildDefinition(runtime1, codeuri1, ZIP, metadata1, source_md5_1)
-        build_definition2 = FunctionBuildDefinition(runtime2, codeuri2, ZIP, metadata2, source_md5_2)
+    def test_different_runtime_codeuri_metadata_should_not_reflect_as_same_object(self, field, value, override_both):
+        kwargs1 = {"runtime": "runtime", "codeuri": "codeuri", "metadata": {"key": "value"}}
+        if override_both:
+            kwargs1[field] = value
+        kwargs2 = {**kwargs1, field: value}
+
+        build_definition1 = FunctionBuildDefinition(
+            kwargs1["runtime"], kwargs1["codeuri"], ZIP, kwargs1["metadata"], "source_md5"
+        )
+        build_definition2 = FunctionBuildDefinition(
+            kwargs2["runtime"], kwargs2["codeuri"], ZIP, kwargs2["metadata"], "source_md5"
+        )
 
         self.assertNotEqual(build_definition1, build_definition2)
 
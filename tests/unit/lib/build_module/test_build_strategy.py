@@ -1,6 +1,8 @@
 from unittest import TestCase
 from unittest.mock import Mock, patch, MagicMock, call, ANY
 
+import tomlkit
+
 from samcli.commands.build.exceptions import MissingBuildMethodException
 from samcli.lib.build.build_graph import BuildGraph, FunctionBuildDefinition, LayerBuildDefinition
 from samcli.lib.build.build_strategy import (
@@ -254,6 +256,17 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
     layer = "SumLayer"
     """
 
+    @classmethod
+    def setUpClass(cls):
+        # Parsing build.toml is covered by the build graph tests, here it is parsed only once
+        cls.build_graph_document = tomlkit.loads(cls.BUILD_GRAPH_CONTENTS)
+
+    def _create_build_graph(self, build_dir):
+        with patch.object(Path, "read_text", return_value=self.BUILD_GRAPH_CONTENTS), patch(
+            "samcli.lib.build.build_graph.tomlkit.loads", return_value=self.build_graph_document
+        ):
+            return BuildGraph(str(build_dir))
+
     @patch("samcli.lib.build.build_strategy.pathlib.Path")
     @patch("samcli.lib.build.build_strategy.osutils.copytree")
     @patch("samcli.lib.build.build_strategy.shutil.rmtree")
@@ -287,9 +300,7 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
             exists_mock.return_value = True
             dir_checksum_mock.return_value = CachedBuildStrategyTest.SOURCE_MD5
 
-            build_graph_path = Path(build_dir.parent, "build.toml")
-            build_graph_path.write_text(CachedBuildStrategyTest.BUILD_GRAPH_CONTENTS)
-            build_graph = BuildGraph(str(build_dir))
+            build_graph = self._create_build_graph(build_dir)
             cached_build_strategy = CachedBuildStrategy(
                 build_graph, DefaultBuildStrategy, temp_base_dir, build_dir, cache_dir, True
             )
@@ -326,9 +337,7 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
             build_function_mock.return_value = {"HelloWorldPython": "artifact1", "HelloWorldPython2": "artifact2"}
             build_layer_mock.return_value = {"SumLayer": "artifact3"}
 
-            build_graph_path = Path(build_dir.parent, "build.toml")
-            build_graph_path.write_text(CachedBuildStrategyTest.BUILD_GRAPH_CONTENTS)
-            build_graph = BuildGraph(str(build_dir))
+            build_graph = self._create_build_graph(build_dir)
             cached_build_strategy = CachedBuildStrategy(
                 build_graph, DefaultBuildStrategy, temp_base_dir, build_dir, cache_dir, True
             )
@@ -1,3 +1,5 @@
+"""PYTEST_DONT_REWRITE"""
+
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -11,52 +13,65 @@ from samcli.lib.init import RUNTIME_DEP_TEMPLATE_MAPPING
 from samcli.lib.utils.packagetype import ZIP
 
 
-class TestInit(TestCase):
-    def setUp(self):
-        self.location = None
-        self.runtime = "python3.6"
-        self.dependency_manager = "pip"
-        self.output_dir = "mydir"
-        self.name = "testing project"
-        self.no_input = True
-        self.extra_context = {"project_name": "testing project", "runtime": self.runtime}
-        self.template = RUNTIME_DEP_TEMPLATE_MAPPING["python"][0]["init_location"]
+COOKIECUTTER_CONTEXT = {"key1": "value1", "key2": "value2"}
+GENERATE_PROJECT_KWARGS = {
+    "location": None,
+    "runtime": "python3.6",
+    "package_type": ZIP,
+    "dependency_manager": "pip",
+    "output_dir": "mydir",
+    "name": "testing project",
+    "no_input": True,
+}
 
-    @patch("samcli.lib.init.cookiecutter")
-    def test_init_successful(self, cookiecutter_patch):
-        # GIVEN generate_project successfully created a project
-        # WHEN a project name has been passed
-        generate_project(
-            location=self.location,
-            runtime=self.runtime,
-            package_type=ZIP,
-            dependency_manager=self.dependency_manager,
-            output_dir=self.output_dir,
-            name=self.name,
-            no_input=self.no_input,
-        )
-
-        # THEN we should receive no errors
-        cookiecutter_patch.assert_called_once_with(
-            no_input=self.no_input, output_dir=self.output_dir, template=self.template
-        )
 
+class TestInit(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.location = GENERATE_PROJECT_KWARGS["location"]
+        cls.runtime = GENERATE_PROJECT_KWARGS["runtime"]
+        cls.dependency_manager = GENERATE_PROJECT_KWARGS["dependency_manager"]
+        cls.output_dir = GENERATE_PROJECT_KWARGS["output_dir"]
+        cls.name = GENERATE_PROJECT_KWARGS["name"]
+        cls.no_input = GENERATE_PROJECT_KWARGS["no_input"]
+        cls.extra_context = {"project_name": cls.name, "runtime": cls.runtime}
+
+    @parameterized.expand(
+        [
+            (
+                "dependency_manager",
+                dict(GENERATE_PROJECT_KWARGS),
+                dict(no_input=True, output_dir="mydir"),
+            ),
+            (
+                "no_dependency_manager",
+                dict(GENERATE_PROJECT_KWARGS, dependency_manager=None),
+                dict(no_input=True, output_dir="mydir"),
+            ),
+            (
+                "location_and_extra_context",
+                dict(location="mylocation", output_dir="mydir", no_input=False, extra_context=COOKIECUTTER_CONTEXT),
+                dict(extra_context=COOKIECUTTER_CONTEXT, template="mylocation", no_input=False, output_dir="mydir"),
+            ),
+            (
+                "app_template_and_extra_context",
+                dict(GENERATE_PROJECT_KWARGS, extra_context=COOKIECUTTER_CONTEXT),
+                dict(extra_context=COOKIECUTTER_CONTEXT, no_input=True, output_dir="mydir"),
+            ),
+        ]
+    )
     @patch("samcli.lib.init.cookiecutter")
-    def test_init_successful_with_no_dep_manager(self, cookiecutter_patch):
-        generate_project(
-            location=self.location,
-            runtime=self.runtime,
-            package_type=ZIP,
-            dependency_manager=None,
-            output_dir=self.output_dir,
-            name=self.name,
-            no_input=self.no_input,
+    def test_init_successful(self, _, generate_project_kwargs, expected_cookiecutter_kwargs, cookiecutter_patch):
+        # Without a location the python template is used. Its init_location is looked up when the test runs,
+        # 'sam init' for image packages rewrites it in RUNTIME_DEP_TEMPLATE_MAPPING.
+        expected_cookiecutter_kwargs = dict(
+            {"template": RUNTIME_DEP_TEMPLATE_MAPPING["python"][0]["init_location"]}, **expected_cookiecutter_kwargs
         )
 
+        generate_project(**generate_project_kwargs)
+
         # THEN we should receive no errors
-        cookiecutter_patch.assert_called_once_with(
-            no_input=self.no_input, output_dir=self.output_dir, template=self.template
-        )
+        cookiecutter_patch.assert_called_once_with(**expected_cookiecutter_kwargs)
 
     def test_init_error_with_non_compatible_dependency_manager(self):
         with self.assertRaises(GenerateProjectFailedError) as ctx:
@@ -100,40 +115,6 @@ class TestInit(TestCase):
 
         self.assertEqual(expected_msg, str(ctx.exception))
 
-    @patch("samcli.lib.init.cookiecutter")
-    def test_must_set_cookiecutter_context_when_location_and_extra_context_is_provided(self, cookiecutter_patch):
-        cookiecutter_context = {"key1": "value1", "key2": "value2"}
-        custom_location = "mylocation"
-        generate_project(
-            location=custom_location, output_dir=self.output_dir, no_input=False, extra_context=cookiecutter_context
-        )
-
-        # THEN we should receive no errors
-        cookiecutter_patch.assert_called_once_with(
-            extra_context=cookiecutter_context, template=custom_location, no_input=False, output_dir=self.output_dir
-        )
-
-    @patch("samcli.lib.init.cookiecutter")
-    def test_must_set_cookiecutter_context_when_app_template_is_provided(self, cookiecutter_patch):
-        cookiecutter_context = {"key1": "value1", "key2": "value2"}
-        generate_project(
-            runtime=self.runtime,
-            package_type=ZIP,
-            dependency_manager=self.dependency_manager,
-            output_dir=self.output_dir,
-            name=self.name,
-            no_input=self.no_input,
-            extra_context=cookiecutter_context,
-        )
-
-        # THEN we should receive no errors
-        cookiecutter_patch.assert_called_once_with(
-            extra_context=cookiecutter_context,
-            no_input=self.no_input,
-            output_dir=self.output_dir,
-            template=self.template,
-        )
-
     @patch("samcli.lib.init.cookiecutter")
     @patch("samcli.lib.init.generate_non_cookiecutter_project")
     def test_init_arbitrary_project_with_location_is_not_cookiecutter(
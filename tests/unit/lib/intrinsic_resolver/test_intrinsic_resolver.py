@@ -347,7 +347,9 @@ class TestIntrinsicFnRefResolver(TestCase):
 
 
 class TestIntrinsicFnGetAttResolver(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # Every test only resolves against the template, so the resolver is built once for the class
         logical_id_translator = {
             "RestApi": {"Ref": "NewRestApi"},
             "LambdaFunction": {
@@ -391,8 +393,8 @@ class TestIntrinsicFnGetAttResolver(TestCase):
         }
         template = {"Resources": resources}
         symbol_resolver = IntrinsicsSymbolTable(template=template, logical_id_translator=logical_id_translator)
-        self.resources = resources
-        self.resolver = IntrinsicResolver(template=template, symbol_resolver=symbol_resolver)
+        cls.resources = resources
+        cls.resolver = IntrinsicResolver(template=template, symbol_resolver=symbol_resolver)
 
     def test_fn_getatt_basic_translation(self):
         intrinsic = {"Fn::GetAtt": ["RestApi", "RootResourceId"]}
@@ -902,6 +904,15 @@ class TestIntrinsicFnIfResolver(TestCase):
 
 
 class TestIntrinsicAttribteResolution(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The template is parsed once, every test resolves its own copy of it
+        integration_path = str(
+            Path(__file__).resolve().parents[0].joinpath("test_data", "inputs/test_intrinsic_template_resolution.json")
+        )
+        with open(integration_path) as f:
+            cls.template_data = json.load(f)
+
     def setUp(self):
         self.maxDiff = None
         logical_id_translator = {
@@ -917,11 +928,7 @@ class TestIntrinsicAttribteResolution(TestCase):
         }
         self.logical_id_translator = logical_id_translator
 
-        integration_path = str(
-            Path(__file__).resolve().parents[0].joinpath("test_data", "inputs/test_intrinsic_template_resolution.json")
-        )
-        with open(integration_path) as f:
-            template = json.load(f)
+        template = deepcopy(self.template_data)
 
         self.template = template
         self.resources = template.get("Resources")
@@ -1,7 +1,10 @@
+import os
 from unittest import TestCase
 
 from unittest.mock import patch
 
+from parameterized import parameterized
+
 from samcli.lib.intrinsic_resolver.invalid_intrinsic_exception import InvalidSymbolException
 from samcli.lib.intrinsic_resolver.intrinsic_property_resolver import IntrinsicResolver
 from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymbolTable
@@ -11,42 +14,39 @@ class TestIntrinsicsSymbolTablePseudoProperties(TestCase):
     def setUp(self):
         self.symbol_table = IntrinsicsSymbolTable(template={})
 
-    def test_handle_account_id_default(self):
-        self.assertEqual(self.symbol_table.handle_pseudo_account_id(), "123456789012")
-
-    def test_pseudo_partition(self):
-        self.assertEqual(self.symbol_table.handle_pseudo_partition(), "aws")
-
-    @patch("samcli.lib.intrinsic_resolver.intrinsics_symbol_table.os")
-    def test_pseudo_partition_gov(self, mock_os):
-        mock_os.getenv.return_value = "us-west-gov-1"
-        self.assertEqual(self.symbol_table.handle_pseudo_partition(), "aws-us-gov")
-
-    @patch("samcli.lib.intrinsic_resolver.intrinsics_symbol_table.os")
-    def test_pseudo_partition_china(self, mock_os):
-        mock_os.getenv.return_value = "cn-west-1"
-        self.assertEqual(self.symbol_table.handle_pseudo_partition(), "aws-cn")
-
-    @patch("samcli.lib.intrinsic_resolver.intrinsics_symbol_table.os")
-    def test_pseudo_region_environ(self, mock_os):
-        mock_os.getenv.return_value = "mytemp"
-        self.assertEqual(self.symbol_table.handle_pseudo_region(), "mytemp")
-
-    @patch("samcli.lib.intrinsic_resolver.intrinsics_symbol_table.os")
-    def test_pseudo_default_region(self, mock_os):
-        mock_os.getenv.return_value = None
-        self.assertEqual(self.symbol_table.handle_pseudo_region(), "us-east-1")
+    @parameterized.expand(
+        [
+            ({}, "aws"),
+            ({"AWS_REGION": "us-west-gov-1"}, "aws-us-gov"),
+            ({"AWS_REGION": "cn-west-1"}, "aws-cn"),
+        ]
+    )
+    def test_pseudo_partition(self, environ, expected_partition):
+        with patch.dict(os.environ, environ, clear=True):
+            self.assertEqual(self.symbol_table.handle_pseudo_partition(), expected_partition)
+
+    @parameterized.expand(
+        [
+            ({}, "us-east-1"),
+            ({"AWS_REGION": "mytemp"}, "mytemp"),
+        ]
+    )
+    def test_pseudo_region(self, environ, expected_region):
+        with patch.dict(os.environ, environ, clear=True):
+            self.assertEqual(self.symbol_table.handle_pseudo_region(), expected_region)
 
     def test_pseudo_no_value(self):
         self.assertIsNone(self.symbol_table.handle_pseudo_no_value())
 
-    def test_pseudo_url_prefix_default(self):
-        self.assertEqual(self.symbol_table.handle_pseudo_url_prefix(), "amazonaws.com")
-
-    @patch("samcli.lib.intrinsic_resolver.intrinsics_symbol_table.os")
-    def test_pseudo_url_prefix_china(self, mock_os):
-        mock_os.getenv.return_value = "cn-west-1"
-        self.assertEqual(self.symbol_table.handle_pseudo_url_prefix(), "amazonaws.com.cn")
+    @parameterized.expand(
+        [
+            ({}, "amazonaws.com"),
+            ({"AWS_REGION": "cn-west-1"}, "amazonaws.com.cn"),
+        ]
+    )
+    def test_pseudo_url_prefix(self, environ, expected_url_prefix):
+        with patch.dict(os.environ, environ, clear=True):
+            self.assertEqual(self.symbol_table.handle_pseudo_url_prefix(), expected_url_prefix)
 
     def test_get_availability_zone(self):
         res = IntrinsicsSymbolTable.get_availability_zone("us-east-1")
@@ -55,6 +55,7 @@ class TestIntrinsicsSymbolTablePseudoProperties(TestCase):
     def test_handle_pseudo_account_id(self):
         res = IntrinsicsSymbolTable.handle_pseudo_account_id()
         self.assertEqual(res, "123456789012")
+        self.assertEqual(self.symbol_table.handle_pseudo_account_id(), res)
 
     def test_handle_pseudo_stack_name(self):
         res = IntrinsicsSymbolTable.handle_pseudo_stack_name()
@@ -11,13 +11,13 @@ class TestInitAWSConfiguration(TestCase):
     @patch("samcli.lib.schemas.schemas_aws_config.Session")
     @patch("click.confirm")
     def test_get_aws_configuration_profile_is_set_to_none_for_default_selection(self, confirm_mock, session_mock):
-        confirm_mock.side_effect = [True]
+        confirm_mock.return_value = True
         session_mock.return_value.profile_name = "default"
         session_mock.return_value.region_name = "us-west-2"
         aws_configuration_choice = get_aws_configuration_choice()
         self.assertEqual(aws_configuration_choice["profile"], None)
         self.assertEqual(aws_configuration_choice["region"], "us-west-2")
-        confirm_mock.assert_any_call(
+        confirm_mock.assert_called_once_with(
             "\nDo you want to use the default AWS profile [default] and region [us-west-2]?", default=True
         )
 
@@ -25,7 +25,7 @@ class TestInitAWSConfiguration(TestCase):
     @patch("click.confirm")
     @patch("click.prompt")
     def test_get_aws_configuration_choice_selected(self, prompt_mock, confirm_mock, session_mock):
-        confirm_mock.side_effect = [False]
+        confirm_mock.return_value = False
         prompt_mock.side_effect = ["2", "us-east-2"]
         session_mock.return_value.profile_name = "default"
         session_mock.return_value.region_name = "us-west-2"
@@ -40,7 +40,7 @@ class TestInitAWSConfiguration(TestCase):
         aws_configuration_choice = get_aws_configuration_choice()
         self.assertEqual(aws_configuration_choice["profile"], "test-profile")
         self.assertEqual(aws_configuration_choice["region"], "us-east-2")
-        confirm_mock.assert_any_call(
+        confirm_mock.assert_called_once_with(
             "\nDo you want to use the default AWS profile [default] and region [us-west-2]?", default=True
         )
         prompt_mock.assert_any_call("Profile", type=ANY, show_choices=False)
@@ -49,7 +49,7 @@ class TestInitAWSConfiguration(TestCase):
     @patch("samcli.lib.schemas.schemas_aws_config.Session")
     @patch("click.confirm")
     def test_get_aws_configuration_raises_exception_when_no_profile_found(self, confirm_mock, session_mock):
-        confirm_mock.side_effect = [False]
+        confirm_mock.return_value = False
         session_mock.return_value.profile_name = "default"
         session_mock.return_value.region_name = "us-west-2"
         session_mock.return_value.available_profiles = []
@@ -62,7 +62,7 @@ class TestInitAWSConfiguration(TestCase):
     @patch("click.confirm")
     @patch("click.prompt")
     def test_get_aws_configuration_allow_free_text_region_value(self, prompt_mock, confirm_mock, session_mock):
-        confirm_mock.side_effect = [False]
+        confirm_mock.return_value = False
         prompt_mock.side_effect = ["2", "random-region"]
         session_mock.return_value.profile_name = "default"
         session_mock.return_value.region_name = "us-west-2"
@@ -77,7 +77,7 @@ class TestInitAWSConfiguration(TestCase):
         aws_configuration_choice = get_aws_configuration_choice()
         self.assertEqual(aws_configuration_choice["profile"], "test-profile")
         self.assertEqual(aws_configuration_choice["region"], "random-region")
-        confirm_mock.assert_any_call(
+        confirm_mock.assert_called_once_with(
             "\nDo you want to use the default AWS profile [default] and region [us-west-2]?", default=True
         )
         prompt_mock.assert_any_call("Profile", type=ANY, show_choices=False)
@@ -88,7 +88,7 @@ class TestInitAWSConfiguration(TestCase):
     @patch("click.prompt")
     def test_get_aws_configuration_succeeds_with_default(self, prompt_mock, confirm_mock, session_mock):
         region = "us-east-2"
-        confirm_mock.side_effect = [True]
+        confirm_mock.return_value = True
         prompt_mock.side_effect = ["1", region]
 
         def profile_mock(**kwargs):
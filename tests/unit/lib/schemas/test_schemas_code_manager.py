@@ -1,7 +1,8 @@
+import json
 import tempfile
 import os
 from unittest import TestCase
-from unittest.mock import call, patch, ANY, mock_open
+from unittest.mock import call, patch, ANY
 
 import botocore
 from botocore.exceptions import ClientError
@@ -71,21 +72,23 @@ class TestSchemaCodeManager(TestCase):
         self.assertEqual(schemas_api_caller_mock.put_code_binding.call_count, 1)
         self.assertEqual(schemas_api_caller_mock.poll_for_code_binding_status.call_count, 1)
 
-    @patch("json.loads")
     @patch("samcli.lib.schemas.schemas_code_manager.unzip")
-    def test_merge_generated_code(self, unzip_mock, json_loads_mock):
-        json_loads_mock.return_value = {
-            "project_name": "Your EventBridge Starter app",
-            "runtime": "java8",
-            "function_name": "HelloWorldFunction",
-            "AWS_Schema_registry": "aws.events",
-            "AWS_Schema_name": "EC2InstanceStateChangeNotification",
-            "AWS_Schema_source": "aws.ec2",
-            "AWS_Schema_detail_type": "EC2 Instance State-change Notification",
-        }
-        cookiecutter_json_path = os.path.join("template_location", "cookiecutter.json")
+    def test_merge_generated_code(self, unzip_mock):
+        cookiecutter_json_data = json.dumps(
+            {
+                "project_name": "Your EventBridge Starter app",
+                "runtime": "java8",
+                "function_name": "HelloWorldFunction",
+                "AWS_Schema_registry": "aws.events",
+                "AWS_Schema_name": "EC2InstanceStateChangeNotification",
+                "AWS_Schema_source": "aws.ec2",
+                "AWS_Schema_detail_type": "EC2 Instance State-change Notification",
+            }
+        )
         project_path = os.path.join("download_location", "my_project", "HelloWorldFunction")
-        with patch("builtins.open", mock_open(read_data='{function_name: "test"}')) as schemas_file_mock:
-            do_extract_and_merge_schemas_code("result.zip", "download_location", "my_project", "template_location")
-            schemas_file_mock.assert_called_with(cookiecutter_json_path, "r")
-            unzip_mock.assert_called_once_with("result.zip", project_path)
+        # A real cookiecutter.json is read, so neither open nor json need to be patched
+        with tempfile.TemporaryDirectory() as template_location:
+            with open(os.path.join(template_location, "cookiecutter.json"), "w") as cookiecutter_json:
+                cookiecutter_json.write(cookiecutter_json_data)
+            do_extract_and_merge_schemas_code("result.zip", "download_location", "my_project", template_location)
+        unzip_mock.assert_called_once_with("result.zip", project_path)
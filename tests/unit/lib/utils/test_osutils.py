@@ -72,8 +72,15 @@ class Test_convert_files_to_unix_line_endings:
             ("a", "_", ("file_a_1", "file_a_2", target_file)),
             ("b", "_", ("file_b_1", target_file)),
         ]
+        patched_open.return_value.__enter__.return_value.read.return_value = b"line\r\n"
         osutils.convert_files_to_unix_line_endings("path", [target_file])
         patched_open.assert_any_call(os.path.join("a", target_file), "rb")
         patched_open.assert_any_call(os.path.join("b", target_file), "rb")
         patched_open.assert_any_call(os.path.join("a", target_file), "wb")
         patched_open.assert_any_call(os.path.join("b", target_file), "wb")
+
+    @patch("builtins.open")
+    def test_must_not_rewrite_unix_files(self, patched_open):
+        patched_open.return_value.__enter__.return_value.read.return_value = b"line\n"
+        osutils.convert_to_unix_line_ending("file")
+        patched_open.assert_called_once_with("file", "rb")
@@ -1,7 +1,14 @@
-from unittest import TestCase
+import io
+import os
+import shutil
+import subprocess
+import tarfile
+import tempfile
+from pathlib import Path
+from unittest import TestCase, skipIf
 from unittest.mock import Mock, patch, call
 
-from samcli.lib.utils.tar import create_tarball
+from samcli.lib.utils.tar import create_tarball, stream_tarball, _gnu_tar_executable, STREAM_CHUNK_SIZE
 
 
 class TestTar(TestCase):
@@ -62,3 +69,142 @@ class TestTar(TestCase):
         temp_file_mock.seek.assert_called_once_with(0)
         temp_file_mock.close.assert_called_once()
         tarfile_open_patch.assert_called_once_with(fileobj=temp_file_mock, mode="w")
+
+
+class TestStreamTarball(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.layer_dir = Path(self.temp_dir, "layer")
+        self.layer_dir.mkdir()
+        Path(self.layer_dir, "file.txt").write_text("layer contents")
+        self.dockerfile = Path(self.temp_dir, "dockerfile")
+        self.dockerfile.write_text("FROM python")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_streaming_tarball(self):
+        with stream_tarball({self.layer_dir: "/layer1", self.dockerfile: "Dockerfile"}) as chunks:
+            tarball = b"".join(chunks)
+
+        with tarfile.open(fileobj=io.BytesIO(tarball)) as archive:
+            self.assertEqual(set(archive.getnames()), {"layer1", "layer1/file.txt", "Dockerfile"})
+            self.assertEqual(archive.extractfile("Dockerfile").read(), b"FROM python")
+
+    def test_streaming_tarball_in_large_chunks(self):
+        big_file = Path(self.temp_dir, "big")
+        big_file.write_bytes(b"0" * 3 * STREAM_CHUNK_SIZE)
+
+        with stream_tarball({big_file: "big"}) as chunks:
+            chunk_sizes = [len(chunk) for chunk in chunks]
+
+        self.assertEqual(chunk_sizes[0], STREAM_CHUNK_SIZE)
+        self.assertTrue(all(size <= STREAM_CHUNK_SIZE for size in chunk_sizes))
+
+    def test_streaming_tarball_with_filter(self):
+        def tar_filter(tar_info):
+            tar_info.mode = 0o500
+            return tar_info
+
+        with stream_tarball({self.dockerfile: "Dockerfile"}, tar_filter=tar_filter) as chunks:
+            tarball = b"".join(chunks)
+
+        with tarfile.open(fileobj=io.BytesIO(tarball)) as archive:
+            self.assertEqual(archive.getmember("Dockerfile").mode, 0o500)
+
+    def test_streaming_tarball_stopped_early(self):
+        big_file = Path(self.temp_dir, "big")
+        big_file.write_bytes(b"0" * 1024 * 1024)
+
+        with self.assertRaises(ValueError):
+            with stream_tarball({big_file: "big"}) as chunks:
+                next(chunks)
+                raise ValueError("consumer failed")
+
+    def test_streaming_tarball_raises_writer_errors(self):
+        with self.assertRaises(FileNotFoundError):
+            with stream_tarball({Path(self.temp_dir, "missing"): "missing"}) as chunks:
+                b"".join(chunks)
+
+    def test_streaming_tarball_raises_writer_errors_before_end_of_stream(self):
+        def failing_filter(tar_info):
+            if tar_info.name.endswith("file.txt"):
+                raise OSError("failed to read file")
+            return tar_info
+
+        tar_paths = {self.dockerfile: "Dockerfile", self.layer_dir: "/layer1"}
+        with stream_tarball(tar_paths, tar_filter=failing_filter) as chunks:
+            # the consumer must not see a clean end of the stream for a truncated tarball
+            with self.assertRaisesRegex(OSError, "failed to read file"):
+                b"".join(chunks)
+
+    def test_streaming_tarball_not_fully_consumed(self):
+        big_file = Path(self.temp_dir, "big")
+        big_file.write_bytes(b"0" * 1024 * 1024)
+
+        with stream_tarball({big_file: "big"}) as chunks:
+            next(chunks)
+
+
+class TestStreamNativeTarball(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.layer_dir = Path(self.temp_dir, "layer")
+        self.layer_dir.mkdir()
+        Path(self.layer_dir, "file.txt").write_text("layer contents")
+        os.symlink("file.txt", str(Path(self.layer_dir, "link")))
+        self.dockerfile = Path(self.temp_dir, "docker,file")
+        self.dockerfile.write_text("FROM python")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    @skipIf(not _gnu_tar_executable(), "GNU tar is not available")
+    @patch("samcli.lib.utils.tar.NATIVE_TAR_THRESHOLD", 0)
+    def test_streaming_tarball_with_native_tar(self):
+        with stream_tarball({self.layer_dir: "/layer1", self.dockerfile: "Dockerfile"}) as chunks:
+            tarball = b"".join(chunks)
+
+        with tarfile.open(fileobj=io.BytesIO(tarball)) as archive:
+            self.assertEqual(set(archive.getnames()), {"layer1", "layer1/file.txt", "layer1/link", "Dockerfile"})
+            self.assertEqual(archive.getmember("layer1/link").linkname, "file.txt")
+            self.assertEqual(archive.extractfile("Dockerfile").read(), b"FROM python")
+
+    @skipIf(not _gnu_tar_executable(), "GNU tar is not available")
+    @patch("samcli.lib.utils.tar._exceeds_size")
+    def test_streaming_tarball_with_native_tar_raises_errors(self, exceeds_size_patch):
+        exceeds_size_patch.return_value = True
+
+        with stream_tarball({Path(self.temp_dir, "missing"): "missing"}) as chunks:
+            with self.assertRaises(subprocess.CalledProcessError):
+                b"".join(chunks)
+
+    @patch("samcli.lib.utils.tar._stream_native_tarball")
+    @patch("samcli.lib.utils.tar._gnu_tar_executable")
+    def test_small_context_is_not_archived_with_native_tar(self, gnu_tar_executable_patch, stream_native_patch):
+        gnu_tar_executable_patch.return_value = "tar"
+
+        with stream_tarball({self.dockerfile: "Dockerfile"}) as chunks:
+            b"".join(chunks)
+
+        stream_native_patch.assert_not_called()
+
+    @patch("samcli.lib.utils.tar.NATIVE_TAR_THRESHOLD", 0)
+    @patch("samcli.lib.utils.tar._stream_native_tarball")
+    @patch("samcli.lib.utils.tar._gnu_tar_executable")
+    def test_filtered_context_is_not_archived_with_native_tar(self, gnu_tar_executable_patch, stream_native_patch):
+        gnu_tar_executable_patch.return_value = "tar"
+
+        with stream_tarball({self.dockerfile: "Dockerfile"}, tar_filter=lambda tar_info: tar_info) as chunks:
+            b"".join(chunks)
+
+        stream_native_patch.assert_not_called()
+
+    @patch("samcli.lib.utils.tar.platform.system")
+    def test_native_tar_is_not_used_on_windows(self, system_patch):
+        system_patch.return_value = "Windows"
+        _gnu_tar_executable.cache_clear()
+        try:
+            self.assertIsNone(_gnu_tar_executable())
+        finally:
+            _gnu_tar_executable.cache_clear()
@@ -13,6 +13,10 @@ from samcli.lib.utils.version_checker import (
     PYPI_CALL_TIMEOUT_IN_SECONDS,
 )
 
+# computed once at import; the one day margin around the week threshold covers any test run length
+EIGHT_DAYS_AGO = datetime.utcnow() - timedelta(days=8)
+SIX_DAYS_AGO = datetime.utcnow() - timedelta(days=6)
+
 
 @check_newer_version
 def real_fn(a, b=None):
@@ -61,9 +65,42 @@ class TestVersionChecker(TestCase):
         actual = real_fn("Hello", "World")
         self.assertEqual(actual, "Hello World")
 
-    @patch("samcli.lib.utils.version_checker.get")
+    @patch("samcli.cli.global_config.GlobalConfig._set_value")
+    @patch("samcli.cli.global_config.GlobalConfig._get_value")
+    def test_update_last_check_time(self, mock_gc_get_value, mock_gc_set_value):
+        mock_gc_get_value.return_value = None
+        global_config = GlobalConfig()
+        self.assertIsNone(global_config.last_version_check)
+
+        update_last_check_time(global_config)
+        self.assertIsNotNone(global_config.last_version_check)
+
+        mock_gc_set_value.assert_has_calls([call("lastVersionCheck", ANY)])
+
+    @patch("samcli.cli.global_config.GlobalConfig._set_value")
+    @patch("samcli.cli.global_config.GlobalConfig._get_value")
+    def test_update_last_check_time_should_return_when_exception_is_raised(self, mock_gc_get_value, mock_gc_set_value):
+        mock_gc_set_value.side_effect = Exception()
+        global_config = GlobalConfig()
+        update_last_check_time(global_config)
+
+    def test_update_last_check_time_should_return_when_global_config_is_none(self):
+        update_last_check_time(None)
+
+    def test_last_check_time_none_should_return_true(self):
+        self.assertTrue(is_version_check_overdue(None))
+
+    def test_last_check_time_week_older_should_return_true(self):
+        self.assertTrue(is_version_check_overdue(EIGHT_DAYS_AGO))
+
+    def test_last_check_time_week_earlier_should_return_false(self):
+        self.assertFalse(is_version_check_overdue(SIX_DAYS_AGO.timestamp()))
+
+
+@patch("samcli.lib.utils.version_checker.get")
+@patch("samcli.lib.utils.version_checker.installed_version", "1.9.0")
+class TestFetchAndCompareVersions(TestCase):
     @patch("samcli.lib.utils.version_checker.LOG")
-    @patch("samcli.lib.utils.version_checker.installed_version", "1.9.0")
     def test_compare_invalid_response(self, mock_log, get_mock):
         get_mock.return_value.json.return_value = {}
         fetch_and_compare_versions()
@@ -76,9 +113,7 @@ class TestVersionChecker(TestCase):
             ]
         )
 
-    @patch("samcli.lib.utils.version_checker.get")
     @patch("samcli.lib.utils.version_checker.LOG")
-    @patch("samcli.lib.utils.version_checker.installed_version", "1.9.0")
     def test_fetch_and_compare_versions_same(self, mock_log, get_mock):
         get_mock.return_value.json.return_value = {"info": {"version": "1.9.0"}}
         fetch_and_compare_versions()
@@ -91,9 +126,7 @@ class TestVersionChecker(TestCase):
             ]
         )
 
-    @patch("samcli.lib.utils.version_checker.get")
     @patch("samcli.lib.utils.version_checker.click")
-    @patch("samcli.lib.utils.version_checker.installed_version", "1.9.0")
     def test_fetch_and_compare_versions_different(self, mock_click, get_mock):
         get_mock.return_value.json.return_value = {"info": {"version": "1.10.0"}}
         fetch_and_compare_versions()
@@ -106,36 +139,3 @@ class TestVersionChecker(TestCase):
                 call.echo(f"To download: {AWS_SAM_CLI_INSTALL_DOCS}", err=True),
             ]
         )
-
-    @patch("samcli.cli.global_config.GlobalConfig._set_value")
-    @patch("samcli.cli.global_config.GlobalConfig._get_value")
-    def test_update_last_check_time(self, mock_gc_get_value, mock_gc_set_value):
-        mock_gc_get_value.return_value = None
-        global_config = GlobalConfig()
-        self.assertIsNone(global_config.last_version_check)
-
-        update_last_check_time(global_config)
-        self.assertIsNotNone(global_config.last_version_check)
-
-        mock_gc_set_value.assert_has_calls([call("lastVersionCheck", ANY)])
-
-    @patch("samcli.cli.global_config.GlobalConfig._set_value")
-    @patch("samcli.cli.global_config.GlobalConfig._get_value")
-    def test_update_last_check_time_should_return_when_exception_is_raised(self, mock_gc_get_value, mock_gc_set_value):
-        mock_gc_set_value.side_effect = Exception()
-        global_config = GlobalConfig()
-        update_last_check_time(global_config)
-
-    def test_update_last_check_time_should_return_when_global_config_is_none(self):
-        update_last_check_time(None)
-
-    def test_last_check_time_none_should_return_true(self):
-        self.assertTrue(is_version_check_overdue(None))
-
-    def test_last_check_time_week_older_should_return_true(self):
-        eight_days_ago = datetime.utcnow() - timedelta(days=8)
-        self.assertTrue(is_version_check_overdue(eight_days_ago))
-
-    def test_last_check_time_week_earlier_should_return_false(self):
-        six_days_ago = datetime.utcnow() - timedelta(days=6)
-        self.assertFalse(is_version_check_overdue(six_days_ago.timestamp()))
@@ -1,18 +1,31 @@
 import io
+import subprocess
+import tarfile
 import tempfile
+from pathlib import Path
 
 from unittest import TestCase
-from unittest.mock import patch, Mock, mock_open, ANY
+from unittest.mock import patch, Mock, ANY, call
 
 from docker.errors import ImageNotFound, BuildError, APIError
+from parameterized import parameterized
 
 from samcli.commands.local.lib.exceptions import InvalidIntermediateImageError
 from samcli.lib.utils.packagetype import ZIP, IMAGE
-from samcli.local.docker.lambda_image import LambdaImage
+from samcli.local.docker.lambda_image import LambdaImage, Runtime
 from samcli.commands.local.cli_common.user_exceptions import ImageBuildException
 from samcli import __version__ as version
 
 
+class TestRuntime(TestCase):
+    def test_has_value(self):
+        self.assertTrue(Runtime.has_value("python3.8"))
+        self.assertTrue(Runtime.has_value("provided.al2"))
+        self.assertFalse(Runtime.has_value("python3.8x"))
+        self.assertFalse(Runtime.has_value("python38"))
+        self.assertFalse(Runtime.has_value(None))
+
+
 class TestLambdaImage(TestCase):
     def setUp(self):
         self.layer_cache_dir = tempfile.gettempdir()
@@ -72,7 +85,9 @@ class TestLambdaImage(TestCase):
         )
 
         # No layers are added, because runtime is not defined.
-        build_image_patch.assert_called_once_with("mylambdaimage:v1", f"mylambdaimage:rapid-{version}", [], stream=ANY)
+        build_image_patch.assert_called_once_with(
+            "mylambdaimage:v1", f"mylambdaimage:rapid-{version}", [], stream=ANY, fingerprint=ANY
+        )
         # No Layers are added.
         layer_downloader_mock.assert_not_called()
 
@@ -147,12 +162,15 @@ class TestLambdaImage(TestCase):
 
         layer_downloader_mock.download_all.assert_called_once_with(["layers1"], True)
         generate_docker_image_version_patch.assert_called_once_with(["layers1"], "python3.6")
-        docker_client_mock.images.get.assert_called_once_with("samcli/lambda:image-version")
+        docker_client_mock.images.get.assert_has_calls(
+            [call("samcli/lambda:image-version"), call("amazon/aws-sam-cli-emulation-image-python3.6:latest")]
+        )
         build_image_patch.assert_called_once_with(
             "amazon/aws-sam-cli-emulation-image-python3.6:latest",
             "samcli/lambda:image-version",
             ["layers1"],
             stream=stream,
+            fingerprint=None,
         )
 
     @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
@@ -177,14 +195,167 @@ class TestLambdaImage(TestCase):
 
         layer_downloader_mock.download_all.assert_called_once_with(["layers1"], False)
         generate_docker_image_version_patch.assert_called_once_with(["layers1"], "python3.6")
-        docker_client_mock.images.get.assert_called_once_with("samcli/lambda:image-version")
+        docker_client_mock.images.get.assert_has_calls(
+            [call("samcli/lambda:image-version"), call("amazon/aws-sam-cli-emulation-image-python3.6:latest")]
+        )
         build_image_patch.assert_called_once_with(
             "amazon/aws-sam-cli-emulation-image-python3.6:latest",
             "samcli/lambda:image-version",
             ["layers1"],
             stream=stream,
+            fingerprint=None,
+        )
+
+    @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._generate_image_fingerprint")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._generate_docker_image_version")
+    def test_not_building_image_with_template_layers_when_fingerprint_is_unchanged(
+        self, generate_docker_image_version_patch, generate_image_fingerprint_patch, build_image_patch
+    ):
+        layer_downloader_mock = Mock()
+        layer_mock = Mock()
+        layer_mock.is_defined_within_template = True
+        layer_downloader_mock.download_all.return_value = [layer_mock]
+
+        generate_docker_image_version_patch.return_value = "image-version"
+        generate_image_fingerprint_patch.return_value = "fingerprint"
+
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.return_value.labels = {"samcli.build.fingerprint": "fingerprint"}
+
+        lambda_image = LambdaImage(layer_downloader_mock, False, False, docker_client=docker_client_mock)
+        actual_image_id = lambda_image.build("python3.6", ZIP, None, [layer_mock])
+
+        self.assertEqual(actual_image_id, "samcli/lambda:image-version")
+        generate_image_fingerprint_patch.assert_called_once_with(
+            "amazon/aws-sam-cli-emulation-image-python3.6:latest", [layer_mock]
+        )
+        build_image_patch.assert_not_called()
+
+    @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._generate_image_fingerprint")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._generate_docker_image_version")
+    def test_building_image_with_template_layers_when_fingerprint_changed(
+        self, generate_docker_image_version_patch, generate_image_fingerprint_patch, build_image_patch
+    ):
+        layer_downloader_mock = Mock()
+        layer_mock = Mock()
+        layer_mock.is_defined_within_template = True
+        layer_downloader_mock.download_all.return_value = [layer_mock]
+
+        generate_docker_image_version_patch.return_value = "image-version"
+        generate_image_fingerprint_patch.return_value = "new fingerprint"
+
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.return_value.labels = {"samcli.build.fingerprint": "old fingerprint"}
+
+        stream = io.StringIO()
+
+        lambda_image = LambdaImage(layer_downloader_mock, False, False, docker_client=docker_client_mock)
+        actual_image_id = lambda_image.build("python3.6", ZIP, None, [layer_mock], stream=stream)
+
+        self.assertEqual(actual_image_id, "samcli/lambda:image-version")
+        build_image_patch.assert_called_once_with(
+            "amazon/aws-sam-cli-emulation-image-python3.6:latest",
+            "samcli/lambda:image-version",
+            [layer_mock],
+            stream=stream,
+            fingerprint="new fingerprint",
+        )
+
+    @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._generate_image_fingerprint")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._generate_docker_image_version")
+    def test_force_building_image_even_when_fingerprint_is_unchanged(
+        self, generate_docker_image_version_patch, generate_image_fingerprint_patch, build_image_patch
+    ):
+        layer_downloader_mock = Mock()
+        layer_mock = Mock()
+        layer_mock.is_defined_within_template = True
+        layer_downloader_mock.download_all.return_value = [layer_mock]
+
+        generate_docker_image_version_patch.return_value = "image-version"
+        generate_image_fingerprint_patch.return_value = "fingerprint"
+
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.return_value.labels = {"samcli.build.fingerprint": "fingerprint"}
+
+        lambda_image = LambdaImage(layer_downloader_mock, False, True, docker_client=docker_client_mock)
+        lambda_image.build("python3.6", ZIP, None, [layer_mock])
+
+        build_image_patch.assert_called_once()
+
+    def test_generate_image_fingerprint_without_local_base_image(self):
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.side_effect = ImageNotFound("image not found")
+
+        lambda_image = LambdaImage(Mock(), False, False, docker_client=docker_client_mock)
+
+        self.assertIsNone(lambda_image._generate_image_fingerprint("python", []))
+
+    def test_generate_image_fingerprint_changes_with_layer_contents(self):
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.return_value.id = "sha256:baseimageid"
+
+        with tempfile.TemporaryDirectory() as layer_dir:
+            layer_mock = Mock()
+            layer_mock.name = "layer1"
+            layer_mock.codeuri = layer_dir
+            Path(layer_dir, "file.txt").write_text("contents")
+
+            lambda_image = LambdaImage(Mock(), False, False, docker_client=docker_client_mock)
+            first_fingerprint = lambda_image._generate_image_fingerprint("python", [layer_mock])
+            unchanged_fingerprint = lambda_image._generate_image_fingerprint("python", [layer_mock])
+
+            Path(layer_dir, "file.txt").write_text("updated contents")
+            changed_fingerprint = lambda_image._generate_image_fingerprint("python", [layer_mock])
+
+        self.assertEqual(first_fingerprint, unchanged_fingerprint)
+        self.assertNotEqual(first_fingerprint, changed_fingerprint)
+
+    def test_generate_image_fingerprint_keeps_layer_order(self):
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.return_value.id = "sha256:baseimageid"
+
+        with tempfile.TemporaryDirectory() as layer1_dir, tempfile.TemporaryDirectory() as layer2_dir:
+            Path(layer1_dir, "file.txt").write_text("layer1")
+            Path(layer2_dir, "file.txt").write_text("layer2")
+            layer1 = Mock(codeuri=layer1_dir)
+            layer1.name = "layer"
+            layer2 = Mock(codeuri=layer2_dir)
+            layer2.name = "layer"
+
+            lambda_image = LambdaImage(Mock(), False, False, docker_client=docker_client_mock)
+            in_order = lambda_image._generate_image_fingerprint("python", [layer1, layer2])
+            reversed_order = lambda_image._generate_image_fingerprint("python", [layer2, layer1])
+
+        self.assertNotEqual(in_order, reversed_order)
+
+    @patch("samcli.local.docker.lambda_image.file_checksum")
+    @patch("samcli.local.docker.lambda_image.dir_checksum")
+    def test_checksum_layer(self, dir_checksum_patch, file_checksum_patch):
+        dir_checksum_patch.return_value = "dir checksum"
+        file_checksum_patch.return_value = "file checksum"
+
+        with tempfile.TemporaryDirectory() as layer_dir:
+            layer_file = Path(layer_dir, "layer.zip")
+            layer_file.write_text("zip")
+
+            self.assertEqual(LambdaImage._checksum_layer(Mock(codeuri=layer_dir)), "dir checksum")
+            self.assertEqual(LambdaImage._checksum_layer(Mock(codeuri=layer_file)), "file checksum")
+
+        dir_checksum_patch.assert_called_once_with(layer_dir)
+        file_checksum_patch.assert_called_once_with(str(layer_file))
+
+    def test_get_emulation_image_name(self):
+        self.assertEqual(
+            LambdaImage._get_emulation_image_name("python3.8"), "amazon/aws-sam-cli-emulation-image-python3.8:latest"
         )
 
+    def test_get_rapid_image_tag(self):
+        self.assertEqual(LambdaImage._get_rapid_image_tag("myimage:v1"), f"myimage:rapid-{version}")
+        self.assertEqual(LambdaImage._get_rapid_image_tag("myimage@sha256"), f"myimagesha256:rapid-{version}")
+
     @patch("samcli.local.docker.lambda_image.hashlib")
     def test_generate_docker_image_version(self, hashlib_patch):
         haslib_sha256_mock = Mock()
@@ -206,24 +377,30 @@ class TestLambdaImage(TestCase):
         docker_patch.from_env.return_value = docker_client_mock
 
         expected_docker_file = (
-            "FROM python\nADD aws-lambda-rie /var/rapid\nRUN chmod +x /var/rapid/aws-lambda-rie\nADD layer1 /opt\n"
+            "FROM python\nADD aws-lambda-rie /var/rapid\nRUN chmod +x /var/rapid/aws-lambda-rie\nCOPY layers /opt\n"
         )
 
-        layer_mock = Mock()
-        layer_mock.name = "layer1"
+        layer_mock1 = Mock()
+        layer_mock1.name = "layer1"
+        layer_mock2 = Mock()
+        layer_mock2.name = "layer2"
+
+        self.assertEqual(LambdaImage._generate_dockerfile("python", [layer_mock1, layer_mock2]), expected_docker_file)
 
-        self.assertEqual(LambdaImage._generate_dockerfile("python", [layer_mock]), expected_docker_file)
+    def test_generate_dockerfile_without_layers(self):
+        expected_docker_file = "FROM python\nADD aws-lambda-rie /var/rapid\nRUN chmod +x /var/rapid/aws-lambda-rie\n"
 
-    @patch("samcli.local.docker.lambda_image.create_tarball")
+        self.assertEqual(LambdaImage._generate_dockerfile("python", []), expected_docker_file)
+
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
     @patch("samcli.local.docker.lambda_image.uuid")
     @patch("samcli.local.docker.lambda_image.Path")
     @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
-    def test_build_image(self, generate_dockerfile_patch, path_patch, uuid_patch, create_tarball_patch):
+    def test_build_image(self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch):
         uuid_patch.uuid4.return_value = "uuid"
         generate_dockerfile_patch.return_value = "Dockerfile content"
 
         docker_full_path_mock = Mock()
-        docker_full_path_mock.exists.return_value = True
         path_patch.return_value = docker_full_path_mock
 
         docker_client_mock = Mock()
@@ -231,41 +408,141 @@ class TestLambdaImage(TestCase):
         layer_downloader_mock = Mock()
         layer_downloader_mock.layer_cache = "cached layers"
 
-        tarball_fileobj = Mock()
-        create_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
+        tarball_stream = Mock()
+        stream_tarball_patch.return_value.__enter__.return_value = tarball_stream
 
         layer_version1 = Mock()
         layer_version1.codeuri = "somevalue"
         layer_version1.name = "name"
 
-        dockerfile_mock = Mock()
-        m = mock_open(dockerfile_mock)
-        with patch("samcli.local.docker.lambda_image.open", m):
-            LambdaImage(layer_downloader_mock, True, False, docker_client=docker_client_mock)._build_image(
-                "base_image", "docker_tag", [layer_version1]
-            )
+        LambdaImage(layer_downloader_mock, True, False, docker_client=docker_client_mock)._build_image(
+            "base_image", "docker_tag", [layer_version1]
+        )
 
-        handle = m()
-        handle.write.assert_called_with("Dockerfile content")
+        docker_full_path_mock.write_text.assert_called_once_with("Dockerfile content")
         path_patch.assert_called_once_with("cached layers", "dockerfile_uuid")
+        stream_tarball_patch.assert_called_once_with(
+            {
+                docker_full_path_mock: "Dockerfile",
+                LambdaImage._RAPID_SOURCE_PATH: "/aws-lambda-rie",
+                "somevalue": "/layers",
+            },
+            tar_filter=ANY,
+        )
         docker_client_mock.api.build.assert_called_once_with(
-            fileobj=tarball_fileobj, rm=True, tag="docker_tag", pull=False, custom_context=True
+            fileobj=tarball_stream,
+            rm=True,
+            tag="docker_tag",
+            pull=False,
+            custom_context=True,
+            cache_from=["base_image", "docker_tag"],
         )
 
         docker_full_path_mock.unlink.assert_called_once()
 
-    @patch("samcli.local.docker.lambda_image.create_tarball")
+    def test_build_image_archives_overlapping_layers_in_layer_order(self):
+        archived_contents = {}
+
+        def build(fileobj, **kwargs):
+            with tarfile.open(fileobj=io.BytesIO(b"".join(fileobj)), mode="r") as archive:
+                # Members are extracted in order, so the last member with a name is the one that ends up in the image
+                for member in archive.getmembers():
+                    if member.isfile():
+                        archived_contents[member.name] = archive.extractfile(member).read()
+            return ["Done"]
+
+        docker_client_mock = Mock()
+        docker_client_mock.api.build.side_effect = build
+
+        with tempfile.TemporaryDirectory() as layer_cache:
+            rapid_path = Path(layer_cache, "aws-lambda-rie")
+            rapid_path.write_text("rie")
+            layer1_dir = Path(layer_cache, "layer1")
+            layer2_dir = Path(layer_cache, "layer2")
+            layer1_dir.mkdir()
+            layer2_dir.mkdir()
+            Path(layer1_dir, "shared.txt").write_text("layer1")
+            Path(layer1_dir, "layer1.txt").write_text("layer1 only")
+            Path(layer2_dir, "shared.txt").write_text("layer2")
+            layer1 = Mock(codeuri=str(layer1_dir))
+            layer1.name = "layer1"
+            layer2 = Mock(codeuri=str(layer2_dir))
+            layer2.name = "layer2"
+            layer_downloader_mock = Mock()
+            layer_downloader_mock.layer_cache = layer_cache
+
+            with patch.object(LambdaImage, "_RAPID_SOURCE_PATH", rapid_path):
+                LambdaImage(layer_downloader_mock, True, False, docker_client=docker_client_mock)._build_image(
+                    "base_image", "docker_tag", [layer1, layer2], stream=Mock()
+                )
+
+        self.assertEqual(archived_contents["layers/shared.txt"], b"layer2")
+        self.assertEqual(archived_contents["layers/layer1.txt"], b"layer1 only")
+
+    @patch("samcli.local.docker.lambda_image.time")
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
+    @patch("samcli.local.docker.lambda_image.uuid")
+    @patch("samcli.local.docker.lambda_image.Path")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
+    def test_build_image_flushes_progress_periodically(
+        self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch, time_patch
+    ):
+        uuid_patch.uuid4.return_value = "uuid"
+        generate_dockerfile_patch.return_value = "Dockerfile content"
+        time_patch.monotonic.return_value = 0
+
+        docker_client_mock = Mock()
+        docker_client_mock.api.build.return_value = ["event"] * 100
+        layer_downloader_mock = Mock()
+        layer_downloader_mock.layer_cache = "cached layers"
+        stream_writer_mock = Mock()
+
+        LambdaImage(layer_downloader_mock, True, False, docker_client=docker_client_mock)._build_image(
+            "base_image", "docker_tag", [], stream=stream_writer_mock
+        )
+
+        self.assertEqual(stream_writer_mock.write.call_args_list, [call(".")] * 100 + [call("\n")])
+        # Once every 32 events and once at the end
+        self.assertEqual(stream_writer_mock.flush.call_count, 4)
+
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
+    @patch("samcli.local.docker.lambda_image.uuid")
+    @patch("samcli.local.docker.lambda_image.Path")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
+    def test_build_image_with_fingerprint(
+        self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch
+    ):
+        uuid_patch.uuid4.return_value = "uuid"
+        generate_dockerfile_patch.return_value = "Dockerfile content\n"
+
+        docker_full_path_mock = Mock()
+        path_patch.return_value = docker_full_path_mock
+
+        docker_client_mock = Mock()
+        docker_client_mock.api.build.return_value = ["Done"]
+        layer_downloader_mock = Mock()
+        layer_downloader_mock.layer_cache = "cached layers"
+
+        LambdaImage(layer_downloader_mock, True, False, docker_client=docker_client_mock)._build_image(
+            "base_image", "docker_tag", [], fingerprint="fingerprint"
+        )
+
+        docker_full_path_mock.write_text.assert_called_once_with(
+            "Dockerfile content\nLABEL samcli.build.fingerprint=fingerprint\n"
+        )
+
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
     @patch("samcli.local.docker.lambda_image.uuid")
     @patch("samcli.local.docker.lambda_image.Path")
     @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
     def test_build_image_fails_with_BuildError(
-        self, generate_dockerfile_patch, path_patch, uuid_patch, create_tarball_patch
+        self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch
     ):
         uuid_patch.uuid4.return_value = "uuid"
         generate_dockerfile_patch.return_value = "Dockerfile content"
 
         docker_full_path_mock = Mock()
-        docker_full_path_mock.exists.return_value = False
+        docker_full_path_mock.unlink.side_effect = FileNotFoundError()
         path_patch.return_value = docker_full_path_mock
 
         docker_client_mock = Mock()
@@ -273,36 +550,37 @@ class TestLambdaImage(TestCase):
         layer_downloader_mock = Mock()
         layer_downloader_mock.layer_cache = "cached layers"
 
-        tarball_fileobj = Mock()
-        create_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
+        tarball_stream = Mock()
+        stream_tarball_patch.return_value.__enter__.return_value = tarball_stream
 
         layer_version1 = Mock()
         layer_version1.codeuri = "somevalue"
         layer_version1.name = "name"
 
-        dockerfile_mock = Mock()
-        m = mock_open(dockerfile_mock)
-        with patch("samcli.local.docker.lambda_image.open", m):
-            with self.assertRaises(ImageBuildException):
-                LambdaImage(layer_downloader_mock, True, False, docker_client=docker_client_mock)._build_image(
-                    "base_image", "docker_tag", [layer_version1]
-                )
+        with self.assertRaises(ImageBuildException):
+            LambdaImage(layer_downloader_mock, True, False, docker_client=docker_client_mock)._build_image(
+                "base_image", "docker_tag", [layer_version1]
+            )
 
-        handle = m()
-        handle.write.assert_called_with("Dockerfile content")
+        docker_full_path_mock.write_text.assert_called_once_with("Dockerfile content")
         path_patch.assert_called_once_with("cached layers", "dockerfile_uuid")
         docker_client_mock.api.build.assert_called_once_with(
-            fileobj=tarball_fileobj, rm=True, tag="docker_tag", pull=False, custom_context=True
+            fileobj=tarball_stream,
+            rm=True,
+            tag="docker_tag",
+            pull=False,
+            custom_context=True,
+            cache_from=["base_image", "docker_tag"],
         )
 
-        docker_full_path_mock.unlink.assert_not_called()
+        docker_full_path_mock.unlink.assert_called_once()
 
-    @patch("samcli.local.docker.lambda_image.create_tarball")
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
     @patch("samcli.local.docker.lambda_image.uuid")
     @patch("samcli.local.docker.lambda_image.Path")
     @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
     def test_build_image_fails_with_ApiError(
-        self, generate_dockerfile_patch, path_patch, uuid_patch, create_tarball_patch
+        self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch
     ):
         uuid_patch.uuid4.return_value = "uuid"
         generate_dockerfile_patch.return_value = "Dockerfile content"
@@ -315,25 +593,55 @@ class TestLambdaImage(TestCase):
         layer_downloader_mock = Mock()
         layer_downloader_mock.layer_cache = "cached layers"
 
-        tarball_fileobj = Mock()
-        create_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
+        tarball_stream = Mock()
+        stream_tarball_patch.return_value.__enter__.return_value = tarball_stream
 
         layer_version1 = Mock()
         layer_version1.codeuri = "somevalue"
         layer_version1.name = "name"
 
-        dockerfile_mock = Mock()
-        m = mock_open(dockerfile_mock)
-        with patch("samcli.local.docker.lambda_image.open", m):
-            with self.assertRaises(ImageBuildException):
-                LambdaImage(layer_downloader_mock, True, False, docker_client=docker_client_mock)._build_image(
-                    "base_image", "docker_tag", [layer_version1]
-                )
+        with self.assertRaises(ImageBuildException):
+            LambdaImage(layer_downloader_mock, True, False, docker_client=docker_client_mock)._build_image(
+                "base_image", "docker_tag", [layer_version1]
+            )
 
-        handle = m()
-        handle.write.assert_called_with("Dockerfile content")
+        docker_full_path_mock.write_text.assert_called_once_with("Dockerfile content")
         path_patch.assert_called_once_with("cached layers", "dockerfile_uuid")
         docker_client_mock.api.build.assert_called_once_with(
-            fileobj=tarball_fileobj, rm=True, tag="docker_tag", pull=False, custom_context=True
+            fileobj=tarball_stream,
+            rm=True,
+            tag="docker_tag",
+            pull=False,
+            custom_context=True,
+            cache_from=["base_image", "docker_tag"],
         )
         docker_full_path_mock.unlink.assert_called_once()
+
+    @parameterized.expand(
+        [
+            (OSError("failed to read layer"),),
+            (tarfile.TarError("invalid member"),),
+            (subprocess.CalledProcessError(2, ["tar"]),),
+        ]
+    )
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
+    @patch("samcli.local.docker.lambda_image.Path")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
+    def test_build_image_fails_when_build_context_cannot_be_created(
+        self, context_error, generate_dockerfile_patch, path_patch, stream_tarball_patch
+    ):
+        generate_dockerfile_patch.return_value = "Dockerfile content"
+
+        docker_client_mock = Mock()
+        # the tarball stream raises while the daemon is reading it
+        docker_client_mock.api.build.side_effect = context_error
+        layer_downloader_mock = Mock()
+        layer_downloader_mock.layer_cache = "cached layers"
+
+        with self.assertRaises(ImageBuildException) as ctx:
+            LambdaImage(layer_downloader_mock, True, False, docker_client=docker_client_mock)._build_image(
+                "base_image", "docker_tag", []
+            )
+
+        self.assertIs(ctx.exception.__cause__, context_error)
+        path_patch.return_value.unlink.assert_called_once()
@@ -1,5 +1,10 @@
+"""PYTEST_DONT_REWRITE"""
+
+from types import MappingProxyType
+from typing import Any, Mapping
 from unittest import TestCase
-from unittest.mock import Mock
+
+from parameterized import parameterized
 
 from samcli.local.events.api_event import (
     ContextIdentity,
@@ -11,78 +16,117 @@ from samcli.local.events.api_event import (
 )
 
 
+class _ToDictStub:
+    """
+    Stands in for the nested context objects, which the events only use through to_dict()
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value):
+        self._value = value
+
+    def to_dict(self):
+        return self._value
+
+
+IDENTITY_STUB = _ToDictStub({"identity": "the identity"})
+HTTP_STUB = _ToDictStub({"method": "POST"})
+REQUEST_CONTEXT_STUB = _ToDictStub({"request_context": "the request context"})
+
+# (constructor argument, to_dict key) in positional order; every argument is given its own name as value
+CONTEXT_IDENTITY_FIELDS = (
+    ("api_key", "apiKey"),
+    ("user_arn", "userArn"),
+    ("cognito_authentication_type", "cognitoAuthenticationType"),
+    ("caller", "caller"),
+    ("user_agent", "userAgent"),
+    ("user", "user"),
+    ("cognito_identity_pool_id", "cognitoIdentityPoolId"),
+    ("cognito_authentication_provider", "cognitoAuthenticationProvider"),
+    ("source_ip", "sourceIp"),
+    ("account_id", "accountId"),
+)
+
+
+# to_dict() output of objects built with default arguments, apart from the RequestContext timestamps
+EXPECTED_DEFAULT_IDENTITY_DICT: Mapping[str, Any] = MappingProxyType(
+    {
+        "apiKey": None,
+        "userArn": None,
+        "cognitoAuthenticationType": None,
+        "caller": None,
+        "userAgent": "Custom User Agent String",
+        "user": None,
+        "cognitoIdentityPoolId": None,
+        "cognitoAuthenticationProvider": None,
+        "sourceIp": "127.0.0.1",
+        "accountId": None,
+    }
+)
+
+EXPECTED_DEFAULT_REQUEST_CONTEXT_DICT: Mapping[str, Any] = MappingProxyType(
+    {
+        "resourceId": "123456",
+        "apiId": "1234567890",
+        "resourcePath": None,
+        "httpMethod": None,
+        "requestId": "",
+        "accountId": "123456789012",
+        "stage": None,
+        "identity": {},
+        "extendedRequestId": None,
+        "path": None,
+        "protocol": None,
+        "domainName": None,
+        "requestTimeEpoch": "request_time_epoch",
+        "requestTime": "request_time",
+    }
+)
+
+EXPECTED_DEFAULT_EVENT_DICT: Mapping[str, Any] = MappingProxyType(
+    {
+        "version": "1.0",
+        "httpMethod": None,
+        "body": None,
+        "resource": None,
+        "requestContext": {},
+        "queryStringParameters": None,
+        "multiValueQueryStringParameters": None,
+        "headers": None,
+        "multiValueHeaders": None,
+        "pathParameters": None,
+        "stageVariables": None,
+        "path": None,
+        "isBase64Encoded": False,
+    }
+)
+
+
 class TestContextIdentity(TestCase):
+    @staticmethod
+    def _make_identity():
+        return ContextIdentity(*(argument for argument, _ in CONTEXT_IDENTITY_FIELDS))
+
     def test_class_initialized(self):
-        identity = ContextIdentity(
-            "api_key",
-            "user_arn",
-            "cognito_authentication_type",
-            "caller",
-            "user_agent",
-            "user",
-            "cognito_identity_pool_id",
-            "cognito_authentication_provider",
-            "source_ip",
-            "account_id",
-        )
+        identity = self._make_identity()
 
-        self.assertEqual(identity.api_key, "api_key")
-        self.assertEqual(identity.user_arn, "user_arn")
-        self.assertEqual(identity.cognito_authentication_type, "cognito_authentication_type")
-        self.assertEqual(identity.caller, "caller")
-        self.assertEqual(identity.user_agent, "user_agent")
-        self.assertEqual(identity.user, "user")
-        self.assertEqual(identity.cognito_identity_pool_id, "cognito_identity_pool_id")
-        self.assertEqual(identity.cognito_authentication_provider, "cognito_authentication_provider")
-        self.assertEqual(identity.source_ip, "source_ip")
-        self.assertEqual(identity.account_id, "account_id")
+        self.assertEqual(
+            tuple(getattr(identity, argument) for argument, _ in CONTEXT_IDENTITY_FIELDS),
+            tuple(argument for argument, _ in CONTEXT_IDENTITY_FIELDS),
+        )
 
     def test_to_dict(self):
-        identity = ContextIdentity(
-            "api_key",
-            "user_arn",
-            "cognito_authentication_type",
-            "caller",
-            "user_agent",
-            "user",
-            "cognito_identity_pool_id",
-            "cognito_authentication_provider",
-            "source_ip",
-            "account_id",
-        )
+        identity = self._make_identity()
 
-        expected = {
-            "apiKey": "api_key",
-            "userArn": "user_arn",
-            "cognitoAuthenticationType": "cognito_authentication_type",
-            "caller": "caller",
-            "userAgent": "user_agent",
-            "user": "user",
-            "cognitoIdentityPoolId": "cognito_identity_pool_id",
-            "cognitoAuthenticationProvider": "cognito_authentication_provider",
-            "sourceIp": "source_ip",
-            "accountId": "account_id",
-        }
+        expected = {key: argument for argument, key in CONTEXT_IDENTITY_FIELDS}
 
         self.assertEqual(identity.to_dict(), expected)
 
     def test_to_dict_with_defaults(self):
         identity = ContextIdentity()
 
-        expected = {
-            "apiKey": None,
-            "userArn": None,
-            "cognitoAuthenticationType": None,
-            "caller": None,
-            "userAgent": "Custom User Agent String",
-            "user": None,
-            "cognitoIdentityPoolId": None,
-            "cognitoAuthenticationProvider": None,
-            "sourceIp": "127.0.0.1",
-            "accountId": None,
-        }
-
-        self.assertEqual(identity.to_dict(), expected)
+        self.assertEqual(identity.to_dict(), dict(EXPECTED_DEFAULT_IDENTITY_DICT))
 
 
 class TextContextHTTP(TestCase):
@@ -122,62 +166,51 @@ class TextContextHTTP(TestCase):
         self.assertEqual(context_http.to_dict(), expected)
 
 
+# RequestContext constructor arguments and the attributes they are stored in, both in positional order
+REQUEST_CONTEXT_ARGS = (
+    "resource_id",
+    "api_id",
+    "request_path",
+    "request_method",
+    "request_id",
+    "account_id",
+    "prod",
+    IDENTITY_STUB,
+    "extended_request_id",
+    "path",
+    "protocol",
+    "domain_name",
+    "request_time_epoch",
+    "request_time",
+)
+REQUEST_CONTEXT_ATTRIBUTES = (
+    "resource_id",
+    "api_id",
+    "resource_path",
+    "http_method",
+    "request_id",
+    "account_id",
+    "stage",
+    "identity",
+    "extended_request_id",
+    "path",
+    "protocol",
+    "domain_name",
+    "request_time_epoch",
+    "request_time",
+)
+
+
 class TestRequestContext(TestCase):
     def test_class_initialized(self):
-        identity_mock = Mock()
-
-        request_context = RequestContext(
-            "resource_id",
-            "api_id",
-            "request_path",
-            "request_method",
-            "request_id",
-            "account_id",
-            "prod",
-            identity_mock,
-            "extended_request_id",
-            "path",
-            "protocol",
-            "domain_name",
-            "request_time_epoch",
-            "request_time",
-        )
+        request_context = RequestContext(*REQUEST_CONTEXT_ARGS)
 
-        self.assertEqual(request_context.resource_id, "resource_id")
-        self.assertEqual(request_context.api_id, "api_id")
-        self.assertEqual(request_context.resource_path, "request_path")
-        self.assertEqual(request_context.http_method, "request_method")
-        self.assertEqual(request_context.request_id, "request_id")
-        self.assertEqual(request_context.account_id, "account_id")
-        self.assertEqual(request_context.stage, "prod")
-        self.assertEqual(request_context.identity, identity_mock)
-        self.assertEqual(request_context.extended_request_id, "extended_request_id")
-        self.assertEqual(request_context.path, "path")
-        self.assertEqual(request_context.protocol, "protocol")
-        self.assertEqual(request_context.domain_name, "domain_name")
-        self.assertEqual(request_context.request_time_epoch, "request_time_epoch")
-        self.assertEqual(request_context.request_time, "request_time")
+        self.assertEqual(
+            tuple(getattr(request_context, attribute) for attribute in REQUEST_CONTEXT_ATTRIBUTES), REQUEST_CONTEXT_ARGS
+        )
 
     def test_to_dict(self):
-        identity_mock = Mock()
-        identity_mock.to_dict.return_value = {"identity": "the identity"}
-
-        request_context = RequestContext(
-            "resource_id",
-            "api_id",
-            "request_path",
-            "request_method",
-            "request_id",
-            "account_id",
-            "prod",
-            identity_mock,
-            "extended_request_id",
-            "path",
-            "protocol",
-            "domain_name",
-            "request_time_epoch",
-            "request_time",
-        )
+        request_context = RequestContext(*REQUEST_CONTEXT_ARGS)
 
         expected = {
             "resourceId": "resource_id",
@@ -201,52 +234,30 @@ class TestRequestContext(TestCase):
     def test_to_dict_with_defaults(self):
         request_context = RequestContext(request_time="request_time", request_time_epoch="request_time_epoch")
 
-        expected = {
-            "resourceId": "123456",
-            "apiId": "1234567890",
-            "resourcePath": None,
-            "httpMethod": None,
-            "requestId": "",
-            "accountId": "123456789012",
-            "stage": None,
-            "identity": {},
-            "extendedRequestId": None,
-            "path": None,
-            "protocol": None,
-            "domainName": None,
-            "requestTimeEpoch": "request_time_epoch",
-            "requestTime": "request_time",
-        }
-
         request_context_dict = request_context.to_dict()
         self.assertEqual(len(request_context_dict["requestId"]), 36)
         request_context_dict["requestId"] = ""
-        self.assertEqual(request_context_dict, expected)
+        self.assertEqual(request_context_dict, dict(EXPECTED_DEFAULT_REQUEST_CONTEXT_DICT))
 
 
 class TestRequestContextV2(TestCase):
     def test_class_initialized(self):
-        http_mock = Mock()
-
-        request_context = RequestContextV2("account_id", "api_id", http_mock, "request_id", "route_key", "stage")
+        request_context = RequestContextV2("account_id", "api_id", HTTP_STUB, "request_id", "route_key", "stage")
 
         self.assertEqual(request_context.account_id, "account_id")
         self.assertEqual(request_context.api_id, "api_id")
-        self.assertEqual(request_context.http, http_mock)
+        self.assertEqual(request_context.http, HTTP_STUB)
         self.assertEqual(request_context.request_id, "request_id")
         self.assertEqual(request_context.route_key, "route_key")
         self.assertEqual(request_context.stage, "stage")
 
     def test_to_dict(self):
-        http_mock = Mock()
-        http_mock.to_dict.return_value = {"method": "POST"}
-
-        request_context = RequestContextV2("account_id", "api_id", http_mock, "request_id", "route_key", "stage")
+        request_context = RequestContextV2("account_id", "api_id", HTTP_STUB, "request_id", "route_key", "stage")
 
         expected = {
             "accountId": "account_id",
             "apiId": "api_id",
-            "http": http_mock.to_dict(),
+            "http": {"method": "POST"},
             "requestId": "request_id",
             "routeKey": "route_key",
             "stage": "stage",
@@ -273,196 +284,102 @@ class TestRequestContextV2(TestCase):
 
 
 class TestApiGatewayLambdaEvent(TestCase):
-    def test_class_initialized(self):
-        event = ApiGatewayLambdaEvent(
-            "request_method",
-            "request_data",
-            "resource",
-            "request_context",
-            {"query": "some query"},
-            {"query": ["some query"]},
-            {"header_key": "value"},
-            {"header_key": ["value"]},
-            {"param": "some param"},
-            {"stage_vars": "some vars"},
-            "request_path",
-            False,
+    @classmethod
+    def setUpClass(cls):
+        # in constructor order, so the values can also be passed positionally
+        cls.valid_event_args = MappingProxyType(
+            {
+                "http_method": "request_method",
+                "body": "request_data",
+                "resource": "resource",
+                "request_context": REQUEST_CONTEXT_STUB,
+                "query_string_params": {"query": "some query"},
+                "multi_value_query_string_params": {"query": ["first query", "some query"]},
+                "headers": {"header_key": "value"},
+                "multi_value_headers": {"header_key": ["value"]},
+                "path_parameters": {"param": "some param"},
+                "stage_variables": {"stage_vars": "some vars"},
+                "path": "request_path",
+                "is_base_64_encoded": False,
+            }
+        )
+        cls.expected_event_dict = MappingProxyType(
+            {
+                "version": "1.0",
+                "httpMethod": "request_method",
+                "body": "request_data",
+                "resource": "resource",
+                "requestContext": {"request_context": "the request context"},
+                "queryStringParameters": {"query": "some query"},
+                "multiValueQueryStringParameters": {"query": ["first query", "some query"]},
+                "headers": {"header_key": "value"},
+                "multiValueHeaders": {"header_key": ["value"]},
+                "pathParameters": {"param": "some param"},
+                "stageVariables": {"stage_vars": "some vars"},
+                "path": "request_path",
+                "isBase64Encoded": False,
+            }
         )
 
-        self.assertEqual(event.http_method, "request_method")
-        self.assertEqual(event.body, "request_data")
-        self.assertEqual(event.resource, "resource")
-        self.assertEqual(event.request_context, "request_context")
-        self.assertEqual(event.query_string_params, {"query": "some query"})
-        self.assertEqual(event.headers, {"header_key": "value"})
-        self.assertEqual(event.path_parameters, {"param": "some param"})
-        self.assertEqual(event.stage_variables, {"stage_vars": "some vars"})
-        self.assertEqual(event.path, "request_path")
-        self.assertEqual(event.is_base_64_encoded, False)
+    def _make_event(self, **overrides):
+        return ApiGatewayLambdaEvent(**{**self.valid_event_args, **overrides})
 
-    def test_to_dict(self):
-        request_context_mock = Mock()
-        request_context_mock.to_dict.return_value = {"request_context": "the request context"}
-
-        event = ApiGatewayLambdaEvent(
-            "request_method",
-            "request_data",
-            "resource",
-            request_context_mock,
-            {"query": "some query"},
-            {"query": ["first query", "some query"]},
-            {"header_key": "value"},
-            {"header_key": ["value"]},
-            {"param": "some param"},
-            {"stagevars": "some vars"},
-            "request_path",
-            False,
+    def test_class_initialized(self):
+        event = ApiGatewayLambdaEvent(*self.valid_event_args.values())
+
+        # every constructor argument is stored in an attribute of the same name
+        self.assertEqual(
+            tuple(getattr(event, attribute) for attribute in self.valid_event_args),
+            tuple(self.valid_event_args.values()),
         )
 
-        expected = {
-            "version": "1.0",
-            "httpMethod": "request_method",
-            "body": "request_data",
-            "resource": "resource",
-            "requestContext": {"request_context": "the request context"},
-            "queryStringParameters": {"query": "some query"},
-            "multiValueQueryStringParameters": {"query": ["first query", "some query"]},
-            "headers": {"header_key": "value"},
-            "multiValueHeaders": {"header_key": ["value"]},
-            "pathParameters": {"param": "some param"},
-            "stageVariables": {"stagevars": "some vars"},
-            "path": "request_path",
-            "isBase64Encoded": False,
-        }
+    def test_to_dict(self):
+        event = self._make_event()
 
-        self.assertEqual(event.to_dict(), expected)
+        self.assertEqual(event.to_dict(), dict(self.expected_event_dict))
 
     def test_to_dict_with_defaults(self):
         event = ApiGatewayLambdaEvent()
 
-        expected = {
-            "version": "1.0",
-            "httpMethod": None,
-            "body": None,
-            "resource": None,
-            "requestContext": {},
-            "queryStringParameters": None,
-            "multiValueQueryStringParameters": None,
-            "headers": None,
-            "multiValueHeaders": None,
-            "pathParameters": None,
-            "stageVariables": None,
-            "path": None,
-            "isBase64Encoded": False,
-        }
-
-        self.assertEqual(event.to_dict(), expected)
+        self.assertEqual(event.to_dict(), dict(EXPECTED_DEFAULT_EVENT_DICT))
 
-    def test_init_with_invalid_query_string_params(self):
-        with self.assertRaises(TypeError):
-            ApiGatewayLambdaEvent(
-                "request_method",
-                "request_data",
-                "resource",
-                "request_context",
-                "not a dict",
-                {"query": ["first query", "some query"]},
-                {"header_key": "value"},
-                {"header_key": ["value"]},
-                {"param": "some param"},
-                {"stage_vars": "some vars"},
-                "request_path",
-                False,
-            )
-
-    def test_init_with_invalid_multi_value_query_string_params(self):
-        with self.assertRaises(TypeError):
-            ApiGatewayLambdaEvent(
-                "request_method",
-                "request_data",
-                "resource",
-                "request_context",
-                {"query": "some query"},
-                "not a dict",
-                {"header_key": "value"},
-                {"header_key": ["value"]},
-                {"param": "some param"},
-                {"stage_vars": "some vars"},
-                "request_path",
-                False,
-            )
-
-    def test_init_with_invalid_headers(self):
-        with self.assertRaises(TypeError):
-            ApiGatewayLambdaEvent(
-                "request_method",
-                "request_data",
-                "resource",
-                "request_context",
-                {"query": "some query"},
-                {"query": ["first query", "some query"]},
-                "not EnvironHeaders",
-                {"header_key": ["value"]},
-                {"param": "some param"},
-                {"stage_vars": "some vars"},
-                "request_path",
-                False,
-            )
-
-    def test_init_with_invalid_multi_value_headers(self):
-        with self.assertRaises(TypeError):
-            ApiGatewayLambdaEvent(
-                "request_method",
-                "request_data",
-                "resource",
-                "request_context",
-                {"query": "some query"},
-                {"query": ["first query", "some query"]},
-                {"header_key": "value"},
-                "not EnvironHeaders",
-                {"param": "some param"},
-                {"stage_vars": "some vars"},
-                "request_path",
-                False,
-            )
-
-    def test_init_with_invalid_path_parameters(self):
-        with self.assertRaises(TypeError):
-            ApiGatewayLambdaEvent(
-                "request_method",
-                "request_data",
-                "resource",
-                "request_context",
-                {"query": "some query"},
-                {"query": ["first query", "some query"]},
-                {"header_key": "value"},
-                {"header_key": ["value"]},
-                "Not a dict",
-                {"stage_vars": "some vars"},
-                "request_path",
-                False,
-            )
-
-    def test_init_with_invalid_stage_variables(self):
-        with self.assertRaises(TypeError):
-
-            ApiGatewayLambdaEvent(
-                "request_method",
-                "request_data",
-                "resource",
-                "request_context",
-                {"query": "some query"},
-                {"query": ["first query", "some query"]},
-                {"header_key": "value"},
-                {"header_key": ["value"]},
-                {"param": "some param"},
-                "Not a dict",
-                "request_path",
-                False,
-            )
+    @parameterized.expand(
+        [
+            ("query_string_params", "not a dict"),
+            ("multi_value_query_string_params", "not a dict"),
+            ("headers", "not EnvironHeaders"),
+            ("multi_value_headers", "not EnvironHeaders"),
+            ("path_parameters", "Not a dict"),
+            ("stage_variables", "Not a dict"),
+        ]
+    )
+    def test_init_with_invalid_argument(self, argument, invalid_value):
+        with self.assertRaisesRegex(TypeError, f"'{argument}' must be of type dict"):
+            self._make_event(**{argument: invalid_value})
 
 
 class TestApiGatewayV2LambdaEvent(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.valid_event_args = MappingProxyType(
+            {
+                "route_key": "route_key",
+                "raw_path": "raw_path",
+                "raw_query_string": "raw_query_string",
+                "cookies": ["cookie1=value1"],
+                "headers": {"header_key": "value"},
+                "query_string_params": {"query_string": "some query"},
+                "request_context": "request_context",
+                "body": "body",
+                "path_parameters": {"param": "some param"},
+                "stage_variables": {"stage_vars": "some vars"},
+                "is_base_64_encoded": False,
+            }
+        )
+
+    def _make_event(self, **overrides):
+        return ApiGatewayV2LambdaEvent(**{**self.valid_event_args, **overrides})
+
     def test_class_initialized(self):
         event = ApiGatewayV2LambdaEvent(
             "route_key",
@@ -492,9 +409,6 @@ class TestApiGatewayV2LambdaEvent(TestCase):
         self.assertEqual(event.stage_variables, {"stage_vars": "some vars"})
 
     def test_to_dict(self):
-        request_context_mock = Mock()
-        request_context_mock.to_dict.return_value = {"request_context": "the request context"}
-
         event = ApiGatewayV2LambdaEvent(
             "route_key",
             "raw_path",
@@ -502,7 +416,7 @@ class TestApiGatewayV2LambdaEvent(TestCase):
             ["cookie1=value1"],
             {"header_key": "value"},
             {"query_string": "some query"},
-            request_context_mock,
+            REQUEST_CONTEXT_STUB,
             "body",
             {"param": "some param"},
             {"stage_vars": "some vars"},
@@ -517,7 +431,7 @@ class TestApiGatewayV2LambdaEvent(TestCase):
             "cookies": ["cookie1=value1"],
             "headers": {"header_key": "value"},
             "queryStringParameters": {"query_string": "some query"},
-            "requestContext": request_context_mock.to_dict(),
+            "requestContext": {"request_context": "the request context"},
             "body": "body",
             "pathParameters": {"param": "some param"},
             "stageVariables": {"stage_vars": "some vars"},
@@ -546,82 +460,15 @@ class TestApiGatewayV2LambdaEvent(TestCase):
 
         self.assertEqual(event.to_dict(), expected)
 
-    def test_init_with_invalid_cookies(self):
-        with self.assertRaises(TypeError):
-            ApiGatewayV2LambdaEvent(
-                "route_key",
-                "raw_path",
-                "raw_query_string",
-                "invalid cookie",
-                {"header_key": "value"},
-                {"query_string": "some query"},
-                "request_context",
-                "body",
-                {"param": "some param"},
-                {"stage_vars": "some vars"},
-                False,
-            )
-
-    def test_init_with_invalid_headers(self):
-        with self.assertRaises(TypeError):
-            ApiGatewayV2LambdaEvent(
-                "route_key",
-                "raw_path",
-                "raw_query_string",
-                ["cookie1"],
-                "invalid headers",
-                {"query_string": "some query"},
-                "request_context",
-                "body",
-                {"param": "some param"},
-                {"stage_vars": "some vars"},
-                False,
-            )
-
-    def test_init_with_invalid_query_string_params(self):
-        with self.assertRaises(TypeError):
-            ApiGatewayV2LambdaEvent(
-                "route_key",
-                "raw_path",
-                "raw_query_string",
-                ["cookie1=value1"],
-                {"header_key": "value"},
-                "invalid_query_string",
-                "request_context",
-                "body",
-                {"param": "some param"},
-                {"stage_vars": "some vars"},
-                False,
-            )
-
-    def test_init_with_invalid_path_parameters(self):
-        with self.assertRaises(TypeError):
-            ApiGatewayV2LambdaEvent(
-                "route_key",
-                "raw_path",
-                "raw_query_string",
-                ["cookie1=value1"],
-                {"header_key": "value"},
-                {"query_string": "some query"},
-                "request_context",
-                "body",
-                "invalid_path_params",
-                {"stage_vars": "some vars"},
-                False,
-            )
-
-    def test_init_with_invalid_stage_variables(self):
-        with self.assertRaises(TypeError):
-            ApiGatewayV2LambdaEvent(
-                "route_key",
-                "raw_path",
-                "raw_query_string",
-                ["cookie1=value1"],
-                {"header_key": "value"},
-                {"query_string": "some query"},
-                "request_context",
-                "body",
-                {"param": "some param"},
-                "invalid_stage_vars",
-                False,
-            )
+    @parameterized.expand(
+        [
+            ("cookies", "invalid cookie"),
+            ("headers", "invalid headers"),
+            ("query_string_params", "invalid_query_string"),
+            ("path_parameters", "invalid_path_params"),
+            ("stage_variables", "invalid_stage_vars"),
+        ]
+    )
+    def test_init_with_invalid_argument(self, argument, invalid_value):
+        with self.assertRaisesRegex(TypeError, f"'{argument}' must be of type"):
+            self._make_event(**{argument: invalid_value})
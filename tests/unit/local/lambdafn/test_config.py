@@ -1,3 +1,5 @@
+"""PYTEST_DONT_REWRITE"""
+
 from unittest import TestCase
 from unittest.mock import Mock
 
@@ -25,6 +27,21 @@ class TestFunctionConfig(TestCase):
         self.timeout = 34
         self.env_vars_mock = Mock()
         self.layers = ["layer1"]
+        self.common_attributes = [
+            ("name", self.name),
+            ("runtime", self.runtime),
+            ("handler", self.handler),
+            ("imageuri", self.imageuri),
+            ("imageconfig", self.imageconfig),
+            ("packagetype", self.packagetype),
+            ("code_abs_path", self.code_path),
+            ("layers", self.layers),
+        ]
+
+    def assert_attributes(self, obj, expected_attributes):
+        for attribute, expected in expected_attributes:
+            with self.subTest(attribute=attribute):
+                self.assertEqual(getattr(obj, attribute), expected)
 
     def test_init_with_env_vars(self):
         config = FunctionConfig(
@@ -41,21 +58,14 @@ class TestFunctionConfig(TestCase):
             env_vars=self.env_vars_mock,
         )
 
-        self.assertEqual(config.name, self.name)
-        self.assertEqual(config.runtime, self.runtime)
-        self.assertEqual(config.handler, self.handler)
-        self.assertEqual(config.imageuri, self.imageuri)
-        self.assertEqual(config.imageconfig, self.imageconfig)
-        self.assertEqual(config.packagetype, self.packagetype)
-        self.assertEqual(config.code_abs_path, self.code_path)
-        self.assertEqual(config.layers, self.layers)
-        self.assertEqual(config.memory, self.memory)
-        self.assertEqual(config.timeout, self.timeout)
-        self.assertEqual(config.env_vars, self.env_vars_mock)
-
-        self.assertEqual(self.env_vars_mock.handler, self.handler)
-        self.assertEqual(self.env_vars_mock.memory, self.memory)
-        self.assertEqual(self.env_vars_mock.timeout, self.timeout)
+        self.assert_attributes(
+            config,
+            self.common_attributes
+            + [("memory", self.memory), ("timeout", self.timeout), ("env_vars", self.env_vars_mock)],
+        )
+        self.assert_attributes(
+            self.env_vars_mock, [("handler", self.handler), ("memory", self.memory), ("timeout", self.timeout)]
+        )
 
     def test_init_without_optional_values(self):
         config = FunctionConfig(
@@ -69,21 +79,14 @@ class TestFunctionConfig(TestCase):
             self.layers,
         )
 
-        self.assertEqual(config.name, self.name)
-        self.assertEqual(config.runtime, self.runtime)
-        self.assertEqual(config.handler, self.handler)
-        self.assertEqual(config.packagetype, self.packagetype)
-        self.assertEqual(config.imageuri, self.imageuri)
-        self.assertEqual(config.imageconfig, self.imageconfig)
-        self.assertEqual(config.code_abs_path, self.code_path)
-        self.assertEqual(config.layers, self.layers)
-        self.assertEqual(config.memory, self.DEFAULT_MEMORY)
-        self.assertEqual(config.timeout, self.DEFAULT_TIMEOUT)
+        self.assert_attributes(
+            config, self.common_attributes + [("memory", self.DEFAULT_MEMORY), ("timeout", self.DEFAULT_TIMEOUT)]
+        )
         self.assertIsNotNone(config.env_vars)
-
-        self.assertEqual(config.env_vars.handler, self.handler)
-        self.assertEqual(config.env_vars.memory, self.DEFAULT_MEMORY)
-        self.assertEqual(config.env_vars.timeout, self.DEFAULT_TIMEOUT)
+        self.assert_attributes(
+            config.env_vars,
+            [("handler", self.handler), ("memory", self.DEFAULT_MEMORY), ("timeout", self.DEFAULT_TIMEOUT)],
+        )
 
     def test_init_with_timeout_of_int_string(self):
         config = FunctionConfig(
@@ -100,35 +103,29 @@ class TestFunctionConfig(TestCase):
             env_vars=self.env_vars_mock,
         )
 
-        self.assertEqual(config.name, self.name)
-        self.assertEqual(config.runtime, self.runtime)
-        self.assertEqual(config.handler, self.handler)
-        self.assertEqual(config.packagetype, self.packagetype)
-        self.assertEqual(config.imageuri, self.imageuri)
-        self.assertEqual(config.imageconfig, self.imageconfig)
-        self.assertEqual(config.code_abs_path, self.code_path)
-        self.assertEqual(config.layers, self.layers)
-        self.assertEqual(config.memory, self.memory)
-        self.assertEqual(config.timeout, 34)
-        self.assertEqual(config.env_vars, self.env_vars_mock)
-
-        self.assertEqual(self.env_vars_mock.handler, self.handler)
-        self.assertEqual(self.env_vars_mock.memory, self.memory)
-        self.assertEqual(self.env_vars_mock.timeout, 34)
+        self.assert_attributes(
+            config,
+            self.common_attributes + [("memory", self.memory), ("timeout", 34), ("env_vars", self.env_vars_mock)],
+        )
+        self.assert_attributes(
+            self.env_vars_mock, [("handler", self.handler), ("memory", self.memory), ("timeout", 34)]
+        )
 
 
 class TestFunctionConfigInvalidTimeouts(TestCase):
-    def setUp(self):
-        self.name = "name"
-        self.runtime = "runtime"
-        self.handler = "handler"
-        self.imageuri = None
-        self.imageconfig = None
-        self.packagetype = ZIP
-        self.code_path = "codepath"
-        self.memory = 1234
-        self.env_vars_mock = Mock()
-        self.layers = ["layer1"]
+    @classmethod
+    def setUpClass(cls):
+        # FunctionConfig rejects every timeout here before touching env_vars, so the cases can share one mock
+        cls.name = "name"
+        cls.runtime = "runtime"
+        cls.handler = "handler"
+        cls.imageuri = None
+        cls.imageconfig = None
+        cls.packagetype = ZIP
+        cls.code_path = "codepath"
+        cls.memory = 1234
+        cls.env_vars_mock = Mock()
+        cls.layers = ["layer1"]
 
     @parameterized.expand(
         [
@@ -7,7 +7,7 @@ from contextlib import contextmanager
 from tempfile import NamedTemporaryFile, mkdtemp
 from unittest import TestCase
 from unittest import skipIf
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 from parameterized import parameterized, param
 
 from samcli.local.lambdafn.zip import unzip, unzip_from_uri, _override_permissions
@@ -195,6 +195,31 @@ class TestUnzipFromUri(TestCase):
         unzip_patch.assert_called_with("layer_zip_path", "output_zip_dir", permission=0o700)
         os_patch.environ.get.assert_called_with("AWS_CA_BUNDLE", True)
 
+    @patch("samcli.local.lambdafn.zip.unzip")
+    @patch("samcli.local.lambdafn.zip.Path")
+    @patch("samcli.local.lambdafn.zip.progressbar")
+    @patch("samcli.local.lambdafn.zip.requests")
+    @patch("samcli.local.lambdafn.zip.open")
+    @patch("samcli.local.lambdafn.zip.os")
+    def test_unzip_from_uri_without_progressbar(
+        self, os_patch, open_patch, requests_patch, progressbar_patch, path_patch, unzip_patch
+    ):
+        get_request_mock = Mock()
+        get_request_mock.headers = {}
+        get_request_mock.iter_content.return_value = [b"data1", b"data2"]
+        requests_patch.get.return_value = get_request_mock
+
+        file_mock = Mock()
+        open_patch.return_value.__enter__.return_value = file_mock
+
+        os_patch.environ.get.return_value = True
+
+        unzip_from_uri("uri", "layer_zip_path", "output_zip_dir", None)
+
+        self.assertEqual(file_mock.write.call_args_list, [call(b"data1"), call(b"data2")])
+        progressbar_patch.assert_not_called()
+        unzip_patch.assert_called_with("layer_zip_path", "output_zip_dir", permission=0o700)
+
     @patch("samcli.local.lambdafn.zip.unzip")
     @patch("samcli.local.lambdafn.zip.Path")
     @patch("samcli.local.lambdafn.zip.progressbar")
@@ -1,4 +1,3 @@
-import os
 from unittest import TestCase
 from unittest.mock import Mock, call, patch
 
@@ -23,7 +22,7 @@ class TestDownloadLayers(TestCase):
 
     @patch("samcli.local.layers.layer_downloader.LayerDownloader.download")
     def test_download_all_without_force(self, download_patch):
-        download_patch.side_effect = ["/home/layer1", "/home/layer2"]
+        download_patch.side_effect = lambda layer, force, show_progress: "/home/" + layer
 
         download_layers = LayerDownloader("/home", ".", Mock())
 
@@ -31,11 +30,13 @@ class TestDownloadLayers(TestCase):
 
         self.assertEqual(acutal_results, ["/home/layer1", "/home/layer2"])
 
-        download_patch.assert_has_calls([call("layer1", False), call("layer2", False)])
+        download_patch.assert_has_calls(
+            [call("layer1", False, show_progress=False), call("layer2", False, show_progress=False)], any_order=True
+        )
 
     @patch("samcli.local.layers.layer_downloader.LayerDownloader.download")
     def test_download_all_with_force(self, download_patch):
-        download_patch.side_effect = ["/home/layer1", "/home/layer2"]
+        download_patch.side_effect = lambda layer, force, show_progress: "/home/" + layer
 
         download_layers = LayerDownloader("/home", ".", Mock())
 
@@ -43,7 +44,32 @@ class TestDownloadLayers(TestCase):
 
         self.assertEqual(acutal_results, ["/home/layer1", "/home/layer2"])
 
-        download_patch.assert_has_calls([call("layer1", True), call("layer2", True)])
+        download_patch.assert_has_calls(
+            [call("layer1", True, show_progress=False), call("layer2", True, show_progress=False)], any_order=True
+        )
+
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader.download")
+    def test_download_all_single_layer(self, download_patch):
+        download_patch.return_value = "/home/layer1"
+
+        download_layers = LayerDownloader("/home", ".", Mock())
+
+        acutal_results = download_layers.download_all(["layer1"])
+
+        self.assertEqual(acutal_results, ["/home/layer1"])
+
+        download_patch.assert_called_once_with("layer1", False)
+
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader.download")
+    def test_download_all_keeps_layer_order(self, download_patch):
+        layers = ["layer{}".format(index) for index in range(20)]
+        download_patch.side_effect = lambda layer, force, show_progress: "/home/" + layer
+
+        download_layers = LayerDownloader("/home", ".", Mock())
+
+        acutal_results = download_layers.download_all(layers)
+
+        self.assertEqual(acutal_results, ["/home/" + layer for layer in layers])
 
     @patch("samcli.local.layers.layer_downloader.LayerDownloader._create_cache")
     @patch("samcli.local.layers.layer_downloader.LayerDownloader._is_layer_cached")
@@ -123,6 +149,35 @@ class TestDownloadLayers(TestCase):
             progressbar_label="Downloading arn:layer:layer1",
         )
 
+    @patch("samcli.local.layers.layer_downloader.LOG")
+    @patch("samcli.local.layers.layer_downloader.unzip_from_uri")
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader._fetch_layer_uri")
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader._create_cache")
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader._is_layer_cached")
+    def test_download_layer_without_progress(
+        self, is_layer_cached_patch, create_cache_patch, fetch_layer_uri_patch, unzip_from_uri_patch, log_mock
+    ):
+        is_layer_cached_patch.return_value = False
+
+        download_layers = LayerDownloader("/home", ".", Mock())
+
+        layer_mock = Mock()
+        layer_mock.is_defined_within_template = False
+        layer_mock.name = "layer1"
+        layer_mock.layer_arn = "arn:layer:layer1"
+
+        fetch_layer_uri_patch.return_value = "layer/uri"
+
+        download_layers.download(layer_mock, show_progress=False)
+
+        unzip_from_uri_patch.assert_called_once_with(
+            "layer/uri",
+            str(Path("/home/layer1.zip").resolve()),
+            unzip_output_dir=str(Path("/home/layer1").resolve()),
+            progressbar_label=None,
+        )
+        log_mock.info.assert_called_once_with("Downloading %s", "arn:layer:layer1")
+
     def test_layer_is_cached(self):
         download_layers = LayerDownloader("/", ".", Mock())
 